@@ -39,6 +39,7 @@ class AsyncComm(CommBase.CommBase):
         self._backlog_thread = None
         self.backlog_send_ready = multitasking.Event()
         self.backlog_recv_ready = multitasking.Event()
+        self._recv_notifiers = []
         self.backlog_open = False
         self._used_direct = False
         super(AsyncComm, self).__init__(name, **kwargs)
@@ -111,6 +112,7 @@ class AsyncComm(CommBase.CommBase):
             self.backlog_thread.set_break_flag()
         self.backlog_send_ready.set()
         self.backlog_recv_ready.set()
+        self._notify_recv()
         if ((wait and (not self.dont_backlog)
              and (self._backlog_thread is not None))):
             self.backlog_thread.wait(key=str(uuid.uuid4()))
@@ -261,6 +263,7 @@ class AsyncComm(CommBase.CommBase):
             self.debug("Added %d bytes to recv backlog.", len(msg))
             self._backlog_recv.append(msg)
             self.backlog_recv_ready.set()
+            self._notify_recv()
 
     def add_backlog_send(self, msg, **kwargs):
         r"""Add a message to the backlog of messages to be sent.
@@ -276,6 +279,45 @@ class AsyncComm(CommBase.CommBase):
             self._backlog_send.append((msg, kwargs))
             self.backlog_send_ready.set()
 
+    def add_recv_notifier(self, event):
+        r"""Register an event that should be set when a message is added to
+        the recv backlog.
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the comm will set the event when a message
+                arrives, False if messages are received directly.
+
+        """
+        if self.dont_backlog or (self.direction == 'send'):
+            return False
+        with self.backlog_thread.lock:
+            if event not in self._recv_notifiers:
+                self._recv_notifiers.append(event)
+            if self.backlog_recv_ready.is_set():
+                event.set()
+        return True
+
+    def remove_recv_notifier(self, event):
+        r"""Stop setting an event when a message is added to the recv
+        backlog.
+
+        Args:
+            event (multitasking.Event): Event that was registered via
+                add_recv_notifier.
+
+        """
+        with self.backlog_thread.lock:
+            if event in self._recv_notifiers:
+                self._recv_notifiers.remove(event)
+
+    def _notify_recv(self):
+        r"""Set the events registered via add_recv_notifier."""
+        for x in list(self._recv_notifiers):
+            x.set()
+
     def pop_backlog_recv(self):
         r"""Pop a message from the front of the recv backlog.
 
@@ -311,6 +353,7 @@ class AsyncComm(CommBase.CommBase):
             self.debug("Backlog closed")
             self._close_backlog()
             return
+        nbacklog = self.n_msg_backlog_send
         if not self.send_backlog():  # pragma: debug
             self.debug("Stopping because send_backlog failed")
             self._close_backlog()
@@ -318,7 +361,12 @@ class AsyncComm(CommBase.CommBase):
         self.periodic_debug('run_backlog_send', period=1000)(
             "Sleeping (is_confirmed_send=%s, n_msg_send=%d)",
             str(self.is_confirmed_send), self.n_msg_backlog_send)
-        self.sleep()
+        if not self.backlog_send_ready.is_set():
+            # Wait for a message to be added to the backlog
+            self.backlog_send_ready.wait(self.sleeptime)
+        elif self.n_msg_backlog_send == nbacklog:
+            # Message could not be sent, try again later
+            self.sleep()
 
     def run_backlog_recv(self):
         r"""Continue buffering received messages."""
@@ -338,7 +386,7 @@ class AsyncComm(CommBase.CommBase):
         self.periodic_debug('run_backlog_recv', period=1000)(
             "Sleeping (is_confirmed_recv=%s)",
             str(self.is_confirmed_recv))
-        self.sleep()
+        self._wait_direct_recv(self.sleeptime)
 
     def send_backlog(self):
         r"""Send a message from the send backlog to the queue."""
@@ -410,6 +458,40 @@ class AsyncComm(CommBase.CommBase):
         """
         return (False, self.empty_bytes_msg)
 
+    def _wait_direct_recv(self, timeout):
+        r"""Block until there is a message to receive directly from the
+        comm. Comms that can be notified when a message arrives should
+        override this so that it returns as soon as a message is
+        available. By default, this will sleep for the timeout.
+
+        Args:
+            timeout (float): Maximum time (in seconds) that should be
+                waited.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        self.sleep(timeout)
+        return bool(self.n_msg_direct_recv)
+
+    def _wait_for_recv(self, timeout=None):
+        r"""Block until there is a message to receive.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        if self.dont_backlog or (self.direction == 'send'):
+            return self._wait_direct_recv(timeout)
+        return bool(self.backlog_recv_ready.wait(timeout))
+
     def _send(self, payload, no_backlog=False, no_confirm=False, **kwargs):
         r"""Send a message to the backlog.
 
@@ -492,7 +574,7 @@ class AsyncComm(CommBase.CommBase):
             T = self.start_timeout(timeout, key_suffix='_recv:direct')
             while ((not T.is_out) and (self.n_msg_direct_recv == 0)
                    and self.is_open_direct):
-                self.sleep()
+                self._wait_direct_recv(self.sleeptime)
             self.stop_timeout(key_suffix='_recv:direct', quiet=True)
             if not self.is_open_direct:  # pragma: debug
                 self.debug("Comm closed")
@@ -9,6 +9,7 @@ class LockedBuffer(multitasking.Queue):
         kwargs.setdefault('task_method', 'process')
         super(LockedBuffer, self).__init__(*args, **kwargs)
         self._closed = self.context.Event()
+        self._ready = self.context.Event()
 
     @property
     def closed(self):
@@ -26,6 +27,9 @@ class LockedBuffer(multitasking.Queue):
         if hasattr(self, '_closed'):
             self._closed.set()
             self._closed.disconnect()
+        if hasattr(self, '_ready'):
+            self._ready.set()
+            self._ready.disconnect()
         super(LockedBuffer, self).disconnect()
         
     def __len__(self):
@@ -33,9 +37,38 @@ class LockedBuffer(multitasking.Queue):
             return 0
         return int(not self.empty())
 
+    def wait(self, timeout=None):
+        r"""Block until there is an element in the queue.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to None and this will block
+                until an element is added.
+
+        Returns:
+            bool: True if there is an element in the queue, False
+                otherwise.
+
+        """
+        if self.closed:  # pragma: debug
+            return False
+        if not self.empty():
+            return True
+        # The event is cleared before the queue is checked again so that
+        # an element added after the check will set it
+        self._ready.clear()
+        if not self.empty():
+            return True
+        try:
+            self._ready.wait(timeout)
+        except multitasking.AliasDisconnectError:  # pragma: debug
+            return False
+        return (len(self) > 0)
+
     def append(self, x):
         r"""Add an element to the queue."""
         self.put_nowait(x)
+        self._ready.set()
 
     def pop(self, index=None, default=None):
         r"""Remove the first element from the queue."""
@@ -176,13 +209,28 @@ class BufferComm(CommBase.CommBase):
         if self.direction == 'send':  # pragma: debug
             self.error("Sending buffer comm cannot receive.")
             return (False, self.empty_bytes_msg)
-        # Sleep until there is a message
+        # Wait until there is a message
         T = self.start_timeout(timeout, key_suffix='_recv')
         while (not T.is_out) and (not len(self.address)):
-            self.sleep()
+            self.address.wait(self.sleeptime)
         self.stop_timeout(key_suffix='_recv')
         return (True, self.address.pop(0, self.empty_bytes_msg))
 
+    def _wait_for_recv(self, timeout=None):
+        r"""Block until there is a message to receive.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        return self.address.wait(timeout)
+
     def purge(self):
         r"""Purge all messages from the comm."""
         super(BufferComm, self).purge()
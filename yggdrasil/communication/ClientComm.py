@@ -1,8 +1,64 @@
 import uuid
+from yggdrasil import tools
 from yggdrasil.components import import_component
 from yggdrasil.communication import (CommBase, new_comm, get_comm)
 
 
+class RPCFuture(object):
+    r"""Handle for the response to a request sent by
+    :meth:`ClientComm.call_async`.
+
+    Args:
+        comm (ClientComm): Client comm that sent the request.
+        request_id (str, optional): ID of the request. Defaults to None
+            if the request could not be sent.
+
+    Attributes:
+        comm (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request.
+
+    """
+
+    def __init__(self, comm, request_id=None):
+        self.comm = comm
+        self.request_id = request_id
+        self._result = None
+        if request_id is None:
+            self._result = (False, comm.empty_obj_recv)
+
+    def done(self):
+        r"""Determine if the response has been received.
+
+        Returns:
+            bool: True if the response has been received, False otherwise.
+
+        """
+        return (self._result is not None)
+
+    def result(self, timeout=False):
+        r"""Receive the response to the request if it has not already
+        been received. If the timeout is reached before the response
+        arrives, the request remains outstanding and this method can be
+        called again.
+
+        Args:
+            timeout (float, optional): Time (in seconds) that should be
+                waited for the response. Defaults to False and the call
+                will block until the response is received.
+
+        Returns:
+            tuple(bool, obj): Success or failure of receiving the response
+                and the response.
+
+        """
+        if self._result is not None:
+            return self._result
+        out = self.comm.recv_response(self.request_id, timeout=timeout)
+        if self.request_id not in self.comm.icomm:
+            self._result = out
+        return out
+
+
 class ClientComm(CommBase.CommBase):
     r"""Class for handling Client side communication.
 
@@ -13,6 +69,14 @@ class ClientComm(CommBase.CommBase):
             request comm. Defaults to None.
         response_kwargs (dict, optional): Keyword arguments for the response
             comm. Defaults to empty dict.
+        persistent_response (bool, optional): If True, responses to all
+            requests are received via a single long-lived response comm and
+            matched to requests using the request_id in the response header.
+            If False, a new single use response comm is created for each
+            request. Defaults to None and is set to True if the
+            YGG_PERSISTENT_RESPONSE environment variable is set (e.g. for
+            models with persistent_response set in the YAML) and False
+            otherwise.
         **kwargs: Additional keywords arguments are passed to the output comm.
 
     Attributes:
@@ -20,13 +84,17 @@ class ClientComm(CommBase.CommBase):
         icomm (dict): Response comms keyed to the ID of the associated request.
         icomm_order (list): Response comm keys in the order or the requests.
         ocomm (Comm): Request comm.
+        persistent_response (bool): If True, responses are received via a
+            single long-lived response comm.
+        response_comm (Comm): Long-lived response comm used when
+            persistent_response is True.
 
     """
 
     _dont_register = True
     
     def __init__(self, name, request_comm=None, response_kwargs=None,
-                 dont_open=False, **kwargs):
+                 dont_open=False, persistent_response=None, **kwargs):
         if response_kwargs is None:
             response_kwargs = dict()
         ocomm_name = name
@@ -38,6 +106,12 @@ class ClientComm(CommBase.CommBase):
         self.ocomm = get_comm(ocomm_name, **ocomm_kwargs)
         self.icomm = dict()
         self.icomm_order = []
+        if persistent_response is None:
+            persistent_response = tools.check_environ_bool(
+                'YGG_PERSISTENT_RESPONSE')
+        self.persistent_response = persistent_response
+        self.response_comm = None
+        self._response_backlog = dict()
         self.response_kwargs.setdefault('comm', self.ocomm.comm_class)
         self.response_kwargs.setdefault('recv_timeout', self.ocomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.ocomm.language)
@@ -66,8 +140,12 @@ class ClientComm(CommBase.CommBase):
         lines.append('%s%-15s:' % (prefix, 'request comm'))
         lines += self.ocomm.get_status_message(nindent=(nindent + 1))[0]
         lines.append('%s%-15s:' % (prefix, 'response comms'))
-        for x in self.icomm.values():
-            lines += x.get_status_message(nindent=(nindent + 1))[0]
+        if self.response_comm is not None:
+            lines += self.response_comm.get_status_message(
+                nindent=(nindent + 1))[0]
+        else:
+            for x in self.icomm.values():
+                lines += x.get_status_message(nindent=(nindent + 1))[0]
         return lines, prefix
     
     @classmethod
@@ -90,6 +168,12 @@ class ClientComm(CommBase.CommBase):
     def maxMsgSize(self):
         r"""int: Maximum size of a single message that should be sent."""
         return self.ocomm.maxMsgSize
+
+    @property
+    def can_send_batch(self):
+        r"""bool: True if the comm can send batches of messages under a
+        single header. RPC messages each require their own header."""
+        return False
         
     @classmethod
     def underlying_comm_class(self):
@@ -149,7 +233,10 @@ class ClientComm(CommBase.CommBase):
         r"""Close the connection."""
         self.ocomm.close(*args, **kwargs)
         for k in self.icomm_order:
-            self.icomm[k].close()
+            if self.icomm[k] is not self.response_comm:
+                self.icomm[k].close()
+        if self.response_comm is not None:
+            self.response_comm.close()
         super(ClientComm, self).close(*args, **kwargs)
 
     @property
@@ -173,25 +260,59 @@ class ClientComm(CommBase.CommBase):
         return self.ocomm.n_msg_send_drain
 
     # RESPONSE COMM
+    def create_persistent_response_comm(self):
+        r"""Create the long-lived response comm that will be used to receive
+        responses to all requests if it dosn't already exist.
+
+        Returns:
+            Comm: Response comm.
+
+        """
+        if self.response_comm is None:
+            comm_kwargs = dict(direction='recv', is_response_client=True,
+                               **self.response_kwargs)
+            comm_kwargs.update(import_component(
+                'comm', comm_kwargs['comm']).shared_address_kwargs('recv'))
+            self.response_comm = new_comm(
+                'client_response_comm.' + str(uuid.uuid4()), **comm_kwargs)
+        return self.response_comm
+
     def create_response_comm(self):
         r"""Create a response comm based on information from the last header."""
-        comm_kwargs = dict(direction='recv', is_response_client=True,
-                           single_use=True, **self.response_kwargs)
         header = dict(request_id=str(uuid.uuid4()))
         while header['request_id'] in self.icomm:  # pragma: debug
             header['request_id'] += str(uuid.uuid4())
-        c = new_comm('client_response_comm.' + header['request_id'], **comm_kwargs)
+        if self.persistent_response:
+            c = self.create_persistent_response_comm()
+            header['persistent_response'] = True
+        else:
+            comm_kwargs = dict(direction='recv', is_response_client=True,
+                               single_use=True, **self.response_kwargs)
+            c = new_comm('client_response_comm.' + header['request_id'],
+                         **comm_kwargs)
         header['response_address'] = c.address
         header['client_model'] = self.model_name
         self.icomm[header['request_id']] = c
         self.icomm_order.append(header['request_id'])
         return header
 
-    def remove_response_comm(self):
-        r"""Remove response comm."""
-        key = self.icomm_order.pop(0)
+    def remove_response_comm(self, request_id=None):
+        r"""Remove response comm.
+
+        Args:
+            request_id (str, optional): ID of the request that the response
+                comm should be removed for. Defaults to None and the
+                response comm for the oldest request is removed.
+
+        """
+        if request_id is None:
+            key = self.icomm_order.pop(0)
+        else:
+            key = request_id
+            self.icomm_order.remove(key)
         icomm = self.icomm.pop(key)
-        icomm.close()
+        if icomm is not self.response_comm:
+            icomm.close()
 
     # SEND METHODS
     def send(self, *args, **kwargs):
@@ -218,6 +339,10 @@ class ClientComm(CommBase.CommBase):
         if (not self.is_eof(msg)) and self.ocomm.evaluate_filter(msg):
             kwargs['header_kwargs'].update(self.create_response_comm())
             created_response = True
+        elif self.is_eof(msg) and (self.response_comm is not None):
+            # Allow the server to close the persistent response comm
+            kwargs['header_kwargs'].update(
+                response_address=self.response_comm.address)
         out = self.ocomm.send(*args, **kwargs)
         if (not out) and created_response:
             self.remove_response_comm()
@@ -241,8 +366,56 @@ class ClientComm(CommBase.CommBase):
         #     return (False, None)
         if len(self.icomm) == 0:  # pragma: debug
             raise RuntimeError("There are not any registered response comms.")
-        out = self.icomm[self.icomm_order[0]].recv(*args, **kwargs)
-        self.remove_response_comm()
+        return self.recv_response(self.icomm_order[0], *args, **kwargs)
+
+    def recv_response(self, request_id, *args, **kwargs):
+        r"""Receive the response to a specific request and remove the
+        associated response comm. If a persistent response comm is used,
+        responses to other outstanding requests that are received first
+        are stored until they are requested. If the receive times out,
+        the request remains outstanding so that the response can be
+        received by a later call.
+
+        Args:
+            request_id (str): ID of the request to receive the response to.
+            *args: Arguments are passed to response comm recv method.
+            **kwargs: Keyword arguments are passed to response comm recv
+                method.
+
+        Returns:
+            obj: Output from response comm recv method.
+
+        """
+        if not self.persistent_response:
+            icomm = self.icomm[request_id]
+            out = icomm.recv(*args, **kwargs)
+            if not (out[0] and icomm.is_empty_recv(out[1])):
+                self.remove_response_comm(request_id)
+            return out
+        return_header = kwargs.pop('return_header', False)
+        kwargs['return_header'] = True
+        out = self._response_backlog.pop(request_id, None)
+        timed_out = False
+        while out is None:
+            flag, msg, header = self.response_comm.recv(*args, **kwargs)
+            if flag and self.response_comm.is_empty_recv(msg):
+                out = (flag, msg, header)
+                timed_out = True
+                break
+            response_id = None
+            if flag and isinstance(header, dict):
+                response_id = header.get('request_id', None)
+            if (response_id is None) or (response_id == request_id):
+                out = (flag, msg, header)
+            elif response_id in self.icomm:
+                self._response_backlog[response_id] = (flag, msg, header)
+            else:  # pragma: debug
+                self.debug("Discarding response to unknown request %s",
+                           response_id)
+        if not return_header:
+            out = out[:2]
+        if not timed_out:
+            self.remove_response_comm(request_id)
         return out
 
     # CALL
@@ -267,6 +440,51 @@ class ClientComm(CommBase.CommBase):
         r"""Alias for call."""
         return self.call(*args, **kwargs)
 
+    def call_async(self, *args, **kwargs):
+        r"""Send a request without waiting for the response. Any number of
+        requests can be outstanding at once and responses are matched to
+        requests by their request ID.
+
+        Args:
+            *args: Arguments are passed to output comm send method.
+            **kwargs: Keyword arguments are passed to output comm send method
+
+        Returns:
+            RPCFuture: Handle that can be used to receive the response.
+
+        """
+        nprev = len(self.icomm_order)
+        flag = self.send(*args, **kwargs)
+        if (not flag) or (len(self.icomm_order) == nprev):  # pragma: debug
+            return RPCFuture(self)
+        return RPCFuture(self, self.icomm_order[-1])
+
+    def call_many(self, msgs, nmax=None, **kwargs):
+        r"""Do RPC calls for a set of requests, keeping up to nmax
+        requests outstanding at once.
+
+        Args:
+            msgs (list): Request messages.
+            nmax (int, optional): Maximum number of requests that should
+                be outstanding at once. Defaults to None and all of the
+                requests are sent before any responses are received.
+            **kwargs: Keyword arguments are passed to output comm send
+                method.
+
+        Returns:
+            list: Output from input comm recv method for each request in
+                the order the requests were provided.
+
+        """
+        if nmax is None:
+            nmax = len(msgs)
+        futures = []
+        for msg in msgs:
+            if len(futures) >= nmax:
+                futures[len(futures) - nmax].result()
+            futures.append(self.call_async(msg, **kwargs))
+        return [x.result() for x in futures]
+
     # OLD STYLE ALIASES
     def rpcSend(self, *args, **kwargs):
         r"""Alias for RPCComm.send"""
@@ -5,7 +5,8 @@ import atexit
 import logging
 import types
 import time
-from yggdrasil import tools, multitasking
+import numpy as np
+from yggdrasil import tools, multitasking, serialize, units
 from yggdrasil.tools import YGG_MSG_EOF
 from yggdrasil.communication import new_comm, get_comm, determine_suffix
 from yggdrasil.components import import_component, create_component
@@ -293,6 +294,12 @@ class CommBase(tools.YggClass):
             or that output should be sent to (for output comms) in
             the event that a yaml does not pair the comm with another
             model comm or a file.
+        binary_body (bool, optional): If True, the data in messages of
+            types that support it (scalars, arrays, and tables of arrays)
+            will be sent as raw bytes rather than being encoded as JSON
+            and received arrays will be views into the received message.
+            This is only used if the partner comm is in Python and the
+            comm does not access a file. Defaults to False.
         **kwargs: Additional keywords arguments are passed to parent class.
 
     Class Attributes:
@@ -300,6 +307,9 @@ class CommBase(tools.YggClass):
         _maxMsgSize (int): Maximum size of a single message that should be sent.
         address_description (str): Description of the information constituting
             an address for this communication mechanism.
+        recv_buffers (bool): True if messages received in multiple parts
+            should be returned as memoryviews of the buffer they were
+            received into rather than as bytes.
 
     Attributes:
         name (str): The environment variable where communication address is
@@ -387,7 +397,9 @@ class CommBase(tools.YggClass):
                           'is_default': {'type': 'boolean', 'default': False},
                           'outside_loop': {'type': 'boolean',
                                            'default': False},
-                          'default_file': {'$ref': '#/definitions/file'}}
+                          'default_file': {'$ref': '#/definitions/file'},
+                          'binary_body': {'type': 'boolean',
+                                          'default': False}}
     _schema_excluded_from_class = ['name']
     _default_serializer = 'default'
     _default_serializer_class = None
@@ -396,6 +408,7 @@ class CommBase(tools.YggClass):
     _maxMsgSize = 0
     address_description = None
     no_serialization = False
+    recv_buffers = False
     _model_schema_prop = ['is_default', 'outside_loop', 'default_file']
     _disconnect_attr = (tools.YggClass._disconnect_attr
                         + ['_closing_event', '_closing_thread',
@@ -498,6 +511,7 @@ class CommBase(tools.YggClass):
         self._eof_recv = multitasking.Event()
         self._eof_sent = multitasking.Event()
         self._field_backlog = dict()
+        self._batch_backlog = []
         if self.single_use:
             self._eof_recv.set()
             self._eof_sent.set()
@@ -807,6 +821,21 @@ class CommBase(tools.YggClass):
                         [k for k in cls.comm_registry().keys()])
         return out
 
+    @classmethod
+    def shared_address_kwargs(cls, direction):
+        r"""Get keyword arguments required for a receiving comm to accept
+        messages from more than one sending comm at the same address and
+        for the sending comms that connect to it.
+
+        Args:
+            direction (str): Direction of the comm ('send' or 'recv').
+
+        Returns:
+            dict: Keyword arguments for the comm.
+
+        """
+        return {}
+
     @classmethod
     def new_comm_kwargs(cls, *args, **kwargs):
         r"""Get keyword arguments for new comm."""
@@ -1143,6 +1172,16 @@ class CommBase(tools.YggClass):
             bool: True if the object is empty, False otherwise.
 
         """
+        # Check simple cases directly to avoid importing the test utilities
+        if (type(emsg) in (bytes, str, list, tuple, dict)) and (not emsg):
+            if isinstance(msg, (bool, int, float, complex, np.number)):
+                return False
+            if isinstance(msg, memoryview) and (type(emsg) is bytes):
+                return (len(msg) == 0)
+            if ((type(msg) is type(emsg))
+                    or ((type(msg) in (list, tuple))
+                        and (type(emsg) in (list, tuple)))):
+                return (len(msg) == 0)
         from yggdrasil.tests import assert_equal
         try:
             assert_equal(msg, emsg, dont_print_diff=True)
@@ -1183,12 +1222,14 @@ class CommBase(tools.YggClass):
         r"""Yield chunks of message of size maxMsgSize
 
         Args:
-            msg (str, bytes): Raw message bytes to be chunked.
+            msg (bytes, memoryview): Raw message bytes to be chunked.
 
         Returns:
-            str: Chunks of message.
+            memoryview: Chunks of message. These are views into the
+                original message rather than copies.
 
         """
+        msg = memoryview(msg)
         prev = 0
         while prev < len(msg):
             next = min(prev + self.maxMsgSize, len(msg))
@@ -1302,6 +1343,30 @@ class CommBase(tools.YggClass):
         self.add_work_comm(c)
         return c
 
+    def create_multipart_comm(self):
+        r"""Get the comm that the remainder of a message larger than
+        maxMsgSize should be sent through. By default, a new work comm is
+        created for each message.
+
+        Returns:
+            :class:.CommBase: Work comm.
+
+        """
+        return self.create_work_comm()
+
+    def multipart_split(self, msg):
+        r"""Determine where a message larger than maxMsgSize should be split
+        into the part sent with the header and the remainder.
+
+        Args:
+            msg (bytes): Serialized message, including the header.
+
+        Returns:
+            int: Number of bytes that should be sent in the first part.
+
+        """
+        return self.maxMsgSize
+
     def add_work_comm(self, comm):
         r"""Add work comm to dict.
 
@@ -1513,7 +1578,7 @@ class CommBase(tools.YggClass):
                 return False, msg_s
         return True, msg_s
 
-    def on_send(self, msg, header_kwargs=None):
+    def on_send(self, msg, header_kwargs=None, batch=False, data_cache=None):
         r"""Process message to be sent including handling serializing
         message and handling EOF.
 
@@ -1521,6 +1586,14 @@ class CommBase(tools.YggClass):
             msg (obj): Message to be sent
             header_kwargs (dict, optional): Keyword arguments that should be
                 added to the header.
+            batch (bool, optional): If True, msg is a list of messages that
+                should be sent together under a single header. Defaults to
+                False.
+            data_cache (dict, optional): Dictionary that the serialized
+                message body should be stored in and/or retrieved from
+                (see SerializeBase.serialize). Defaults to None and a new
+                dictionary is used so that the body is only serialized once
+                if the header must be regenerated for a work comm.
 
         Returns:
             tuple (bool, str, dict): Truth of if message should be sent, raw
@@ -1531,20 +1604,27 @@ class CommBase(tools.YggClass):
         if self.is_closed:
             self.debug('Comm closed')
             return False, self.empty_bytes_msg, work_comm
-        if len(msg) == 1:
+        if (not batch) and (len(msg) == 1):
             msg = msg[0]
-        if self.is_eof(msg):
+        if (not batch) and self.is_eof(msg):
             flag, msg_s = self.on_send_eof(header_kwargs=header_kwargs)
         else:
             flag = True
             # Covert object
-            msg_ = self.apply_transform(msg)
+            if batch:
+                msg_ = [self.apply_transform(x) for x in msg]
+            else:
+                msg_ = self.apply_transform(msg)
             # Serialize
             add_sinfo = (self._send_serializer and (not self.is_file))
             if add_sinfo:
                 self.debug('Sending sinfo: %s', self.serializer.serializer_info)
+            if data_cache is None:
+                data_cache = {}
             msg_s = self.serialize(msg_, header_kwargs=header_kwargs,
-                                   add_serializer_info=add_sinfo)
+                                   add_serializer_info=add_sinfo, batch=batch,
+                                   binary_body=self.use_binary_body,
+                                   data_cache=data_cache)
             if self.no_serialization:
                 msg_len = 1
             else:
@@ -1553,13 +1633,16 @@ class CommBase(tools.YggClass):
             if (msg_len > self.maxMsgSize) and (self.maxMsgSize != 0):
                 if header_kwargs is None:
                     header_kwargs = dict()
-                work_comm = self.create_work_comm()
+                work_comm = self.create_multipart_comm()
                 # if 'address' not in header_kwargs:
                 #     work_comm = self.create_work_comm()
                 # else:
                 #     work_comm = self.get_work_comm(header_kwargs)
                 header_kwargs = self.workcomm2header(work_comm, **header_kwargs)
-                msg_s = self.serialize(msg_, header_kwargs=header_kwargs)
+                msg_s = self.serialize(msg_, header_kwargs=header_kwargs,
+                                       batch=batch,
+                                       binary_body=self.use_binary_body,
+                                       data_cache=data_cache)
         return flag, msg_s, header_kwargs
 
     def send(self, *args, **kwargs):
@@ -1610,7 +1693,8 @@ class CommBase(tools.YggClass):
             # self.close_in_thread(no_wait=True, timeout=False)
         return ret
 
-    def send_multipart(self, msg, header_kwargs=None, **kwargs):
+    def send_multipart(self, msg, header_kwargs=None, batch=False,
+                       data_cache=None, **kwargs):
         r"""Send a multipart message. If the message is smaller than maxMsgSize,
         it is sent using _send, otherwise it is sent to a worker comm using
         _send_multipart_worker.
@@ -1619,6 +1703,14 @@ class CommBase(tools.YggClass):
             msg (obj): Message to be sent.
             header_kwargs (dict, optional): Keyword arguments that should be
                 added to the header.
+            batch (bool, optional): If True, msg is a list of messages that
+                should be sent together under a single header. Defaults to
+                False.
+            data_cache (dict, optional): Dictionary that the serialized
+                message body should be stored in and/or retrieved from so
+                that the same message can be sent via multiple comms
+                without serializing the body more than once (see
+                SerializeBase.serialize). Defaults to None.
             **kwargs: Additional keyword arguments are passed to _send or
                 _send_multipart_worker.
 
@@ -1627,7 +1719,8 @@ class CommBase(tools.YggClass):
         
         """
         # Create serialized message that should be sent
-        flag, msg_s, header = self.on_send(msg, header_kwargs=header_kwargs)
+        flag, msg_s, header = self.on_send(msg, header_kwargs=header_kwargs,
+                                           batch=batch, data_cache=data_cache)
         if not flag:
             return flag
         if self.no_serialization:
@@ -1641,11 +1734,12 @@ class CommBase(tools.YggClass):
             flag = self._safe_send(msg_s, **kwargs)
         else:
             self.special_debug('Message will be split.')
-            flag = self._safe_send(msg_s[:self.maxMsgSize])
+            isplit = self.multipart_split(msg_s)
+            flag = self._safe_send(msg_s[:isplit])
             if flag:
                 # Send remainder of message using work comm
-                flag = self._send_multipart_worker(msg_s[self.maxMsgSize:],
-                                                   header, **kwargs)
+                flag = self._send_multipart_worker(
+                    memoryview(msg_s)[isplit:], header, **kwargs)
             else:  # pragma: debug
                 self.special_debug("Sending message header failed.")
         if flag:
@@ -1654,6 +1748,72 @@ class CommBase(tools.YggClass):
             self.special_debug('Failed to send %d bytes', msg_len)
         return flag
 
+    @property
+    def use_binary_body(self):
+        r"""bool: True if the data in sent messages should be sent as raw
+        bytes for types that support it."""
+        return bool((not self.is_file) and self.binary_body
+                    and (not self.no_serialization)
+                    and (self.partner_language == 'python'))
+
+    @property
+    def can_send_batch(self):
+        r"""bool: True if the comm can send batches of messages under a
+        single header."""
+        return ((not self.is_file) and (not self.no_serialization)
+                and (self.partner_language == 'python'))
+
+    def send_batch(self, msgs, **kwargs):
+        r"""Send a list of messages together under a single header. If the
+        comm cannot send batches (see can_send_batch), the messages are sent
+        individually.
+
+        Args:
+            msgs (list): Messages that should be sent. Each element is
+                treated as a complete message (as if it were passed to send
+                as the only argument).
+            **kwargs: Additional keyword arguments are passed to
+                send_multipart.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if not self.can_send_batch:
+            kwargs.pop('data_cache', None)
+            for x in msgs:
+                if not self.send(x, **kwargs):
+                    return False
+            return True
+        if self.single_use and self._used:  # pragma: debug
+            raise RuntimeError("This comm is single use and it was already used.")
+        batch = []
+        for x in msgs:
+            x = self.language_driver.language2python(x)
+            if self.is_eof(x):
+                # EOF messages are sent on their own after the batch
+                if batch and (not self.send_batch(batch, **kwargs)):
+                    return False
+                kwargs.pop('data_cache', None)
+                return self.send(x, **kwargs)
+            if self.evaluate_filter(x):
+                batch.append(x)
+            else:
+                self.debug("Sent message skipped based on filter: %.100s",
+                           str(x))
+        if not batch:
+            return True
+        try:
+            ret = self.send_multipart(batch, batch=True, **kwargs)
+            if ret:
+                self._used = True
+                if self.serializer.initialized:
+                    self._send_serializer = False
+        except BaseException:
+            self.exception('Failed to send batch of %d messages.', len(batch))
+            return False
+        return ret
+
     def send_nolimit(self, *args, **kwargs):
         r"""Alias for send."""
         return self.send(*args, **kwargs)
@@ -1692,9 +1852,77 @@ class CommBase(tools.YggClass):
         r"""Raw recv. Should be overridden by inheriting class."""
         raise NotImplementedError("_recv method needs implemented.")
 
+    def wait_for_recv(self, timeout=None):
+        r"""Block until there is a message to receive.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        if self._batch_backlog:
+            return True
+        return self._wait_for_recv(timeout)
+
+    def _wait_for_recv(self, timeout=None):
+        r"""Block until there is a message to receive. Comms that can
+        be notified when a message arrives should override this so that
+        it returns as soon as a message is available. By default, this
+        will sleep for the timeout.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        self.sleep(timeout)
+        return bool(self.n_msg_recv)
+
+    def add_recv_notifier(self, event):
+        r"""Register an event that should be set when there is a message
+        to receive so that several comms can be waited on at once (see
+        ForkComm.wait_for_recv).
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the comm will set the event when a message
+                arrives, False if the comm cannot provide notification and
+                must be checked for messages instead.
+
+        """
+        return False
+
+    def remove_recv_notifier(self, event):
+        r"""Stop setting an event when there is a message to receive.
+
+        Args:
+            event (multitasking.Event): Event that was registered via
+                add_recv_notifier.
+
+        """
+        pass
+
+    @property
+    def recv_poll_socket(self):
+        r"""zmq.Socket: Socket that messages are received from directly and
+        that can be polled alongside the sockets of other comms. None if
+        there is not such a socket."""
+        return None
+
     def _recv_multipart(self, data, leng_exp, **kwargs):
         r"""Receive a message larger than YGG_MSG_MAX that is sent in multiple
-        parts.
+        parts. A buffer of the expected size is allocated up front and
+        filled in place as the parts are received.
 
         Args:
             data (str): Initial data received.
@@ -1703,22 +1931,47 @@ class CommBase(tools.YggClass):
 
         Returns:
             tuple (bool, str): The success or failure of receiving a message
-                and the complete message received.
+                and the complete message received. If recv_buffers is True,
+                messages assembled from several parts are returned as a
+                memoryview of the buffer they were received into rather
+                than being copied into bytes.
 
         """
         ret = True
-        while len(data) < leng_exp:
+        nrecv = len(data)
+        if nrecv >= leng_exp:
+            self.debug("Read %d/%d bytes", nrecv, leng_exp)
+            return (ret, data)
+        buf = None
+        while nrecv < leng_exp:
             payload = self._safe_recv(**kwargs)
             if not payload[0]:  # pragma: debug
                 self.debug("Read interupted at %d of %d bytes.",
-                           len(data), leng_exp)
+                           nrecv, leng_exp)
                 ret = False
                 break
-            data = data + payload[1]
-            # if len(payload[1]) == 0:
-            #     self.sleep()
-        payload = (ret, data)
-        self.debug("Read %d/%d bytes", len(data), leng_exp)
+            if len(payload[1]) == 0:
+                continue
+            if (nrecv == 0) and (len(payload[1]) >= leng_exp):
+                # A message received in a single part is returned as is
+                self.debug("Read %d/%d bytes", len(payload[1]), leng_exp)
+                return payload
+            if buf is None:
+                buf = bytearray(leng_exp)
+                buf[:nrecv] = data
+            # Slice assignment extends the buffer if more data is received
+            # than expected
+            buf[nrecv:(nrecv + len(payload[1]))] = payload[1]
+            nrecv += len(payload[1])
+        if buf is None:  # pragma: debug
+            payload = (ret, data)
+        elif nrecv == len(buf):
+            payload = (ret, memoryview(buf))
+        else:  # pragma: debug
+            payload = (ret, memoryview(buf)[:nrecv])
+        if (buf is not None) and (not self.recv_buffers):
+            payload = (ret, payload[1].tobytes())
+        self.debug("Read %d/%d bytes", nrecv, leng_exp)
         return payload
 
     def _recv_multipart_worker(self, info, **kwargs):
@@ -1755,6 +2008,22 @@ class CommBase(tools.YggClass):
         else:
             return True
 
+    def pop_parsed_header(self, s_msg):
+        r"""Get the header that was parsed from a raw received message
+        before it was passed to on_recv so that it is not parsed again.
+        Comms that parse headers as messages are received should override
+        this.
+
+        Args:
+            s_msg (bytes, memoryview): Raw received message.
+
+        Returns:
+            dict: Header information parsed from the message, None if the
+                header was not parsed.
+
+        """
+        return None
+
     def on_recv(self, s_msg, previous_header=None):
         r"""Process raw received message including handling deserializing
         message and handling EOF.
@@ -1771,15 +2040,23 @@ class CommBase(tools.YggClass):
         """
         flag = True
         metadata = previous_header
-        msg_, header = self.deserialize(s_msg, metadata=metadata)
+        kwargs = {}
+        if metadata is None:
+            parsed_header = self.pop_parsed_header(s_msg)
+            if parsed_header is not None:
+                kwargs['header'] = parsed_header
+        msg_, header = self.deserialize(s_msg, metadata=metadata, **kwargs)
         if self.is_eof(msg_):
             flag = self.on_recv_eof()
             msg = msg_
-        elif not header.get('incomplete', False):
-            msg = self.apply_transform(msg_)
-        else:
+        elif header.get('incomplete', False):
             msg = msg_
-        if not header.get('incomplete', False):
+        elif 'batch' in header:
+            msg = [self.apply_transform(x) for x in msg_]
+        else:
+            msg = self.apply_transform(msg_)
+        if not (header.get('incomplete', False)
+                or self.is_empty(s_msg, self.empty_bytes_msg)):
             # if not self._used:
             #     self.serializer = serialize.get_serializer(**header)
             #     msg, _ = self.deserialize(s_msg)
@@ -1805,14 +2082,22 @@ class CommBase(tools.YggClass):
             out_error = (False, None, None)
         else:
             out_error = (False, None)
-        if self.is_closed:
-            self.debug('Comm closed')
-            return out_error
-        try:
-            flag, msg, header = self.recv_multipart(*args, **kwargs)
-        except BaseException:
-            self.exception('Failed to recv.')
-            return out_error
+        if self._batch_backlog:
+            # Messages left over from a batch are returned before new ones
+            flag = True
+            msg, header = self._batch_backlog.pop(0)
+        else:
+            if self.is_closed:
+                self.debug('Comm closed')
+                return out_error
+            try:
+                flag, msg, header = self.recv_multipart(*args, **kwargs)
+            except BaseException:
+                self.exception('Failed to recv.')
+                return out_error
+            if flag and isinstance(header, dict) and ('batch' in header):
+                self._batch_backlog += [(x, header) for x in msg]
+                msg, header = self._batch_backlog.pop(0)
         if flag and (not self.evaluate_filter(msg)):
             assert(not self.single_use)
             self.debug("Recieved message skipped based on filter: %.100s", str(msg))
@@ -1828,6 +2113,59 @@ class CommBase(tools.YggClass):
         out = self.language_driver.python2language(out)
         return out
 
+    def recv_batch(self, *args, **kwargs):
+        r"""Receive the messages from the next batch. Messages that were
+        not sent as part of a batch are returned as a batch containing a
+        single message.
+
+        Args:
+            *args: All arguments are passed to recv.
+            as_array (bool, optional): If True, the messages in the batch
+                are returned as a single array with one element per
+                message. Defaults to False.
+            **kwargs: All keywords arguments are passed to recv.
+
+        Returns:
+            tuple (bool, list): Success or failure of receive and the list
+                of received messages. EOF and empty messages are returned
+                as is.
+
+        """
+        as_array = kwargs.pop('as_array', False)
+        return_header = kwargs.pop('return_header', False)
+        kwargs['return_header'] = True
+        flag, msg, header = self.recv(*args, **kwargs)
+        if flag and not (self.is_eof(msg) or self.is_empty_recv(msg)):
+            msg = [msg]
+            while self._batch_backlog and (self._batch_backlog[0][1] is header):
+                x = self._batch_backlog.pop(0)[0]
+                if self.evaluate_filter(x):
+                    msg.append(x)
+            if as_array:
+                msg = self.batch2array(msg)
+        if return_header:
+            return (flag, msg, header)
+        return (flag, msg)
+
+    def batch2array(self, msgs):
+        r"""Combine the messages from a batch into a single array.
+
+        Args:
+            msgs (list): Messages in the batch.
+
+        Returns:
+            np.ndarray: Array with one element for each message. If the
+                messages are table rows, the array is a structured array.
+
+        """
+        if self.serializer.typedef['type'] == 'array':
+            return serialize.consolidate_array(
+                msgs, dtype=self.serializer.numpy_dtype)
+        out = np.stack([units.get_data(x) for x in msgs])
+        if units.has_units(msgs[0]):
+            out = units.add_units(out, units.get_units(msgs[0]))
+        return out
+
     def recv_multipart(self, *args, **kwargs):
         r"""Receive a multipart message. If a message is received without a
         header, it assumed to be complete. Otherwise, the message is received
@@ -1861,7 +2199,7 @@ class CommBase(tools.YggClass):
                 return flag, s_msg, header
             # Parse complete message
             flag, msg, header2 = self.on_recv(s_msg, previous_header=header)
-        if isinstance(s_msg, bytes):
+        if isinstance(s_msg, (bytes, memoryview)):
             msg_len = len(s_msg)
         else:
             msg_len = 1
@@ -1900,6 +2238,7 @@ class CommBase(tools.YggClass):
         r"""Purge all messages from the comm."""
         self._n_sent = 0
         self._n_recv = 0
+        self._batch_backlog = []
         self._last_send = None
         self._last_recv = None
 
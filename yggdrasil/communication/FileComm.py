@@ -1,5 +1,8 @@
 import os
+import io
 import copy
+import mmap
+import time
 import tempfile
 from yggdrasil import platform, tools
 from yggdrasil.serialize.SerializeBase import SerializeBase
@@ -38,6 +41,34 @@ class FileComm(CommBase.CommBase):
         wait_for_creation (float, optional): Time (in seconds) that should be
             waited before opening for the file to be created if it dosn't exist.
             Defaults to 0 s and file will attempt to be opened immediately.
+        read_chunk_size (int, optional): Maximum number of bytes that should
+            be read from the file for each message when read_meth is 'read'.
+            Each chunk is truncated to end at the last complete object (e.g.
+            row for tables, frame for pickles) and the remainder is read as
+            part of the next message so that large files can be received
+            without loading the entire file into memory. Chunks are extended
+            if a single object is larger than read_chunk_size. Defaults to 0
+            and the entire file is read as a single message.
+        mmap (bool, optional): If True and read_meth is 'read', the file is
+            memory mapped and data is read from the map instead of the file.
+            Messages received by serializers that can deserialize buffers
+            (direct and pickle) are memoryviews of the map. The direct
+            serializer passes the view on as the received message without
+            copying it (e.g. so that raw arrays can be wrapped with
+            np.frombuffer) and the pickle serializer unpickles objects from
+            the view. All other serializers receive a copy of the data as
+            bytes. Ignored if direction is 'send'. Defaults to False.
+        write_buffer_size (int, optional): Number of bytes that may be
+            written to the file before the file is flushed. If 0, the file
+            is flushed after every message. The file is always flushed when
+            an EOF is sent or the file is closed. Ignored if direction is
+            'recv'. Defaults to 0.
+        write_buffer_time (float, optional): Maximum time (in seconds) that
+            written data can remain unflushed when write_buffer_size is set.
+            A flush is scheduled for this time after the first write
+            following a flush so that buffered data is written even if no
+            further messages are sent. Defaults to 0 and buffered data is
+            only flushed once write_buffer_size is reached.
         **kwargs: Additional keywords arguments are passed to parent class.
 
     Attributes:
@@ -51,9 +82,18 @@ class FileComm(CommBase.CommBase):
             reached. If writing, each output will be to a new file in the series.
         platform_newline (str): String indicating a newline on the current
             platform.
+        read_chunk_size (int): Maximum number of bytes that should be read
+            from the file for each message.
+        mmap (bool): If True, the file is memory mapped when read.
+        write_buffer_size (int): Number of bytes that may be written to the
+            file before the file is flushed.
+        write_buffer_time (float): Maximum time (in seconds) that written
+            data can remain unflushed.
 
     Raises:
         ValueError: If the read_meth is not one of the supported values.
+        ValueError: If read_chunk_size is set and the serializer cannot be
+            concatenated as strings.
 
     """
 
@@ -75,12 +115,16 @@ class FileComm(CommBase.CommBase):
         'in_temp': {'type': 'boolean', 'default': False},
         'is_series': {'type': 'boolean', 'default': False},
         'wait_for_creation': {'type': 'float', 'default': 0.0},
+        'read_chunk_size': {'type': 'integer', 'default': 0},
+        'mmap': {'type': 'boolean', 'default': False},
+        'write_buffer_size': {'type': 'integer', 'default': 0},
+        'write_buffer_time': {'type': 'float', 'default': 0.0},
         'serializer': {'oneOf': [{'$ref': '#/definitions/serializer'},
                                  {'type': 'instance',
                                   'class': SerializeBase}],
                        'default': {'seritype': 'direct'}}}
     _schema_excluded_from_inherit = (
-        ['commtype', 'datatype', 'read_meth', 'serializer']
+        ['commtype', 'datatype', 'read_meth', 'serializer', 'binary_body']
         + CommBase.CommBase._model_schema_prop)
     _schema_excluded_from_class_validation = ['serializer']
     _schema_base_class = None
@@ -104,6 +148,10 @@ class FileComm(CommBase.CommBase):
         # Process file class keywords
         if not hasattr(self, '_fd'):
             self._fd = None
+        self._mmap = None
+        self._unflushed_size = 0
+        self._unflushed_time = None
+        self._flush_timer = None
         self.platform_newline = platform._newline
         if self.in_temp:
             self.address = os.path.join(tempfile.gettempdir(), self.address)
@@ -124,6 +172,11 @@ class FileComm(CommBase.CommBase):
         if not self.concats_as_str:
             assert(self.read_meth == 'read')
             assert(not self.serializer.is_framed)
+            if self.read_chunk_size > 0:
+                raise ValueError(("Files cannot be read in chunks when "
+                                  "using a serializer (%s) that does not "
+                                  "concatenate as strings.")
+                                 % self.serializer.__class__.__name__)
 
     @property
     def concats_as_str(self):
@@ -331,6 +384,35 @@ class FileComm(CommBase.CommBase):
     def file_flush(self):
         r"""Flush the file."""
         self.fd.flush()
+        self._unflushed_size = 0
+        self._unflushed_time = None
+        self._cancel_flush_timer()
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _flush_on_timer(self):
+        r"""Flush data that has been buffered for write_buffer_time."""
+        with self._closing_thread.lock:
+            self._flush_timer = None
+            if self.is_open and (self._unflushed_time is not None):
+                self.file_flush()
+
+    @property
+    def write_buffer_full(self):
+        r"""bool: True if the data written since the file was last flushed
+        should be flushed based on write_buffer_size & write_buffer_time."""
+        if self.write_buffer_size <= 0:
+            return True
+        if self._unflushed_size >= self.write_buffer_size:
+            return True
+        if ((self.write_buffer_time > 0) and (self._unflushed_time is not None)
+                and ((time.perf_counter() - self._unflushed_time)
+                     >= self.write_buffer_time)):
+            return True
+        return False
 
     def record_position(self):
         r"""Record the current position in the file/series."""
@@ -450,6 +532,9 @@ class FileComm(CommBase.CommBase):
 
     # Methods related to opening/closing the file
     def _file_open(self, address, mode):
+        if (self.direction == 'send') and (self.write_buffer_size > 0):
+            return open(address, mode, buffering=max(self.write_buffer_size,
+                                                     io.DEFAULT_BUFFER_SIZE))
         return open(address, mode)
     
     def _open(self):
@@ -472,7 +557,37 @@ class FileComm(CommBase.CommBase):
                 if self.is_open:
                     raise
 
+    def _file_mmap(self):
+        r"""Memory map the file for reading, remapping it if the file has
+        grown since it was last mapped.
+
+        Returns:
+            mmap.mmap: Memory mapped file. None if the file is empty.
+
+        """
+        size = os.fstat(self.fd.fileno()).st_size
+        if (self._mmap is None) or (len(self._mmap) < size):
+            self._file_munmap()
+            if size > 0:
+                self._mmap = mmap.mmap(self.fd.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _file_munmap(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # The views hold a reference to the map so it is unmapped
+                # once the last of them is released
+                self.debug("Received messages still hold views of the "
+                           "memory map, it will be closed once they are "
+                           "released.")
+            self._mmap = None
+
     def _file_close(self):
+        self._cancel_flush_timer()
+        self._file_munmap()
         if self.is_open:
             try:
                 self.file_flush()
@@ -604,6 +719,7 @@ class FileComm(CommBase.CommBase):
         r"""Serialize a message using the associated serializer."""
         if (not self.concats_as_str) and (self.file_tell() != 0):
             new_obj = obj
+            self.file_flush()
             with open(self.current_address, 'rb') as fd:
                 old_obj = self.deserialize(fd.read())[0]
             obj = self.serializer.concatenate([old_obj, new_obj])
@@ -634,8 +750,25 @@ class FileComm(CommBase.CommBase):
         # Write message
         try:
             if not self.is_eof(msg):
+                prev_pos = self.file_tell()
                 self._file_send(msg)
-            self.file_flush()
+                if isinstance(msg, (bytes, str)):
+                    self._unflushed_size += max(
+                        self.file_tell() - prev_pos, 0)
+                else:
+                    # The size of other messages (e.g. netCDF variables) is
+                    # not known until they are flushed so they are flushed
+                    # individually
+                    self._unflushed_size = max(self._unflushed_size,
+                                               self.write_buffer_size)
+                if self._unflushed_time is None:
+                    self._unflushed_time = time.perf_counter()
+                    if ((self.write_buffer_time > 0)
+                            and (self.write_buffer_size > 0)):
+                        self._flush_timer = self.sched_task(
+                            self.write_buffer_time, self._flush_on_timer)
+            if self.is_eof(msg) or self.write_buffer_full:
+                self.file_flush()
         except (AttributeError, ValueError):  # pragma: debug
             if self.is_open:
                 raise
@@ -647,13 +780,70 @@ class FileComm(CommBase.CommBase):
 
     def _file_recv(self):
         if self.read_meth == 'read':
-            out = self.fd.read()
+            if self.read_chunk_size > 0:
+                out = self._file_recv_chunk()
+            else:
+                out = self._file_read()
         elif self.read_meth == 'readline':
             out = self.fd.readline()
         else:  # pragma: debug
             raise NotImplementedError("Invalid read_meth: '%s'" % self.read_meth)
         return out
 
+    def _file_read(self, size=-1):
+        r"""Read data from the current position in the file.
+
+        Args:
+            size (int, optional): Maximum number of bytes that should be
+                read. Defaults to -1 and the rest of the file is read.
+
+        Returns:
+            bytes, memoryview: Data read from the file. If mmap is True and
+                the serializer can deserialize buffers, this will be a view
+                into the memory mapped file.
+
+        """
+        if not self.mmap:
+            return self.fd.read(size)
+        fmap = self._file_mmap()
+        if fmap is None:
+            return self.empty_bytes_msg
+        start = self.file_tell()
+        end = len(fmap)
+        if size >= 0:
+            end = min(start + size, end)
+        self.file_seek(end)
+        out = memoryview(fmap)[start:end]
+        if not self.serializer.deserializes_buffers:
+            out = out.tobytes()
+        return out
+
+    def _file_recv_chunk(self):
+        r"""Read the next chunk from the file, ending at the last complete
+        object in the chunk. The file is rewound to the start of any
+        incomplete object so that it is read as part of the next chunk.
+
+        Returns:
+            bytes, memoryview: Chunk read from the file.
+
+        """
+        nread = self.read_chunk_size
+        out = self._file_read(nread)
+        state = {}
+        while len(out) == nread:
+            # Not at the end of the file
+            nused = self.serializer.get_chunk_end(out, state=state)
+            if nused > 0:
+                if nused < len(out):
+                    self.file_seek(self.file_tell() - (len(out) - nused))
+                    out = out[:nused]
+                break
+            # Object larger than the chunk size
+            self.file_seek(self.file_tell() - len(out))
+            nread *= 2
+            out = self._file_read(nread)
+        return out
+
     def _recv(self, timeout=0):
         r"""Reads message from a file.
 
@@ -1,3 +1,6 @@
+import time
+import zlib
+from yggdrasil import multitasking
 from yggdrasil.communication import CommBase, get_comm
 from yggdrasil.components import import_component
 
@@ -27,19 +30,56 @@ class ForkComm(CommBase.CommBase):
             stored.
         comm (list, optional): The list of options for the comms that
             should be bundled. If not provided, the bundle will be empty.
+        dispatch (str, optional): Method that should be used to determine
+            which comm(s) sent messages are passed to. Options include:
+              'broadcast': Messages are sent to every comm.
+              'round_robin': Messages are sent to each comm in turn.
+              'least_outstanding': Messages are sent to the comm with the
+                  fewest messages that have not yet been received (see
+                  n_msg_send_drain) so that slow receivers do not hold up
+                  the others.
+              'hash': Messages are sent to the comm selected by hashing
+                  dispatch_field so that messages with the same value
+                  always go to the same comm.
+            EOF messages are always sent to every comm. Defaults to
+            'broadcast'.
+        dispatch_field (str, int, optional): Key or index of the element
+            in sent messages that should be hashed when dispatch is 'hash'.
+            If a name is provided and messages are lists or tuples, the name
+            is converted to an index using the serializer's field names.
+            Defaults to None and the entire message is hashed.
         **kwargs: Additional keyword arguments are passed to the parent class.
 
     Attributes:
         comm_list (list): Comms included in this fork.
         curr_comm_index (int): Index comm that next receive will be from.
+        dispatch (str): Method used to determine which comm(s) sent
+            messages are passed to.
+        dispatch_field (str, int): Key or index of the element in sent
+            messages that is hashed when dispatch is 'hash'.
 
     """
 
     _dont_register = True
+    _disconnect_attr = (CommBase.CommBase._disconnect_attr
+                        + ['_recv_ready'])
+    _max_recv_wait = 1.0
+    _dispatch_methods = ['broadcast', 'round_robin', 'least_outstanding',
+                         'hash']
     
-    def __init__(self, name, comm=None, **kwargs):
+    def __init__(self, name, comm=None, dispatch='broadcast',
+                 dispatch_field=None, **kwargs):
+        if dispatch not in self._dispatch_methods:
+            raise ValueError(("Unsupported dispatch method '%s'. Supported "
+                              "methods include: %s")
+                             % (dispatch, self._dispatch_methods))
+        self.dispatch = dispatch
+        self.dispatch_field = dispatch_field
+        self._dispatch_index = 0
+        self._dispatch_field_index = None
         self.comm_list = []
         self.curr_comm_index = 0
+        self._recv_ready = multitasking.Event()
         self.eof_recv = []
         address = kwargs.pop('address', None)
         if (comm in [None, 'ForkComm']):
@@ -160,6 +200,7 @@ class ForkComm(CommBase.CommBase):
     def close(self, *args, **kwargs):
         r"""Close the connection."""
         for x in self.comm_list:
+            x.remove_recv_notifier(self._recv_ready)
             x.close(*args, **kwargs)
 
     def close_in_thread(self, *args, **kwargs):  # pragma: debug
@@ -226,8 +267,107 @@ class ForkComm(CommBase.CommBase):
         r"""int: The number of outgoing messages in the connection to drain."""
         return sum([x.n_msg_send_drain for x in self.comm_list])
 
+    @property
+    def shared_serialization(self):
+        r"""bool: True if all of the comms in the bundle would serialize a
+        message identically such that the body of a sent message only needs
+        to be serialized once. This requires that the comms have serializers
+        of the same class with the same type definition and serialization
+        functions and that none of the comms transform, filter, or write
+        messages to a file."""
+        if len(self.comm_list) < 2:
+            return False
+        x0 = self.comm_list[0]
+        for x in self.comm_list:
+            if x.is_file or x.no_serialization or x.transform or x.filter:
+                return False
+            if x is x0:
+                continue
+            if ((type(x.serializer) is not type(x0.serializer))
+                    or (x.language_driver is not x0.language_driver)
+                    or (x.use_binary_body != x0.use_binary_body)
+                    or (x.serializer.typedef != x0.serializer.typedef)):
+                return False
+            if (((x.serializer.func_serialize is not None)
+                 and (x.serializer.serializer_info
+                      != x0.serializer.serializer_info))):
+                return False
+        return True
+
+    def get_dispatch_key(self, msg):
+        r"""Get the element of a message that is hashed to select the comm
+        that it is sent to when dispatch is 'hash'.
+
+        Args:
+            msg (object): Message that will be sent.
+
+        Returns:
+            object: Element of msg selected by dispatch_field or msg if
+                dispatch_field is None.
+
+        Raises:
+            ValueError: If dispatch_field is a name, msg is a list or tuple,
+                and the field names for the comm do not include it.
+
+        """
+        field = self.dispatch_field
+        if field is None:
+            return msg
+        if isinstance(field, str) and isinstance(msg, (list, tuple)):
+            if self._dispatch_field_index is None:
+                field_names = None
+                for x in [self] + self.comm_list:
+                    field_names = x.serializer.get_field_names()
+                    if field_names:
+                        break
+                if field not in (field_names or []):
+                    raise ValueError(
+                        ("dispatch_field '%s' is a field name, but the "
+                         "field names for the comm (%s) do not include it "
+                         "so it cannot be used to select an element of "
+                         "list/tuple messages.") % (field, field_names))
+                self._dispatch_field_index = field_names.index(field)
+            field = self._dispatch_field_index
+        return msg[field]
+
+    def select_comm(self, msg, pending=None):
+        r"""Select the comm that a message should be sent to based on the
+        dispatch method.
+
+        Args:
+            msg (object): Message that will be sent.
+            pending (list, optional): Number of messages that will be sent
+                to each comm in addition to those already waiting to be
+                received. Defaults to None and is ignored.
+
+        Returns:
+            int: Index of the comm in comm_list that the message should be
+                sent to.
+
+        """
+        ncomm = len(self)
+        if self.dispatch == 'hash':
+            key = self.get_dispatch_key(msg)
+            return zlib.crc32(str(key).encode('utf-8')) % ncomm
+        order = [(self._dispatch_index + i) % ncomm for i in range(ncomm)]
+        order = ([i for i in order if self.comm_list[i].is_open]
+                 or order)
+        if self.dispatch == 'least_outstanding':
+            if pending is None:
+                pending = [0 for i in range(ncomm)]
+            out = min(order, key=lambda i: (
+                self.comm_list[i].n_msg_send_drain + pending[i]))
+        else:
+            out = order[0]
+        self._dispatch_index = out + 1
+        return out
+
     def send(self, *args, **kwargs):
-        r"""Send a message.
+        r"""Send a message. If the comms in the bundle serialize messages
+        identically (see shared_serialization), the message body is only
+        serialized once and the result is reused by each comm. If dispatch
+        is not 'broadcast', the message is only sent to the comm selected
+        by select_comm.
 
         Args:
             *args: All arguments are assumed to be part of the message.
@@ -237,12 +377,61 @@ class ForkComm(CommBase.CommBase):
             bool: Success or failure of send.
 
         """
+        if self.dispatch != 'broadcast':
+            msg = args[0] if (len(args) == 1) else args
+            if not self.is_eof(msg):
+                x = self.comm_list[self.select_comm(msg)]
+                return x.send(*args, **kwargs)
+        if self.shared_serialization:
+            kwargs['data_cache'] = {}
         for x in self.comm_list:
             out = x.send(*args, **kwargs)
             if not out:
                 return out
         return out
 
+    def send_batch(self, msgs, **kwargs):
+        r"""Send a list of messages together under a single header. If the
+        comms in the bundle serialize messages identically (see
+        shared_serialization), the batch is only serialized once. If
+        dispatch is not 'broadcast', each comm is sent a batch containing
+        the messages selected for it by select_comm.
+
+        Args:
+            msgs (list): Messages that should be sent.
+            **kwargs: All keywords arguments are passed to the send_batch
+                method of each comm.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if self.dispatch != 'broadcast':
+            batches = [[] for x in self.comm_list]
+            pending = [0 for x in self.comm_list]
+            for i, msg in enumerate(msgs):
+                if self.is_eof(msg):
+                    break
+                idx = self.select_comm(msg, pending=pending)
+                batches[idx].append(msg)
+                pending[idx] += 1
+            else:
+                i = len(msgs)
+            for x, batch in zip(self.comm_list, batches):
+                if batch and (not x.send_batch(batch, **kwargs)):
+                    return False
+            if i < len(msgs):
+                # EOF messages are sent to every comm
+                return self.send(msgs[i], **kwargs)
+            return True
+        if self.shared_serialization:
+            kwargs['data_cache'] = {}
+        for x in self.comm_list:
+            out = x.send_batch(msgs, **kwargs)
+            if not out:
+                return out
+        return out
+
     def recv(self, *args, **kwargs):
         r"""Receive a message.
 
@@ -256,7 +445,12 @@ class ForkComm(CommBase.CommBase):
 
         """
         return_header = kwargs.pop('return_header', False)
-        timeout = kwargs.pop('timeout', None)
+        if args:
+            # Timeout is the first argument to _recv
+            timeout = args[0]
+            args = args[1:]
+        else:
+            timeout = kwargs.pop('timeout', None)
         if timeout is None:
             timeout = self.recv_timeout
         kwargs['timeout'] = 0
@@ -264,6 +458,8 @@ class ForkComm(CommBase.CommBase):
         first_comm = True
         T = self.start_timeout(timeout, key_suffix='recv:forkd')
         out = None
+        if self._batch_backlog:
+            out = (True, ) + self._batch_backlog.pop(0)
         while ((not T.is_out) or first_comm) and self.is_open and (out is None):
             for i in range(len(self)):
                 if out is not None:
@@ -277,10 +473,20 @@ class ForkComm(CommBase.CommBase):
                             out = (flag, msg, header)
                     elif (not self.is_empty_recv(msg)):
                         out = (flag, msg, header)
+                        # Take over remainder of a batch
+                        self._batch_backlog += [
+                            y for y in x._batch_backlog
+                            if x.evaluate_filter(y[0])]
+                        x._batch_backlog = []
                 self.curr_comm_index += 1
             first_comm = False
             if out is None:
-                self.sleep()
+                if T.max_time is False:
+                    twait = self._max_recv_wait
+                else:
+                    twait = min(max(T.max_time - T.elapsed, 0.0),
+                                self._max_recv_wait)
+                self.wait_for_recv(twait)
         self.stop_timeout(key_suffix='recv:forkd')
         if out is None:
             if self.is_closed:
@@ -292,6 +498,67 @@ class ForkComm(CommBase.CommBase):
             out = (out[0], out[1])
         return out
 
+    def _wait_for_recv(self, timeout=None):
+        r"""Block until one of the comms in the bundle has a message to
+        receive. Comms that can notify of new messages (see
+        CommBase.add_recv_notifier) set a shared event, sockets that
+        messages are received from directly (see CommBase.recv_poll_socket)
+        are polled together, and any remaining comms are checked every
+        sleeptime.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        notified = []
+        sockets = []
+        polled = []
+        for x in self.comm_list:
+            if not x.is_open:
+                continue
+            if x._batch_backlog:
+                return True
+            if x.add_recv_notifier(self._recv_ready):
+                notified.append(x)
+            elif x.recv_poll_socket is not None:
+                sockets.append(x.recv_poll_socket)
+            else:
+                polled.append(x)
+        poller = None
+        if sockets:
+            import zmq
+            poller = zmq.Poller()
+            for x in sockets:
+                poller.register(x, zmq.POLLIN)
+        tstop = time.perf_counter() + timeout
+        while True:
+            self._recv_ready.clear()
+            for x in notified + polled:
+                if x.wait_for_recv(0):
+                    return True
+            remaining = tstop - time.perf_counter()
+            if (notified or polled) and (poller is not None or polled):
+                # Events cannot be polled with sockets and comms without
+                # notification must be checked so wake periodically
+                remaining = min(remaining, self.sleeptime)
+            if poller is not None:
+                try:
+                    if poller.poll(max(0, int(1000.0 * remaining))):
+                        return True
+                except zmq.ZMQError:  # pragma: debug
+                    # Socket closed by another thread
+                    return True
+            elif self._recv_ready.wait(max(remaining, 0.0)):
+                return True
+            if time.perf_counter() >= tstop:
+                return False
+
     def purge(self):
         r"""Purge all messages from the comm."""
         super(ForkComm, self).purge()
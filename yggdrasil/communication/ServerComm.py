@@ -22,6 +22,9 @@ class ServerComm(CommBase.CommBase):
         response_kwargs (dict): Keyword arguments for the response comm.
         icomm (Comm): Request comm.
         ocomm (OrderedDict): Response comms for each request.
+        persistent_ocomm (dict): Response comms for clients using persistent
+            response comms, keyed by the client's response address. Entries
+            are removed when the client sends an EOF or signs off.
 
     """
 
@@ -39,6 +42,8 @@ class ServerComm(CommBase.CommBase):
         self.response_kwargs = response_kwargs
         self.icomm = get_comm(icomm_name, **icomm_kwargs)
         self.ocomm = OrderedDict()
+        self.persistent_ocomm = dict()
+        self._request_ids = dict()
         self.response_kwargs.setdefault('comm', self.icomm.comm_class)
         self.response_kwargs.setdefault('recv_timeout', self.icomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.icomm.language)
@@ -95,6 +100,12 @@ class ServerComm(CommBase.CommBase):
     def maxMsgSize(self):
         r"""int: Maximum size of a single message that should be sent."""
         return self.icomm.maxMsgSize
+
+    @property
+    def can_send_batch(self):
+        r"""bool: True if the comm can send batches of messages under a
+        single header. RPC messages each require their own header."""
+        return False
         
     @classmethod
     def underlying_comm_class(self):
@@ -157,6 +168,8 @@ class ServerComm(CommBase.CommBase):
             ocomm.close()
         for ocomm in self._used_response_comms.values():
             ocomm.close()
+        for ocomm in self.persistent_ocomm.values():
+            ocomm.close()
         super(ServerComm, self).close(*args, **kwargs)
 
     @property
@@ -193,21 +206,38 @@ class ServerComm(CommBase.CommBase):
 
     # RESPONSE COMM
     def create_response_comm(self, header):
-        r"""Create a response comm based on information from the last header."""
+        r"""Create a response comm based on information from the last header.
+        If the client uses a persistent response comm, the response comm
+        is created once for each client response address and reused for
+        subsequent requests."""
         if not isinstance(header, dict):  # pragma: debug
             raise RuntimeError("No header received with last message.")
         elif 'response_address' not in header:  # pragma: debug
             raise RuntimeError("Last header does not contain response address.")
-        comm_kwargs = dict(address=header['response_address'],
-                           direction='send', is_response_server=True,
-                           single_use=True, **self.response_kwargs)
         request_id = header['request_id']
         while request_id in self.ocomm:  # pragma: debug
             request_id += str(uuid.uuid4())
         header['response_id'] = request_id
-        self.ocomm[request_id] = get_comm(
-            self.name + '.server_response_comm.' + request_id,
-            **comm_kwargs)
+        self._request_ids[request_id] = header['request_id']
+        address = header['response_address']
+        if header.get('persistent_response', False):
+            if address not in self.persistent_ocomm:
+                comm_kwargs = dict(address=address, direction='send',
+                                   is_response_server=True,
+                                   **self.response_kwargs)
+                comm_kwargs.update(import_component(
+                    'comm', comm_kwargs['comm']).shared_address_kwargs('send'))
+                self.persistent_ocomm[address] = get_comm(
+                    self.name + '.server_response_comm.' + request_id,
+                    **comm_kwargs)
+            self.ocomm[request_id] = self.persistent_ocomm[address]
+        else:
+            comm_kwargs = dict(address=address, direction='send',
+                               is_response_server=True, single_use=True,
+                               **self.response_kwargs)
+            self.ocomm[request_id] = get_comm(
+                self.name + '.server_response_comm.' + request_id,
+                **comm_kwargs)
         client_model = header.get('client_model', '')
         self.ocomm[request_id].client_model = client_model
         if client_model and (client_model not in self.clients):
@@ -221,11 +251,48 @@ class ServerComm(CommBase.CommBase):
                 comm that should be removed.
 
         """
+        self._request_ids.pop(request_id, None)
         ocomm = self.ocomm.pop(request_id, None)
         if ocomm is not None:
+            if any(ocomm is x for x in self.persistent_ocomm.values()):
+                return
+            if any(ocomm is x for x in self.ocomm.values()):
+                # Persistent comm for a client that has signed off that
+                # still has outstanding requests
+                return
             ocomm.close_in_thread(no_wait=True)
             self._used_response_comms[ocomm.name] = ocomm
 
+    def remove_client_response_comms(self, header):
+        r"""Remove the persistent response comms for a client that has
+        signed off. Comms are closed once responses have been sent to any
+        requests from the client that are still outstanding.
+
+        Args:
+            header (dict): Header from the client's EOF message. If it
+                contains a response address, only the response comm for
+                that address is removed. Otherwise, all response comms
+                for the client model in the header are removed.
+
+        """
+        if not isinstance(header, dict):  # pragma: debug
+            return
+        if 'response_address' in header:
+            addresses = [header['response_address']]
+        elif header.get('client_model', ''):
+            addresses = [k for k, v in self.persistent_ocomm.items()
+                         if v.client_model == header['client_model']]
+        else:  # pragma: debug
+            addresses = []
+        for address in addresses:
+            ocomm = self.persistent_ocomm.pop(address, None)
+            if ocomm is None:
+                continue
+            self.debug("Removing persistent response comm for %s", address)
+            if not any(ocomm is x for x in self.ocomm.values()):
+                ocomm.close_in_thread(no_wait=True)
+                self._used_response_comms[ocomm.name] = ocomm
+
     # SEND METHODS
     def send_to(self, request_id, *args, **kwargs):
         r"""Send a message to a specific response comm.
@@ -242,6 +309,9 @@ class ServerComm(CommBase.CommBase):
         # if self.is_closed:
         #     self.debug("send(): Connection closed.")
         #     return False
+        kwargs.setdefault('header_kwargs', {})
+        kwargs['header_kwargs'].setdefault(
+            'request_id', self._request_ids.get(request_id, request_id))
         out = self.ocomm[request_id].send(*args, **kwargs)
         self.remove_response_comm(request_id)
         return out
@@ -303,12 +373,15 @@ class ServerComm(CommBase.CommBase):
         return_header = kwargs.pop('return_header', False)
         kwargs['return_header'] = True
         flag, msg, header = self.icomm.recv(*args, **kwargs)
-        if flag:
+        if self.icomm.is_eof(msg):
+            self.remove_client_response_comms(header)
+        elif flag:
             if isinstance(msg, bytes) and (msg == YGG_CLIENT_EOF):
                 self.closed_clients.append(header['client_model'])
+                self.remove_client_response_comms(header)
                 kwargs['return_header'] = return_header
                 return self.recv(*args, **kwargs)
-            elif not (self.icomm.is_eof(msg) or self.icomm.is_empty_recv(msg)):
+            elif not self.icomm.is_empty_recv(msg):
                 self.create_response_comm(header)
         if return_header:
             out = (flag, msg, header)
@@ -316,6 +389,48 @@ class ServerComm(CommBase.CommBase):
             out = (flag, msg)
         return out
 
+    def _wait_for_recv(self, timeout=None):
+        r"""Block until there is a request to receive.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that
+                should be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a request to receive, False otherwise.
+
+        """
+        return self.icomm.wait_for_recv(timeout)
+
+    def add_recv_notifier(self, event):
+        r"""Register an event that should be set when there is a request
+        to receive.
+
+        Args:
+            event (multitasking.Event): Event that should be set.
+
+        Returns:
+            bool: True if the request comm will set the event when a
+                request arrives, False otherwise.
+
+        """
+        return self.icomm.add_recv_notifier(event)
+
+    def remove_recv_notifier(self, event):
+        r"""Stop setting an event when there is a request to receive.
+
+        Args:
+            event (multitasking.Event): Event that was registered via
+                add_recv_notifier.
+
+        """
+        self.icomm.remove_recv_notifier(event)
+
+    @property
+    def recv_poll_socket(self):
+        r"""zmq.Socket: Socket that requests are received from directly."""
+        return self.icomm.recv_poll_socket
+
     # OLD STYLE ALIASES
     def rpcSend(self, *args, **kwargs):
         r"""Alias for RPCComm.send"""
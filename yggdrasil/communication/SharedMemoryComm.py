@@ -0,0 +1,659 @@
+import struct
+import logging
+import weakref
+import collections
+import numpy as np
+from yggdrasil import platform, multitasking
+from yggdrasil.communication import CommBase, AsyncComm
+from yggdrasil.metaschema.datatypes import YGG_MSG_HEAD
+logger = logging.getLogger(__name__)
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    _shm_installed = True
+except ImportError:  # pragma: debug
+    logger.debug("Could not import multiprocessing.shared_memory. "
+                 + "Shared memory support will be disabled.")
+    shared_memory = None
+    resource_tracker = None
+    _shm_installed = False
+
+
+# Layout of the control block at the start of each shared memory segment.
+# Each field is an unsigned 64 bit integer. The head & nsent fields are
+# only written by the sender and the read, tail & nrecv fields are only
+# written by the receiver so that no locking is required for a single
+# sender/receiver pair. The read field is the position of the next record
+# to receive and the tail field is the position up to which space has
+# been released for reuse by the sender.
+_ctrl_fields = ['capacity', 'head', 'tail', 'nsent', 'nrecv', 'closed',
+                'read']
+_ctrl_offset = {k: 8 * i for i, k in enumerate(_ctrl_fields)}
+_ctrl_size = 64
+_len_fmt = '<Q'
+_len_size = struct.calcsize(_len_fmt)
+_wrap_marker = 2**64 - 1
+# Segments that were closed while received messages still referenced
+# their memory. They are closed once the messages are released.
+_retired_segments = []
+
+
+def untrack_segment(shm):
+    r"""Stop the multiprocessing resource tracker from removing a segment
+    when the process exits. Segments are instead removed when they are
+    unregistered from the comm registry (as for IPC queues) so that
+    segments created by one process and attached to by another are not
+    removed when the second process exits.
+
+    Args:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment.
+
+    """
+    if not platform._is_win:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def get_segment(name=None, size=None):
+    r"""Create or attach to a shared memory segment. New segments are
+    registered so that they are removed during cleanup.
+
+    Args:
+        name (str, optional): If provided, name of an existing segment
+            that should be attached to. Defaults to None and a new segment
+            is created.
+        size (int, optional): Size (in bytes) of the ring buffer that
+            should be allocated for a new segment. Defaults to
+            SharedMemoryComm._ring_size.
+
+    Returns:
+        :class:`multiprocessing.shared_memory.SharedMemory`: Segment.
+
+    """
+    if not _shm_installed:  # pragma: debug
+        logger.warning("Shared memory not installed. "
+                       "Segment cannot be returned.")
+        return None
+    if name is None:
+        if size is None:
+            size = SharedMemoryComm._ring_size
+        shm = shared_memory.SharedMemory(create=True,
+                                         size=(_ctrl_size + size))
+        untrack_segment(shm)
+        shm.buf[:_ctrl_size] = bytes(_ctrl_size)
+        set_control(shm, 'capacity', size)
+        CommBase.register_comm('SharedMemoryComm', shm.name, shm)
+        return shm
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # pragma: no cover
+        # Python < 3.13 tracks attached segments
+        shm = shared_memory.SharedMemory(name=name)
+        untrack_segment(shm)
+    return shm
+
+
+def remove_segment(shm):
+    r"""Close and remove a shared memory segment.
+
+    Args:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment.
+
+    Returns:
+        bool: True if the segment was removed.
+
+    """
+    try:
+        set_control(shm, 'closed', 1)
+    except (TypeError, ValueError):  # pragma: debug
+        pass
+    shm.close()
+    if not platform._is_win:
+        # Unlinking untracks the segment so it must be tracked first
+        resource_tracker.register(shm._name, 'shared_memory')
+    try:
+        shm.unlink()
+    except FileNotFoundError:  # pragma: debug
+        return False
+    return True
+
+
+def get_control(shm, key):
+    r"""Get a field from the control block of a shared memory segment.
+
+    Args:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment.
+        key (str): Name of the field.
+
+    Returns:
+        int: Field value.
+
+    """
+    return struct.unpack_from(_len_fmt, shm.buf, _ctrl_offset[key])[0]
+
+
+def set_control(shm, key, value):
+    r"""Set a field in the control block of a shared memory segment.
+
+    Args:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment.
+        key (str): Name of the field.
+        value (int): Field value.
+
+    """
+    struct.pack_into(_len_fmt, shm.buf, _ctrl_offset[key], value)
+
+
+def record_space(capacity, position, size):
+    r"""Determine the space in the ring buffer that writing a record would
+    use. Records are kept contiguous so that they can be read without
+    copying. If a record would extend past the end of the ring, the space
+    at the end of the ring is skipped and the record is written at the
+    start.
+
+    Args:
+        capacity (int): Size of the ring buffer.
+        position (int): Total number of bytes written prior to the record.
+        size (int): Size of the message in the record.
+
+    Returns:
+        tuple(int, int): Number of bytes skipped at the end of the ring and
+            the total number of bytes used by the record (including the
+            skipped bytes).
+
+    """
+    start = position % capacity
+    skip = 0
+    if (start + _len_size + size) > capacity:
+        skip = capacity - start
+    return skip, skip + _len_size + size
+
+
+def write_record(shm, capacity, position, data):
+    r"""Copy a message and its size into the ring buffer as a contiguous
+    record.
+
+    Args:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment.
+        capacity (int): Size of the ring buffer.
+        position (int): Total number of bytes written prior to the record.
+        data (bytes, memoryview): Message to copy.
+
+    Returns:
+        int: Position after the record.
+
+    """
+    data = memoryview(data).cast('B')
+    skip, nbytes = record_space(capacity, position, len(data))
+    if skip >= _len_size:
+        # Mark the skipped space so that the reader also skips it
+        struct.pack_into(_len_fmt, shm.buf,
+                         _ctrl_size + (position % capacity), _wrap_marker)
+    offset = _ctrl_size + ((position + skip) % capacity)
+    struct.pack_into(_len_fmt, shm.buf, offset, len(data))
+    offset += _len_size
+    shm.buf[offset:(offset + len(data))] = data
+    return position + nbytes
+
+
+def read_record(shm, capacity, position):
+    r"""Locate the next record in the ring buffer.
+
+    Args:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment.
+        capacity (int): Size of the ring buffer.
+        position (int): Total number of bytes read prior to the record.
+
+    Returns:
+        tuple(int, int, int): Offset of the message in the segment, size of
+            the message, and the position after the record.
+
+    """
+    start = position % capacity
+    size = _wrap_marker
+    if (capacity - start) >= _len_size:
+        size = struct.unpack_from(_len_fmt, shm.buf, _ctrl_size + start)[0]
+    if size == _wrap_marker:
+        position += capacity - start
+        start = 0
+        size = struct.unpack_from(_len_fmt, shm.buf, _ctrl_size)[0]
+    offset = _ctrl_size + start + _len_size
+    return offset, size, position + _len_size + size
+
+
+def release_slot(slot):
+    r"""Mark the space used by a received message as no longer in use.
+    This is called by a finalizer once the array tracking the message is
+    garbage collected.
+
+    Args:
+        slot (list): Position after the message in the ring and flag that
+            is set to True when the message is released.
+
+    """
+    slot[1] = True
+
+
+def close_retired_segments():
+    r"""Close segments that were retired while received messages still
+    referenced their memory if the messages have since been released."""
+    for x in list(_retired_segments):
+        shm, slots = x
+        if not all(released for _, released in slots):
+            continue
+        try:
+            shm.close()
+        except BufferError:  # pragma: debug
+            # The last array is being finalized and has not yet released
+            # its buffer
+            continue
+        _retired_segments.remove(x)
+        slots.clear()
+
+
+class SharedMemoryServer(CommBase.CommServer):
+    r"""Shared memory server object for cleaning up server segment."""
+
+    def terminate(self, *args, **kwargs):
+        CommBase.unregister_comm('SharedMemoryComm', self.srv_address)
+        super(SharedMemoryServer, self).terminate(*args, **kwargs)
+
+
+class SharedMemoryComm(AsyncComm.AsyncComm):
+    r"""Class for handling I/O via a ring buffer in shared memory.
+
+    Attributes:
+        shm (:class:`multiprocessing.shared_memory.SharedMemory`): Segment
+            containing the control block and ring buffer.
+
+    Developer Notes:
+        Each segment holds a single producer/single consumer ring buffer
+        so a shared memory comm should only be used to connect one sender
+        with one receiver on the same host. Messages are copied into the
+        ring by the sender, avoiding the kernel round trips required by
+        sockets and message queues. Messages of at least _copy_threshold
+        bytes that do not start with a header (e.g. the parts of large
+        messages) are received as memoryviews into the ring rather than
+        being copied out of it and the space they occupy is only released for
+        reuse by the sender once the received message (and any views or
+        arrays created from it) are no longer referenced. This is tracked
+        by a finalizer on the array that received views are created from.
+        Holding on to many large received messages will therefore block
+        the sender. The body of a message larger than maxMsgSize is sent
+        as a single record after the header if it fits in half of the
+        ring so that it can be received without copying it. Larger bodies
+        are split and the parts are sent through the same ring instead of
+        through a work comm.
+
+    """
+
+    _commtype = 'shm'
+    _schema_subtype_description = ('Ring buffer in shared memory for '
+                                   'models on the same host.')
+    _maxMsgSize = 2**22
+    _ring_size = 2**24
+    _copy_threshold = 2**16
+    address_description = ("The name of a shared memory segment.")
+    recv_buffers = True
+
+    def _init_before_open(self, **kwargs):
+        r"""Initialize empty segment and server class."""
+        self.shm = None
+        self._capacity = 0
+        self._slots = collections.deque()
+        self._slot_lock = multitasking.RLock()
+        self._multipart_lock = multitasking.RLock()
+        self._server_class = SharedMemoryServer
+        super(SharedMemoryComm, self)._init_before_open(**kwargs)
+
+    @classmethod
+    def is_installed(cls, language=None):
+        r"""Determine if the necessary libraries are installed for this
+        communication class.
+
+        Args:
+            language (str, optional): Specific language that should be checked
+                for compatibility. Defaults to None and all languages supported
+                on the current platform will be checked. If set to 'any', the
+                result will be True if this comm is installed for any of the
+                supported languages.
+
+        Returns:
+            bool: Is the comm installed.
+
+        """
+        if language in ['python', 'any']:
+            return _shm_installed
+        return False
+
+    @classmethod
+    def underlying_comm_class(self):
+        r"""str: Name of underlying communication class."""
+        return 'SharedMemoryComm'
+
+    @classmethod
+    def close_registry_entry(cls, value):
+        r"""Close a registry entry."""
+        return remove_segment(value)
+
+    @classmethod
+    def new_comm_kwargs(cls, *args, **kwargs):
+        r"""Initialize communication with new segment."""
+        if 'address' not in kwargs:
+            kwargs.setdefault('address', 'generate')
+        return args, kwargs
+
+    def bind(self):
+        r"""Bind to a new segment if address is generate."""
+        if not self._bound:
+            if self.address == 'generate':
+                self._bound = True
+                shm = get_segment()
+                self.address = shm.name
+        super(SharedMemoryComm, self).bind()
+
+    def open_after_bind(self):
+        r"""Open the connection by attaching to the bound segment."""
+        self.shm = get_segment(self.address)
+        self._capacity = get_control(self.shm, 'capacity')
+
+    def _open_direct(self):
+        r"""Open the segment."""
+        if not self.is_open_direct:
+            self.bind()
+            self.open_after_bind()
+            self.debug("shm: %s", self.shm.name)
+
+    def _close_direct(self, skip_remove=False):
+        r"""Close the segment."""
+        if self.shm is not None:
+            self.release_slots()
+            with self._slot_lock:
+                if not all(released for _, released in self._slots):
+                    # Received messages still reference the segment
+                    _retired_segments.append((self.shm, self._slots))
+                    self._slots = collections.deque()
+                else:
+                    self._slots.clear()
+                    self.shm.close()
+            close_retired_segments()
+        # Remove the segment
+        dont_close = (skip_remove or self.is_client)
+        if self._bound and (not dont_close):
+            # Dont close for client because server will not be able
+            # to unregister the comm
+            self.unregister_comm(self.address, dont_close=dont_close)
+        self.shm = None
+        self._bound = False
+
+    def _get_control(self, key):
+        r"""Get a control field, returning None if the segment is closed."""
+        try:
+            return get_control(self.shm, key)
+        except (AttributeError, TypeError, ValueError):
+            # Segment closed by another thread
+            if self.shm is not None:  # pragma: debug
+                raise
+            return None
+
+    @property
+    def is_open_direct(self):
+        r"""bool: True if the segment is attached and has not been closed
+        by the partner comm. Receiving comms remain open until any
+        messages remaining in the ring have been received."""
+        closed = self._get_control('closed')
+        if closed is None:
+            return False
+        if closed and ((self.direction == 'send')
+                       or (self.n_msg_direct_recv == 0)):
+            return False
+        return True
+
+    def confirm_send(self, noblock=False):
+        r"""Confirm that sent message was received."""
+        if noblock:
+            return True
+        return (self.n_msg_direct_send == 0)
+
+    def confirm_recv(self, noblock=False):
+        r"""Confirm that message was received."""
+        return True
+
+    @property
+    def n_msg_direct_send(self):
+        r"""int: Number of messages in the ring that have not been
+        received."""
+        nsent = self._get_control('nsent')
+        nrecv = self._get_control('nrecv')
+        if (nsent is None) or (nrecv is None):
+            return 0
+        return nsent - nrecv
+
+    @property
+    def n_msg_direct_recv(self):
+        r"""int: Number of messages in the ring to recv."""
+        if self.direction == 'recv':
+            self.release_slots()
+        return self.n_msg_direct_send
+
+    def release_slots(self):
+        r"""Release the space in the ring used by received messages that
+        are no longer referenced so that the sender can reuse it. Space is
+        released in the order that messages were received."""
+        with self._slot_lock:
+            tail = None
+            while self._slots and self._slots[0][1]:
+                tail = self._slots.popleft()[0]
+            if (tail is not None) and (self.shm is not None):
+                try:
+                    set_control(self.shm, 'tail', tail)
+                except (TypeError, ValueError):  # pragma: debug
+                    # Segment closed by another thread
+                    if self.shm is not None:
+                        raise
+        if _retired_segments:
+            close_retired_segments()
+
+    def _send_direct(self, payload):
+        r"""Send a message to the comm directly.
+
+        Args:
+            payload (str): Message to send.
+
+        Returns:
+            bool: Success or failure of sending the message.
+
+        """
+        if not self.is_open_direct:  # pragma: debug
+            return False
+        try:
+            size = len(payload)
+            if (_len_size + size) > self._capacity:  # pragma: debug
+                raise ValueError(("Message of %d bytes is larger than the "
+                                  "shared memory ring (%d bytes).")
+                                 % (size, self._capacity))
+            head = get_control(self.shm, 'head')
+            tail = get_control(self.shm, 'tail')
+            _, nbytes = record_space(self._capacity, head, size)
+            if nbytes > (self._capacity - (head - tail)):
+                self.debug("Shared memory ring full")
+                raise AsyncComm.AsyncTryAgain
+            self.debug('Sending %d bytes', size)
+            head = write_record(self.shm, self._capacity, head, payload)
+            set_control(self.shm, 'head', head)
+            set_control(self.shm, 'nsent',
+                        get_control(self.shm, 'nsent') + 1)
+            self.debug('Sent %d bytes', size)
+        except (AttributeError, TypeError, ValueError):  # pragma: debug
+            if self.is_closed or (self.shm is None):
+                self.debug("Comm closed")
+                return False
+            raise
+        return True
+
+    def _recv_direct(self):
+        r"""Receive a message from the comm directly.
+
+        Returns:
+            tuple (bool, str): The success or failure of receiving a message
+                and the message received.
+
+        """
+        self.debug("Message ready, reading it.")
+        try:
+            offset, size, position = read_record(
+                self.shm, self._capacity, get_control(self.shm, 'read'))
+            # Messages with a header are copied as they are copied when
+            # they are deserialized and the first part of a multipart
+            # message is kept until the other parts have been received
+            if ((size < self._copy_threshold)
+                    or (self.shm.buf[offset:(offset + len(YGG_MSG_HEAD))]
+                        == YGG_MSG_HEAD)):
+                data = self.shm.buf[offset:(offset + size)].tobytes()
+                slot = [position, True]
+            else:
+                # Views of the message reference the array so its space
+                # is released by the finalizer once they are all gone
+                arr = np.frombuffer(self.shm.buf, dtype=np.uint8,
+                                    count=size, offset=offset)
+                data = memoryview(arr)
+                slot = [position, False]
+                weakref.finalize(arr, release_slot, slot).atexit = False
+                del arr
+            with self._slot_lock:
+                self._slots.append(slot)
+            set_control(self.shm, 'read', position)
+            set_control(self.shm, 'nrecv',
+                        get_control(self.shm, 'nrecv') + 1)
+            self.release_slots()
+            self.debug("Received %d bytes", size)
+        except (AttributeError, TypeError, ValueError):  # pragma: debug
+            if self.is_closed or (self.shm is None):
+                self.debug("Segment closed")
+                return (False, self.empty_bytes_msg)
+            raise
+        return (True, data)
+
+    def create_multipart_comm(self):
+        r"""Get the comm that the remainder of a message larger than
+        maxMsgSize should be sent through. The parts are sent through the
+        same ring as the rest of the message so that a new segment is not
+        created for every large message.
+
+        Returns:
+            :class:.SharedMemoryComm: This comm.
+
+        """
+        return self
+
+    def body_fits_record(self, size):
+        r"""Determine if a message body can be sent as a single record.
+        A record no larger than half of the ring can always be written
+        once the ring is empty.
+
+        Args:
+            size (int): Size of the message body.
+
+        Returns:
+            bool: True if the body can be sent as one record.
+
+        """
+        return ((_len_size + size) <= (self._capacity // 2))
+
+    def multipart_split(self, msg):
+        r"""Determine where a message larger than maxMsgSize should be split
+        into the part sent with the header and the remainder. If the body
+        fits in a single record, only the header is sent in the first part
+        so that the body can be received as a view into the ring.
+
+        Args:
+            msg (bytes): Serialized message, including the header.
+
+        Returns:
+            int: Number of bytes that should be sent in the first part.
+
+        """
+        nhead = len(YGG_MSG_HEAD)
+        if isinstance(msg, bytes) and msg.startswith(YGG_MSG_HEAD):
+            iend = msg.find(YGG_MSG_HEAD, nhead, self.maxMsgSize)
+            if ((iend >= 0)
+                    and self.body_fits_record(len(msg) - iend - nhead)):
+                return iend + nhead
+        return super(SharedMemoryComm, self).multipart_split(msg)
+
+    def _send_multipart_worker(self, msg, info, **kwargs):
+        r"""Send the remainder of a large message through the ring.
+
+        Args:
+            msg (str): Message to be sent.
+            info (dict): Information about the outgoing message.
+            **kwargs: Additional keyword arguments are passed to
+                _send_multipart.
+
+        Returns:
+            bool: Success or failure of sending the message.
+
+        """
+        if self.body_fits_record(len(msg)):
+            return self._safe_send(msg, **kwargs)
+        return self._send_multipart(msg, **kwargs)
+
+    def _recv_multipart_worker(self, info, **kwargs):
+        r"""Receive the remainder of a large message from the ring.
+
+        Args:
+            info (dict): Information about the incoming message.
+            **kwargs: Additional keyword arguments are passed to
+                _recv_multipart.
+
+        Returns:
+            tuple (bool, str): The success or failure of receiving a message
+                and the complete message received.
+
+        """
+        return self._recv_multipart(info['body'], info['size'], **kwargs)
+
+    def send_multipart(self, *args, **kwargs):
+        r"""Send a multipart message. The parts of a message are sent while
+        holding a lock so that they are not interleaved with the parts of
+        messages sent by other threads.
+
+        Args:
+            *args: All arguments are passed to the parent class's method.
+            **kwargs: All keyword arguments are passed to the parent class's
+                method.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        with self._multipart_lock:
+            return super(SharedMemoryComm, self).send_multipart(
+                *args, **kwargs)
+
+    def recv_multipart(self, *args, **kwargs):
+        r"""Receive a multipart message. The parts of a message are
+        received while holding a lock so that they are not interleaved with
+        messages received by other threads.
+
+        Args:
+            *args: All arguments are passed to the parent class's method.
+            **kwargs: All keyword arguments are passed to the parent class's
+                method.
+
+        Returns:
+            tuple (bool, str): Success or failure of receive and received
+                message.
+
+        """
+        with self._multipart_lock:
+            return super(SharedMemoryComm, self).recv_multipart(
+                *args, **kwargs)
+
+    def purge(self):
+        r"""Purge all messages from the comm."""
+        super(SharedMemoryComm, self).purge()
+        try:
+            while self.n_msg_direct > 0:  # pragma: debug
+                self._recv_direct()
+        except AttributeError:  # pragma: debug
+            if self.is_open_direct:
+                raise
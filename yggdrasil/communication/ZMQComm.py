@@ -1,10 +1,12 @@
 import os
+import time
 import tempfile
 import uuid
 import logging
 from yggdrasil import tools
 from yggdrasil import multitasking
 from yggdrasil.communication import CommBase, AsyncComm
+from yggdrasil.metaschema.datatypes import YGG_MSG_HEAD
 logger = logging.getLogger(__name__)
 try:
     import zmq
@@ -24,7 +26,6 @@ _socket_type_pairs = [('PUSH', 'PULL'),
 _socket_send_types = [t[0] for t in _socket_type_pairs]
 _socket_recv_types = [t[1] for t in _socket_type_pairs]
 _socket_protocols = ['tcp', 'inproc', 'ipc', 'udp', 'pgm', 'epgm']
-_flag_zmq_filter = b'_ZMQFILTER_'
 _default_socket_type = 4
 _default_protocol = 'tcp'
 _wait_send_t = 0  # 0.0001
@@ -246,7 +247,7 @@ class ZMQProxy(CommBase.CommServer):
         r"""Receive single message from the client."""
         with self.lock:
             if not self.was_break:
-                return self.cli_socket.recv_multipart()
+                return self.cli_socket.recv_multipart(copy=False)
             else:  # pragma: debug
                 return None
 
@@ -256,7 +257,7 @@ class ZMQProxy(CommBase.CommServer):
             return
         while not self.was_break:
             try:
-                self.srv_socket.send(msg, zmq.NOBLOCK)
+                self.srv_socket.send(msg, zmq.NOBLOCK, copy=False)
                 # self.srv_socket.send_multipart(msg, zmq.NOBLOCK)
                 break
             except zmq.ZMQError:  # pragma: no cover
@@ -277,7 +278,7 @@ class ZMQProxy(CommBase.CommServer):
             message = self.client_recv()
             if message is not None:
                 self.debug('Forwarding message of size %d from %s',
-                           len(message[1]), message[0])
+                           len(message[1]), message[0].bytes)
                 self.server_send(message[1])
 
     def after_loop(self):
@@ -321,6 +322,12 @@ class ZMQComm(AsyncComm.AsyncComm):
             all messages.
         dealer_identity (str, optional): Identity that should be used to route
             messages to a dealer socket. Defaults to '0'.
+        confirm_window (int, optional): Maximum number of sent messages that
+            can be awaiting confirmation before the sending comm blocks until
+            the receiving comm confirms them. The window is passed to the
+            receiving comm in the message header so that messages can be
+            confirmed in batches. Defaults to 1 and every message is
+            confirmed individually.
         **kwargs: Additional keyword arguments are passed to :class:.CommBase.
 
     Attributes:
@@ -332,6 +339,8 @@ class ZMQComm(AsyncComm.AsyncComm):
         topic_filter (str): Message filter to use when subscribing.
         dealer_identity (str): Identity that should be used to route messages
             to a dealer socket.
+        confirm_window (int): Maximum number of sent messages that can be
+            awaiting confirmation.
 
     Developer Notes:
         |yggdrasil| uses the tcp transport by default with a PAIR socket type.
@@ -350,11 +359,29 @@ class ZMQComm(AsyncComm.AsyncComm):
         When creating worker comms for sending large messages, the sending
         model should create the reply comm for the worker in advanced and send
         it in the header with the worker address under the key 'zmq_reply_worker'.
+        Messages sent by 'PUB' sockets are preceded by a frame containing the
+        topic and messages sent by 'ROUTER' sockets are preceded by a frame
+        containing the identity of the destination 'DEALER' socket so that
+        the message itself is sent as a single frame without being copied.
+        If confirm_window is larger than 1, the sending model should also
+        send the window in the header under the key 'zmq_confirm_window'.
+        The receiving model can then confirm several messages with a single
+        handshake by sending 'YGG_REPLY_<count>' on the request socket once
+        the window is full or there are no more messages waiting. The
+        sending model should add count to the number of confirmed messages
+        and only block for confirmation once the window is full.
 
     """
 
     _commtype = 'zmq'
     _schema_subtype_description = ('ZeroMQ socket.')
+    _schema_properties = {
+        'confirm_window': {
+            'type': 'integer', 'minimum': 1,
+            'description': ('Maximum number of sent messages that can be '
+                            'awaiting confirmation before the sending comm '
+                            'blocks. Defaults to 1 and every message is '
+                            'confirmed individually.')}}
     # Based on limit of 32bit int, this could be 2**30, but this is
     # too large for stack allocation in C so 2**20 will be used.
     _maxMsgSize = 2**20
@@ -434,6 +461,15 @@ class ZMQComm(AsyncComm.AsyncComm):
         self._n_zmq_recv = {}
         self._n_reply_sent = 0
         self._n_reply_recv = {}
+        if self.confirm_window is None:
+            env_name = self.name
+            if self.is_interface:
+                env_name = env_name[:-len('_I')]
+            self.confirm_window = self.get_confirm_window_env(env_name)
+        self.confirm_window = max(int(self.confirm_window), 1)
+        self._confirm_window_recv = {}
+        self._reply_pending = {}
+        self._parsed_headers = {}
         self._server_class = ZMQProxy
         self._server_kwargs = dict(zmq_context=self.context,
                                    nretry=4, retry_timeout=2.0 * self.sleeptime)
@@ -495,6 +531,24 @@ class ZMQComm(AsyncComm.AsyncComm):
             out = True
         return out
 
+    @classmethod
+    def shared_address_kwargs(cls, direction):
+        r"""Get keyword arguments required for a receiving comm to accept
+        messages from more than one sending comm at the same address and
+        for the sending comms that connect to it. The default PAIR sockets
+        only allow a single peer so PUSH/PULL sockets are used instead.
+
+        Args:
+            direction (str): Direction of the comm ('send' or 'recv').
+
+        Returns:
+            dict: Keyword arguments for the comm.
+
+        """
+        if direction == 'recv':
+            return {'socket_type': 'PULL'}
+        return {'socket_type': 'PUSH'}
+
     @property
     def address_param(self):
         r"""dict: Address parameters."""
@@ -557,6 +611,34 @@ class ZMQComm(AsyncComm.AsyncComm):
         else:
             return self.address
 
+    @classmethod
+    def get_confirm_window_env(cls, name):
+        r"""Get the confirmation window for a comm from the environment
+        variables set by the connection driver for the model.
+
+        Args:
+            name (str): Name of the comm.
+
+        Returns:
+            int: Confirmation window. 1 if one is not set.
+
+        """
+        for k in [name, name.replace(':', '__COLON__')]:
+            k += '_CONFIRM_WINDOW'
+            if k in os.environ:
+                return int(os.environ[k])
+        return 1
+
+    @property
+    def opp_comms(self):
+        r"""dict: Name/address pairs for opposite comms. If the
+        confirmation window is larger than 1, it is also passed to the
+        opposite comm."""
+        out = super(ZMQComm, self).opp_comms
+        if self.confirm_window > 1:
+            out[self.name + '_CONFIRM_WINDOW'] = str(self.confirm_window)
+        return out
+
     def opp_comm_kwargs(self):
         r"""Get keyword arguments to initialize communication with opposite
         comm object.
@@ -574,12 +656,18 @@ class ZMQComm(AsyncComm.AsyncComm):
         if kwargs['socket_type'] in ['DEALER', 'ROUTER']:
             kwargs['dealer_identity'] = self.dealer_identity
         kwargs['context'] = self.context
+        kwargs['confirm_window'] = self.confirm_window
         return kwargs
 
     @property
     def registry_key(self):
-        r"""str: String used to register the socket."""
-        return '%s_%s_%s' % (self.socket_type_name, self.address, self.direction)
+        r"""str: String used to register the socket. More than one socket
+        can connect to the same address so the key for connected sockets
+        includes the socket identity."""
+        out = '%s_%s_%s' % (self.socket_type_name, self.address, self.direction)
+        if self._connected:
+            out += '_' + tools.bytes2str(self.dealer_identity)
+        return out
 
     def bind(self):
         r"""Bind to address, getting random port as necessary."""
@@ -697,6 +785,7 @@ class ZMQComm(AsyncComm.AsyncComm):
             with self.reply_socket_lock:
                 self._n_reply_recv[address] = 0
                 self._n_zmq_recv[address] = 0
+                self._confirm_window_recv[address] = 1
                 self.reply_socket_recv[address] = s
             self.debug("new recv address: %s", address)
         return address
@@ -718,22 +807,53 @@ class ZMQComm(AsyncComm.AsyncComm):
         r"""Check incoming message for reply address.
 
         Args:
-            msg (str): Incoming message to check.
+            msg (bytes, memoryview): Incoming message to check.
 
         Returns:
-            str: Messages with reply address removed if present.
+            bytes, memoryview: Messages with reply address removed if present.
 
         """
         if self.direction == 'send':
             return msg, None
-        header = self.serializer.parse_header(msg.split(_flag_zmq_filter)[-1])
+        # Only messages that start with a header can contain routing info
+        header = {}
+        if msg[:len(YGG_MSG_HEAD)] == YGG_MSG_HEAD:
+            header = self.serializer.parse_header(msg)
+            # The message is kept with the header so that the id is not
+            # reused before the header is popped by on_recv
+            self._parsed_headers[id(msg)] = (msg, header)
         address = header.get('zmq_reply', None)
         if (address is None):
             address = self.reply_socket_address
         if address is not None:
             self.set_reply_socket_recv(address)
+            if 'zmq_confirm_window' in header:
+                self._confirm_window_recv[address] = int(
+                    header['zmq_confirm_window'])
         return msg, address
 
+    def pop_parsed_header(self, s_msg):
+        r"""Get the header that was parsed from a raw received message by
+        check_reply_socket_recv so that it is not parsed again.
+
+        Args:
+            s_msg (bytes, memoryview): Raw received message.
+
+        Returns:
+            dict: Header information parsed from the message, None if the
+                header was not parsed.
+
+        """
+        out = self._parsed_headers.pop(id(s_msg), None)
+        if (out is None) or (out[0] is not s_msg):  # pragma: debug
+            return None
+        return out[1]
+
+    def purge(self):
+        r"""Purge all messages from the comm."""
+        super(ZMQComm, self).purge()
+        self._parsed_headers.clear()
+
     # @property
     # def n_reply_sent(self):
     #     r"""Number of messages sent which have been confirmed."""
@@ -744,14 +864,20 @@ class ZMQComm(AsyncComm.AsyncComm):
     #     r"""Number of messages received which have been confirmed."""
     #     return sum(self._n_reply_recv.values())
 
-    def _reply_handshake_send(self):
-        r"""Do send side of handshake."""
+    def _reply_handshake_send(self, timeout=1):
+        r"""Do send side of handshake.
+
+        Args:
+            timeout (int, optional): Time (in milliseconds) that the reply
+                socket should be polled for a handshake. Defaults to 1.
+
+        """
         if (((self.reply_socket_send is None)
              or self.reply_socket_send.closed)):  # pragma: debug
             self.backlog_thread.set_break_flag()
             self.debug("SOCKET CLOSED")
             return False
-        out = self.reply_socket_send.poll(timeout=1, flags=zmq.POLLIN)
+        out = self.reply_socket_send.poll(timeout=timeout, flags=zmq.POLLIN)
         if out == 0:
             self.periodic_debug('_reply_handshake_send', period=1000)(
                 'No reply handshake waiting')
@@ -761,28 +887,50 @@ class ZMQComm(AsyncComm.AsyncComm):
             self.error("REPLY EOF RECV'D")
             return msg
         self.reply_socket_send.send(msg, flags=zmq.NOBLOCK)
-        self._n_reply_sent += 1
+        if msg.startswith(_reply_msg + b'_'):
+            self._n_reply_sent += int(msg[(len(_reply_msg) + 1):])
+        else:
+            self._n_reply_sent += 1
         return msg
 
-    def _reply_handshake_recv(self, msg_send, key):
-        r"""Do recv side of handshake."""
+    def _reply_handshake_recv(self, msg_send, key, count=1, tries=10):
+        r"""Do recv side of handshake.
+
+        Args:
+            msg_send (bytes): Handshake message.
+            key (str): Reply address for the sending comm.
+            count (int, optional): Number of messages that the handshake
+                confirms. If larger than 1, the count is appended to
+                msg_send. Defaults to 1.
+            tries (int, optional): Number of times the request socket
+                should be polled for the response. If 0, the socket is
+                only checked once without waiting and the handshake is
+                resumed by the next call if there is not a response.
+                Defaults to 10.
+
+        """
         try:
             socket = self.reply_socket_recv.get(key, None)
             if socket is None or socket.closed:  # pragma: debug
                 self.backlog_thread.set_break_flag()
                 self.debug("SOCKET CLOSED")
                 return False
-            out = socket.poll(timeout=1, flags=zmq.POLLOUT)
-            if out == 0:  # pragma: debug
-                self.periodic_debug('_reply_handshake_recv', period=1000)(
-                    'Cannot initiate reply handshake')
-                return False
-            socket.send(msg_send, flags=zmq.NOBLOCK)
-            if msg_send == self.eof_msg:  # pragma: debug
-                self.error("REPLY EOF SENT")
-                return True
-            tries = 10
-            out = 0
+            if key in self._reply_pending:
+                # Resume a handshake that was initiated previously
+                msg_send, count = self._reply_pending.pop(key)
+            else:
+                if count > 1:
+                    msg_send += b'_%d' % count
+                out = socket.poll(timeout=1, flags=zmq.POLLOUT)
+                if out == 0:  # pragma: debug
+                    self.periodic_debug('_reply_handshake_recv', period=1000)(
+                        'Cannot initiate reply handshake')
+                    return False
+                socket.send(msg_send, flags=zmq.NOBLOCK)
+                if msg_send == self.eof_msg:  # pragma: debug
+                    self.error("REPLY EOF SENT")
+                    return True
+            out = socket.poll(timeout=0, flags=zmq.POLLIN)
             while (out == 0) and (tries > 0):
                 out = socket.poll(timeout=self.zmq_sleeptime,
                                   flags=zmq.POLLIN)
@@ -790,16 +938,30 @@ class ZMQComm(AsyncComm.AsyncComm):
                     self.debug("No response waiting. %d tries left.", tries)
                     tries -= 1
             if out == 0:
-                self.error('No response received.')
+                self.debug('No response received. Handshake will be resumed.')
+                self._reply_pending[key] = (msg_send, count)
                 return False
             msg_recv = socket.recv(flags=zmq.NOBLOCK)
             assert(msg_recv == msg_send)
-            self._n_reply_recv[key] += 1
+            self._n_reply_recv[key] += count
             return True
         except zmq.ZMQError as e:  # pragma: debug
             self.error("ZMQ Error: %s", e)
             return False
 
+    def linger(self):
+        r"""Wait for messages to drain. Send comms without a backlog thread
+        complete handshakes for messages in the confirmation window here."""
+        if ((self.direction == 'send') and (self.confirm_window > 1)
+                and self.dont_backlog):
+            T = self.start_timeout(t=self._timeout_drain,
+                                   key_suffix='.linger_confirm')
+            while ((not T.is_out) and self.is_open_direct
+                   and (self.n_msg_direct_send > 0)):
+                self._reply_handshake_send(timeout=self.zmq_sleeptime)
+            self.stop_timeout(key_suffix='.linger_confirm')
+        super(ZMQComm, self).linger()
+
     def _close_direct(self, linger=False):
         r"""Close the connection.
 
@@ -833,6 +995,7 @@ class ZMQComm(AsyncComm.AsyncComm):
     def _close_backlog(self, wait=False):
         r"""Close the backlog thread and the reply sockets."""
         super(ZMQComm, self)._close_backlog(wait=wait)
+        self._parsed_headers.clear()
         if self.direction == 'send':
             if (self.reply_socket_send is not None):
                 self.reply_socket_send.close(linger=0)  # self.zmq_sleeptime)
@@ -864,11 +1027,13 @@ class ZMQComm(AsyncComm.AsyncComm):
         with self.socket_lock:
             return (self._openned and not self.socket.closed)
 
-    def is_message(self, flags):
+    def is_message(self, flags, timeout=1):
         r"""Poll the socket for a message.
 
         Args:
             flags (int): ZMQ poll flags.
+            timeout (int, optional): Time (in milliseconds) that the
+                socket should be polled for. Defaults to 1.
 
         Returns:
             bool: True if there is a message matching the flags, False otherwise.
@@ -879,7 +1044,7 @@ class ZMQComm(AsyncComm.AsyncComm):
         with self.socket_lock:
             if self.is_open_direct:
                 try:
-                    out = self.socket.poll(timeout=1, flags=flags)
+                    out = self.socket.poll(timeout=timeout, flags=flags)
                 except zmq.ZMQError:  # pragma: debug
                     # self.exception('Error polling')
                     pass
@@ -892,6 +1057,42 @@ class ZMQComm(AsyncComm.AsyncComm):
             return int(self.is_message(zmq.POLLIN))
         return 0
 
+    def _wait_direct_recv(self, timeout):
+        r"""Block until there is a message to receive directly from the
+        socket.
+
+        Args:
+            timeout (float): Maximum time (in seconds) that should be
+                waited.
+
+        Returns:
+            bool: True if there is a message to receive, False otherwise.
+
+        """
+        if not self.is_open_direct:  # pragma: debug
+            return False
+        # The socket is polled in intervals of at most sleeptime so that
+        # the socket lock is released between polls and other threads can
+        # send, receive, or close while this one waits
+        tpoll = max(1, int(1000.0 * self.sleeptime))
+        tstop = time.perf_counter() + timeout
+        while True:
+            tleft = int(1000.0 * (tstop - time.perf_counter()))
+            if self.is_message(zmq.POLLIN, timeout=max(1, min(tpoll, tleft))):
+                return True
+            if (tleft <= tpoll) or (not self.is_open_direct):
+                return False
+
+    @property
+    def recv_poll_socket(self):
+        r"""zmq.Socket: Socket that messages are received from directly and
+        that can be polled alongside the sockets of other comms. None if
+        messages are received via the backlog."""
+        if ((self.dont_backlog and (self.direction == 'recv')
+             and self.is_open_direct)):
+            return self.socket
+        return None
+
     @property
     def n_msg_direct_send(self):
         r"""int: Number of messages currently being routed."""
@@ -923,6 +1124,7 @@ class ZMQComm(AsyncComm.AsyncComm):
         out = super(ZMQComm, self).get_work_comm_kwargs
         out['socket_type'] = 'PAIR'
         out['context'] = self.context
+        out['confirm_window'] = self.confirm_window
         return out
 
     @property
@@ -931,6 +1133,7 @@ class ZMQComm(AsyncComm.AsyncComm):
         out = super(ZMQComm, self).create_work_comm_kwargs
         out['socket_type'] = 'PAIR'
         out['context'] = self.context
+        out['confirm_window'] = self.confirm_window
         return out
     
     def workcomm2header(self, work_comm, **kwargs):
@@ -966,7 +1169,7 @@ class ZMQComm(AsyncComm.AsyncComm):
         c = super(ZMQComm, self).header2workcomm(header, **kwargs)
         return c
     
-    def on_send(self, msg, header_kwargs=None):
+    def on_send(self, msg, header_kwargs=None, **kwargs):
         r"""Process message to be sent including handling serializing
         message and handling EOF.
 
@@ -974,6 +1177,8 @@ class ZMQComm(AsyncComm.AsyncComm):
             msg (obj): Message to be sent
             header_kwargs (dict, optional): Keyword arguments that should be
                 added to the header.
+            **kwargs: Additional keyword arguments are passed to the parent
+                method.
 
         Returns:
             tuple (bool, str, dict): Truth of if message should be sent, raw
@@ -984,7 +1189,10 @@ class ZMQComm(AsyncComm.AsyncComm):
             if header_kwargs is None:
                 header_kwargs = dict()
             header_kwargs['zmq_reply'] = self.set_reply_socket_send()
-        return super(ZMQComm, self).on_send(msg, header_kwargs=header_kwargs)
+            if self.confirm_window > 1:
+                header_kwargs['zmq_confirm_window'] = self.confirm_window
+        return super(ZMQComm, self).on_send(msg, header_kwargs=header_kwargs,
+                                            **kwargs)
         
     # This is only needed when base is not asynchronous
     # def _send_multipart_worker(self, msg, header, **kwargs):
@@ -1008,8 +1216,8 @@ class ZMQComm(AsyncComm.AsyncComm):
 
         Args:
             msg (str, bytes): Message to be sent.
-            topic (str, optional): Filter that should be sent with the
-                message for 'PUB' sockets. Defaults to ''.
+            topic (str, optional): Filter that should be sent in a frame
+                before the message for 'PUB' sockets. Defaults to ''.
             identity (str, optional): Identify of identified worker that
                 should be sent for 'ROUTER' sockets. Defaults to
                 self.dealer_identity.
@@ -1026,12 +1234,11 @@ class ZMQComm(AsyncComm.AsyncComm):
             identity = self.dealer_identity
         topic = tools.str2bytes(topic)
         identity = tools.str2bytes(identity)
-        if self.socket_type_name == 'PUB':
-            total_msg = topic + _flag_zmq_filter + msg
-        else:
-            total_msg = msg
-        total_msg = self.check_reply_socket_send(total_msg)
+        total_msg = self.check_reply_socket_send(msg)
         kwargs.setdefault('flags', zmq.NOBLOCK)
+        # Messages larger than the socket's copy_threshold are sent from
+        # the message buffer without copying it
+        kwargs.setdefault('copy', False)
         with self.socket_lock:
             try:
                 if self.socket.closed:  # pragma: debug
@@ -1040,6 +1247,8 @@ class ZMQComm(AsyncComm.AsyncComm):
                 self.special_debug("Sending %d bytes to %s", len(total_msg), self.address)
                 if self.socket_type_name == 'ROUTER':
                     self.socket.send(identity, zmq.SNDMORE)
+                elif self.socket_type_name == 'PUB':
+                    self.socket.send(topic, zmq.SNDMORE)
                 self.socket.send(total_msg, **kwargs)
                 self.special_debug("Sent %d bytes to %s", len(total_msg), self.address)
                 self._n_zmq_sent += 1
@@ -1086,19 +1295,27 @@ class ZMQComm(AsyncComm.AsyncComm):
                 if self.socket_type_name == 'ROUTER':
                     identity = self.socket.recv(flags)
                     self._recv_identities.add(identity)
+                elif self.socket_type_name == 'SUB':
+                    topic = self.socket.recv(flags)
+                    assert(topic == self.topic_filter)
                 kwargs.setdefault('flags', flags)
-                total_msg = self.socket.recv(**kwargs)
+                kwargs.setdefault('copy', False)
+                msg = self.socket.recv(**kwargs)
             except zmq.ZMQError:  # pragma: debug
                 self.exception("Error receiving")
                 return (False, self.empty_bytes_msg)
-        self.debug("Recv %d bytes from %s", len(total_msg), self.address)
+        if isinstance(msg, zmq.Frame):
+            # Large frames without a header (e.g. the parts of multipart
+            # messages) are passed on as views of the frame to avoid
+            # copying them
+            if ((len(msg) >= self.socket.copy_threshold)
+                    and (msg.buffer[:len(YGG_MSG_HEAD)] != YGG_MSG_HEAD)):
+                msg = msg.buffer
+            else:
+                msg = msg.bytes
+        self.debug("Recv %d bytes from %s", len(msg), self.address)
         # Interpret headers
-        total_msg, k = self.check_reply_socket_recv(total_msg)
-        if self.socket_type_name == 'SUB':
-            topic, msg = total_msg.split(_flag_zmq_filter)
-            assert(topic == self.topic_filter)
-        else:
-            msg = total_msg
+        msg, k = self.check_reply_socket_recv(msg)
         # Confirm receipt
         if k is not None:
             self._n_zmq_recv[k] += 1
@@ -1115,11 +1332,13 @@ class ZMQComm(AsyncComm.AsyncComm):
         if self.is_open and (self._n_zmq_sent != self._n_reply_sent):
             self.verbose_debug("Confirming %d/%d sent messages",
                                self._n_reply_sent, self._n_zmq_sent)
-            if self._reply_handshake_send():
+            # Only wait for a handshake once the window is full
+            in_window = (self.n_msg_direct_send < self.confirm_window)
+            if self._reply_handshake_send(timeout=int(not in_window)):
                 self.debug("Send confirmed (%d/%d)",
                            self._n_reply_sent, self._n_zmq_sent)
                 return True
-            return False
+            return in_window
         return True
 
     def confirm_recv(self, noblock=False):
@@ -1134,12 +1353,29 @@ class ZMQComm(AsyncComm.AsyncComm):
         flag = None
         for k in keys:
             if self.is_open and (self._n_zmq_recv[k] != self._n_reply_recv[k]):
+                count = self._n_zmq_recv[k] - self._n_reply_recv[k]
+                in_window = (count < self._confirm_window_recv[k])
+                # Defer confirmation until the window is full or there
+                # are no more messages waiting
+                if (in_window and (k not in self._reply_pending)
+                        and self.is_message(zmq.POLLIN, timeout=0)):
+                    flag = True
+                    continue
                 self.debug("Confirming %d/%d received messages",
                            self._n_reply_recv[k], self._n_zmq_recv[k])
-                if self._reply_handshake_recv(_reply_msg, k):
+                # Only wait for the response once the window is full or
+                # if there is not a backlog thread to resume the handshake
+                if in_window and (not self.dont_backlog):
+                    tries = 0
+                else:
+                    tries = 10
+                if self._reply_handshake_recv(_reply_msg, k, count=count,
+                                              tries=tries):
                     self.debug("Recv confirmed (%d/%d)",
                                self._n_reply_recv[k], self._n_zmq_recv[k])
                     flag = True
+                elif in_window:
+                    flag = True
                 elif flag is None:
                     flag = False
         if flag is None:
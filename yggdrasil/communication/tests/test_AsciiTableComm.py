@@ -33,6 +33,33 @@ def test_AsciiTableComm_nofmt():
     os.remove(test_file)
 
 
+def test_AsciiTableComm_read_chunk_size():
+    r"""Test read of asciitable as arrays in chunks of complete rows."""
+    test_file = os.path.join(os.getcwd(), 'temp_file.txt')
+    rows = [(b'r%d' % i, i, float(i)) for i in range(20)]
+    kwargs = {'as_array': True, 'format_str': '%5s\t%d\t%f\n'}
+    inst = AsciiTableComm.AsciiTableComm('test', test_file, direction='send',
+                                         **kwargs)
+    inst.open()
+    assert(inst.send([np.array([r[i] for r in rows]) for i in range(3)]))
+    inst.close()
+    inst = AsciiTableComm.AsciiTableComm('test', test_file, direction='recv',
+                                         read_chunk_size=100, **kwargs)
+    inst.open()
+    nchunk = 0
+    recv_rows = []
+    while True:
+        flag, x = inst.recv()
+        if not flag:
+            break
+        nchunk += 1
+        recv_rows += list(zip(*x))
+    assert(nchunk > 1)
+    assert_equal(recv_rows, rows)
+    inst.close()
+    os.remove(test_file)
+
+
 class TestAsciiTableComm(parent.TestAsciiFileComm):
     r"""Test for AsciiTableComm communication class."""
 
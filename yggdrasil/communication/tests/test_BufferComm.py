@@ -1,4 +1,37 @@
+from yggdrasil import multitasking
+from yggdrasil.communication.BufferComm import LockedBuffer
 from yggdrasil.communication.tests import test_CommBase
+from yggdrasil.tests import assert_equal
+
+
+def wait_on_buffer(x, waited, finished):
+    assert(x.wait(60.0))
+    waited.set()
+    finished.wait(60.0)
+
+
+def test_LockedBuffer_wait():
+    r"""Test that waiting on a buffer from another process leaves the
+    element in the buffer."""
+    x = LockedBuffer(task_method='process')
+    waited = x.context.Event()
+    finished = x.context.Event()
+    p = multitasking.Task(target=wait_on_buffer,
+                          args=(x, waited, finished),
+                          task_method='process')
+    try:
+        x.append(b'hello')
+        assert(x.wait(1.0))
+        p.start()
+        assert(waited.wait(60.0))
+        assert_equal(len(x), 1)
+        assert_equal(x.pop(0), b'hello')
+        assert_equal(len(x), 0)
+        assert(not x.wait(0.01))
+    finally:
+        finished.set()
+        p.join(60.0)
+        x.close()
 
 
 class TestBufferComm(test_CommBase.TestCommBase):
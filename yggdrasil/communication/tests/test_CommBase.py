@@ -5,6 +5,7 @@ from yggdrasil.tests import YggTestClassInfo, assert_equal
 from yggdrasil.communication import new_comm, get_comm, CommBase
 from yggdrasil.communication.filters.StatementFilter import StatementFilter
 from yggdrasil.communication.filters.FunctionFilter import FunctionFilter
+from yggdrasil.serialize.DirectSerialize import DirectSerialize
 
 
 def test_registry():
@@ -465,6 +466,58 @@ class TestCommBase(YggTestClassInfo):
             assert(flag)
         assert(not msg_recv)
 
+    def test_wait_for_recv(self):
+        r"""Test waiting for a message to be available to receive."""
+        assert(not self.recv_instance.wait_for_recv(self.sleeptime))
+        if self.comm in ['CommBase', 'AsyncComm']:
+            return
+        flag = self.send_instance.send(self.test_msg)
+        assert(flag)
+        T = self.recv_instance.start_timeout(self.timeout)
+        while ((not T.is_out)
+               and (not self.recv_instance.wait_for_recv())):  # pragma: debug
+            pass
+        self.recv_instance.stop_timeout()
+        assert(self.recv_instance.n_msg_recv >= 1)
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        self.assert_msg_equal(msg_recv, self.test_msg)
+
+    def test_send_recv_batch(self):
+        r"""Test sending/receiving a batch of messages."""
+        if ((self.comm in ['CommBase', 'AsyncComm'])
+                or (not self.send_instance.can_send_batch)):
+            return
+        msgs = [self.test_msg for i in range(3)]
+        for recv_meth in ['recv_batch', 'recv']:
+            assert(self.send_instance.send_batch(msgs))
+            T = self.recv_instance.start_timeout(self.timeout)
+            while ((not T.is_out)
+                   and (not self.recv_instance.wait_for_recv())):  # pragma: debug
+                pass
+            self.recv_instance.stop_timeout()
+            if recv_meth == 'recv_batch':
+                flag, msg_recv = self.recv_instance.recv_batch(
+                    timeout=self.timeout)
+                assert(flag)
+                self.assert_msg_lists_equal(msg_recv, msgs)
+        # Messages in a batch can also be received individually
+        for x in msgs:
+            flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_msg_equal(msg_recv, x)
+
+    def test_send_recv_binary_body(self):
+        r"""Test sending/receiving a message with a raw binary body."""
+        if ((self.comm in ['CommBase', 'AsyncComm'])
+                or self.send_instance.is_file):
+            return
+        self.send_instance.binary_body = True
+        try:
+            self.do_send_recv()
+        finally:
+            self.send_instance.binary_body = False
+
     def add_filter(self, comm, filter=None):
         r"""Add a filter to a comm.
 
@@ -602,6 +655,29 @@ class TestCommBase(YggTestClassInfo):
                           send_kwargs=dict(header_kwargs=dict(x=self.msg_long)),
                           print_status=True)
 
+    def test_send_recv_nolimit_direct(self):
+        r"""Test that large messages received without decoding are bytes
+        unless the comm returns buffers."""
+        if ((self.comm in ['CommBase', 'AsyncComm'])
+                or (not isinstance(self.test_msg, bytes))):
+            return
+        old_serializers = (self.send_instance.serializer,
+                           self.recv_instance.serializer)
+        self.send_instance.serializer = DirectSerialize()
+        self.recv_instance.serializer = DirectSerialize()
+        try:
+            msg_send = self.msg_long
+            assert(len(msg_send) > self.maxMsgSize)
+            assert(self.send_instance.send(msg_send))
+            flag, msg_recv = self.recv_instance.recv(self.timeout)
+            assert(flag)
+            self.assert_equal(bytes(msg_recv), msg_send)
+            if not self.recv_instance.recv_buffers:
+                assert(isinstance(msg_recv, bytes))
+        finally:
+            (self.send_instance.serializer,
+             self.recv_instance.serializer) = old_serializers
+
     def test_send_recv_array(self):
         r"""Test send/recv of a array message."""
         msg_send = getattr(self, 'test_msg_array', None)
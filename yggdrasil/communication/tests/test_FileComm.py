@@ -2,7 +2,8 @@ import os
 import copy
 import unittest
 import jsonschema
-from yggdrasil.tests import assert_equal
+import numpy as np
+from yggdrasil.tests import assert_equal, assert_raises
 from yggdrasil.communication import new_comm
 from yggdrasil.communication.tests import test_CommBase as parent
 
@@ -40,6 +41,139 @@ def test_wait_for_creation():
     recv_instance.remove_file()
 
 
+def test_read_chunk_size():
+    r"""Test FileComm reading a file in chunks."""
+    contents = b'Test message\n' * 10
+    name = 'temp_file_chunk.txt'
+    kwargs = {'in_temp': True, 'comm': 'FileComm'}
+    send_instance = new_comm(name, direction='send', **kwargs)
+    assert(send_instance.send(contents))
+    send_instance.close()
+    recv_instance = new_comm(name, direction='recv', read_chunk_size=32,
+                             **kwargs)
+    chunks = []
+    while True:
+        flag, msg_recv = recv_instance.recv()
+        if not flag:
+            break
+        assert(len(msg_recv) <= 32)
+        chunks.append(msg_recv)
+    assert_equal(len(chunks), 5)
+    assert_equal(b''.join(chunks), contents)
+    recv_instance.close()
+    recv_instance.remove_file()
+
+
+def test_read_chunk_size_framed():
+    r"""Test FileComm reading a file of frames in chunks smaller than
+    each frame."""
+    name = 'temp_file_chunk.pkl'
+    kwargs = {'in_temp': True, 'comm': 'PickleFileComm'}
+    objects = [{'a': i, 'b': 'x' * 100} for i in range(3)]
+    send_instance = new_comm(name, direction='send', **kwargs)
+    for x in objects:
+        assert(send_instance.send(x))
+    send_instance.close()
+    recv_instance = new_comm(name, direction='recv', read_chunk_size=16,
+                             **kwargs)
+    for x in objects:
+        flag, msg_recv = recv_instance.recv()
+        assert(flag)
+        assert_equal(msg_recv, x)
+    flag, msg_recv = recv_instance.recv()
+    assert(not flag)
+    recv_instance.close()
+    recv_instance.remove_file()
+
+
+def test_read_chunk_size_error():
+    r"""Test error when reading in chunks is not supported by the
+    serializer."""
+    kwargs = {'in_temp': True, 'comm': 'JSONFileComm', 'dont_open': True,
+              'direction': 'recv', 'read_chunk_size': 32}
+    assert_raises(ValueError, new_comm, 'temp_file_chunk.json', **kwargs)
+
+
+def test_mmap():
+    r"""Test FileComm receiving views of a memory mapped file."""
+    contents = np.arange(10, dtype='float64')
+    name = 'temp_file_mmap.bin'
+    kwargs = {'in_temp': True, 'comm': 'FileComm'}
+    send_instance = new_comm(name, direction='send', **kwargs)
+    assert(send_instance.send(contents.tobytes()))
+    send_instance.close()
+    for chunk_size in [0, 32]:
+        recv_instance = new_comm(name, direction='recv', mmap=True,
+                                 read_chunk_size=chunk_size, **kwargs)
+        chunks = []
+        while True:
+            flag, msg_recv = recv_instance.recv()
+            if not flag:
+                break
+            assert(isinstance(msg_recv, memoryview))
+            chunks.append(np.frombuffer(msg_recv, dtype='float64'))
+        recv_instance.close()
+        np.testing.assert_array_equal(np.concatenate(chunks), contents)
+        del msg_recv, chunks
+    recv_instance.remove_file()
+
+
+def test_mmap_serializers():
+    r"""Test receiving from a memory mapped file with serializers that
+    receive the view (pickle) and those that receive a copy (JSON)."""
+    contents = {'a': [1, 2, 3], 'b': 'hello'}
+    for comm in ['PickleFileComm', 'JSONFileComm']:
+        name = 'temp_file_mmap_%s.txt' % comm
+        kwargs = {'in_temp': True, 'comm': comm}
+        send_instance = new_comm(name, direction='send', **kwargs)
+        assert(send_instance.send(contents))
+        send_instance.close()
+        recv_instance = new_comm(name, direction='recv', mmap=True, **kwargs)
+        flag, msg_recv = recv_instance.recv()
+        assert(flag)
+        assert_equal(msg_recv, contents)
+        recv_instance.close()
+        recv_instance.remove_file()
+
+
+def test_write_buffer():
+    r"""Test FileComm buffering writes between flushes."""
+    msg_send = b'Test message\n'
+    name = 'temp_file_buffer.txt'
+    kwargs = {'in_temp': True, 'comm': 'FileComm'}
+    send_instance = new_comm(name, direction='send', write_buffer_size=64,
+                             **kwargs)
+    for i in range(4):
+        assert(send_instance.send(msg_send))
+    assert_equal(os.path.getsize(send_instance.address), 0)
+    assert(send_instance.send(msg_send))
+    assert_equal(os.path.getsize(send_instance.address), 5 * len(msg_send))
+    assert(send_instance.send(msg_send))
+    send_instance.write_buffer_time = 0.01
+    send_instance.sleep(0.02)
+    assert(send_instance.send(msg_send))
+    assert_equal(os.path.getsize(send_instance.address), 7 * len(msg_send))
+    send_instance.write_buffer_time = 0.0
+    assert(send_instance.send(msg_send))
+    assert(send_instance.send_eof())
+    assert_equal(os.path.getsize(send_instance.address), 8 * len(msg_send))
+    send_instance.close()
+    send_instance.remove_file()
+    # Buffered data is flushed by the timer without another send
+    send_instance = new_comm(name, direction='send', write_buffer_size=64,
+                             write_buffer_time=0.01, **kwargs)
+    assert(send_instance.send(msg_send))
+    T = send_instance.start_timeout(1.0)
+    while ((not T.is_out)
+           and (os.path.getsize(send_instance.address) == 0)):
+        send_instance.sleep()
+    send_instance.stop_timeout()
+    assert_equal(os.path.getsize(send_instance.address), len(msg_send))
+    assert(send_instance._flush_timer is None)
+    send_instance.close()
+    send_instance.remove_file()
+
+
 class TestFileComm(parent.TestCommBase):
     r"""Test for FileComm communication class."""
 
@@ -47,7 +181,8 @@ class TestFileComm(parent.TestCommBase):
     attr_list = (copy.deepcopy(parent.TestCommBase.attr_list)
                  + ['fd', 'read_meth', 'append', 'in_temp',
                     'is_series', 'wait_for_creation', 'serializer',
-                    'platform_newline'])
+                    'platform_newline', 'read_chunk_size', 'mmap',
+                    'write_buffer_size', 'write_buffer_time'])
     
     def teardown(self):
         r"""Remove the file."""
@@ -1,5 +1,6 @@
 import uuid
 import copy
+from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 from yggdrasil.communication.tests import test_CommBase as parent
 
 
@@ -62,6 +63,106 @@ class TestForkComm(parent.TestCommBase):
         kwargs.setdefault('n_recv', 1)
         super(TestForkComm, self).test_send_recv_filter_recv_filter(**kwargs)
         
+    def test_shared_serialization(self):
+        r"""Test that message bodies are only serialized once for a bundle
+        of compatible comms."""
+        assert(self.send_instance.shared_serialization)
+        ncall = []
+        orig = MetaschemaType.serialize_body
+
+        def serialize_body(*args, **kwargs):
+            ncall.append(1)
+            return orig(*args, **kwargs)
+
+        MetaschemaType.serialize_body = serialize_body
+        try:
+            self.do_send_recv()
+        finally:
+            MetaschemaType.serialize_body = orig
+        self.assert_equal(len(ncall), 1)
+
+    def test_wait_for_recv_any(self, direct=False):
+        r"""Test waiting for a message on any one of the comms in the
+        bundle."""
+        if direct:
+            for x in self.recv_instance.comm_list:
+                if hasattr(x, 'stop_backlog'):
+                    x.stop_backlog()
+        for x in self.send_instance.comm_list[::-1]:
+            flag = x.send(self.test_msg)
+            assert(flag)
+            assert(self.recv_instance.wait_for_recv(self.timeout))
+            flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_msg_equal(msg_recv, self.test_msg)
+        assert(not self.recv_instance.wait_for_recv(self.sleeptime))
+
+    def test_wait_for_recv_direct(self):
+        r"""Test waiting for a message on any one of the comms in the
+        bundle when messages are received directly."""
+        self.test_wait_for_recv_any(direct=True)
+
+    def test_error_dispatch(self):
+        r"""Test error on invalid dispatch method."""
+        self.assert_raises(ValueError, self.import_cls, self.name,
+                           dispatch='invalid')
+
+    def test_dispatch(self):
+        r"""Test sending messages to one of the comms in the bundle."""
+        try:
+            for dispatch in ['round_robin', 'least_outstanding']:
+                self.send_instance.dispatch = dispatch
+                for i in range(self.ncomm):
+                    flag = self.send_instance.send(self.test_msg)
+                    assert(flag)
+                for x in self.recv_instance.comm_list:
+                    flag, msg_recv = x.recv(timeout=self.timeout)
+                    assert(flag)
+                    self.assert_msg_equal(msg_recv, self.test_msg)
+            # Messages with the same hash go to the same comm
+            self.send_instance.dispatch = 'hash'
+            idx = self.send_instance.select_comm(self.test_msg)
+            for i in range(self.ncomm):
+                flag = self.send_instance.send(self.test_msg)
+                assert(flag)
+            for i in range(self.ncomm):
+                flag, msg_recv = self.recv_instance.comm_list[idx].recv(
+                    timeout=self.timeout)
+                assert(flag)
+                self.assert_msg_equal(msg_recv, self.test_msg)
+            # Batches are split between comms
+            self.send_instance.dispatch = 'round_robin'
+            flag = self.send_instance.send_batch(
+                [self.test_msg for i in range(2 * self.ncomm)])
+            assert(flag)
+            for x in self.recv_instance.comm_list:
+                for i in range(2):
+                    flag, msg_recv = x.recv(timeout=self.timeout)
+                    assert(flag)
+                    self.assert_msg_equal(msg_recv, self.test_msg)
+        finally:
+            self.send_instance.dispatch = 'broadcast'
+        assert(not self.recv_instance.wait_for_recv(self.sleeptime))
+
+    def test_dispatch_field_name(self):
+        r"""Test hashing a named field of messages sent as tuples."""
+        serializer = self.send_instance.serializer
+        try:
+            self.send_instance.dispatch = 'hash'
+            serializer.field_names = ['a', 'b']
+            self.send_instance.dispatch_field = 'c'
+            self.assert_raises(ValueError, self.send_instance.select_comm,
+                               ('x', 1))
+            self.send_instance.dispatch_field = 'b'
+            idx = self.send_instance.select_comm(('x', 1))
+            self.assert_equal(self.send_instance.select_comm(['y', 1]), idx)
+            self.assert_equal(self.send_instance.select_comm({'b': 1}), idx)
+        finally:
+            self.send_instance.dispatch = 'broadcast'
+            self.send_instance.dispatch_field = None
+            del serializer.field_names
+            self.send_instance._dispatch_field_index = None
+
     def test_purge(self, **kwargs):
         r"""Test purging messages from the comm."""
         kwargs['nrecv'] = self.ncomm
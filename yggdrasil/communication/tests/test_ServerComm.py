@@ -1,7 +1,9 @@
+import os
 import unittest
 import uuid
 import copy
 from yggdrasil.communication import new_comm
+from yggdrasil.drivers.ClientRequestDriver import YGG_CLIENT_EOF
 from yggdrasil.communication.tests import test_CommBase
 
 
@@ -107,6 +109,64 @@ class TestServerComm(test_CommBase.TestCommBase):
         assert(flag)
         self.assert_equal(msg_recv, self.msg_long)
 
+    def echo_requests(self, nmsg):
+        r"""Receive requests and send them back as responses.
+
+        Args:
+            nmsg (int): Number of requests to respond to.
+
+        """
+        for i in range(nmsg):
+            flag, msg_recv, request_id = self.recv_instance.recv_from(
+                timeout=self.timeout)
+            assert(flag)
+            flag = self.recv_instance.send_to(request_id, msg_recv)
+            assert(flag)
+
+    def test_call_async(self):
+        r"""Test asynchronous RPC calls with responses sent out of order."""
+        msgs = [b'request%d' % i for i in range(3)]
+        futures = [self.send_instance.call_async(msg) for msg in msgs]
+        assert(not any(x.done() for x in futures))
+        requests = []
+        for msg in msgs:
+            flag, msg_recv, request_id = self.recv_instance.recv_from(
+                timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg_recv, msg)
+            requests.append((request_id, msg_recv))
+        for request_id, msg_recv in requests[::-1]:
+            flag = self.recv_instance.send_to(request_id, msg_recv)
+            assert(flag)
+        for msg, x in zip(msgs[::-1], futures[::-1]):
+            self.assert_equal(x.result(timeout=self.timeout), (True, msg))
+            assert(x.done())
+        self.assert_equal(len(self.send_instance.icomm), 0)
+
+    def test_call_async_timeout(self):
+        r"""Test that the response to an asynchronous RPC call can be
+        received after an earlier attempt timed out."""
+        future = self.send_instance.call_async(self.test_msg)
+        flag, msg_recv = future.result(timeout=self.sleeptime)
+        assert(flag)
+        assert(self.send_instance.is_empty_recv(msg_recv))
+        assert(not future.done())
+        self.assert_equal(len(self.send_instance.icomm), 1)
+        self.echo_requests(1)
+        self.assert_equal(future.result(timeout=self.timeout),
+                          (True, self.test_msg))
+        assert(future.done())
+        self.assert_equal(len(self.send_instance.icomm), 0)
+
+    def test_call_many(self):
+        r"""Test RPC calls for a batch of requests."""
+        msgs = [b'request%d' % i for i in range(5)]
+        self.recv_instance.sched_task(0.0, self.echo_requests,
+                                      args=[len(msgs)])
+        results = self.send_instance.call_many(msgs, nmax=2)
+        self.assert_equal(results, [(True, msg) for msg in msgs])
+        self.assert_equal(len(self.send_instance.icomm), 0)
+
     def test_close_in_thread(self):
         r"""Test close of comm in thread."""
         self.send_instance.close_in_thread()
@@ -145,3 +205,83 @@ class TestServerComm(test_CommBase.TestCommBase):
     #     # Purge send while closed
     #     self.send_instance.close()
     #     self.send_instance.purge()
+
+
+class TestServerCommPersistent(TestServerComm):
+    r"""Tests for ServerComm communication class with a client that uses
+    a persistent response comm."""
+
+    @property
+    def send_inst_kwargs(self):
+        r"""dict: Keyword arguments for send instance."""
+        return {'comm': 'ClientComm', 'persistent_response': True}
+
+    def test_persistent_response(self):
+        r"""Test responses sent out of order via persistent response comm."""
+        msgs = [b'request%d' % i for i in range(3)]
+        for msg in msgs:
+            flag = self.send_instance.send(msg)
+            assert(flag)
+        request_ids = []
+        for msg in msgs:
+            flag, msg_recv, request_id = self.recv_instance.recv_from(
+                timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg_recv, msg)
+            request_ids.append(request_id)
+        self.assert_equal(len(self.recv_instance.persistent_ocomm), 1)
+        for msg, request_id in zip(msgs[::-1], request_ids[::-1]):
+            flag = self.recv_instance.send_to(request_id, msg)
+            assert(flag)
+        for msg in msgs:
+            flag, msg_recv = self.send_instance.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg_recv, msg)
+        self.assert_equal(len(self.recv_instance.ocomm), 0)
+        self.assert_equal(len(self.recv_instance.persistent_ocomm), 1)
+        assert(self.send_instance.response_comm.is_open)
+
+    def test_persistent_response_eof(self):
+        r"""Test that the persistent response comm is closed after the
+        client sends EOF once the outstanding response is sent."""
+        assert(self.send_instance.send(self.test_msg))
+        flag, msg_recv, request_id = self.recv_instance.recv_from(
+            timeout=self.timeout)
+        assert(flag)
+        ocomm = self.recv_instance.persistent_ocomm[
+            self.send_instance.response_comm.address]
+        assert(self.send_instance.send_eof())
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(self.recv_instance.is_eof(msg_recv))
+        self.assert_equal(len(self.recv_instance.persistent_ocomm), 0)
+        assert(ocomm.is_open)
+        assert(self.recv_instance.send_to(request_id, self.test_msg))
+        self.assert_equal(self.send_instance.recv(timeout=self.timeout),
+                          (True, self.test_msg))
+        assert(ocomm.name in self.recv_instance._used_response_comms)
+
+    def test_persistent_response_signoff(self):
+        r"""Test that the persistent response comms for a client are removed
+        when the client signs off."""
+        os.environ['YGG_MODEL_NAME'] = 'test_client'
+        try:
+            assert(self.send_instance.send(self.test_msg))
+        finally:
+            del os.environ['YGG_MODEL_NAME']
+        flag, msg_recv, request_id = self.recv_instance.recv_from(
+            timeout=self.timeout)
+        assert(flag)
+        assert(self.recv_instance.send_to(request_id, self.test_msg))
+        self.assert_equal(self.send_instance.recv(timeout=self.timeout),
+                          (True, self.test_msg))
+        ocomm = self.recv_instance.persistent_ocomm[
+            self.send_instance.response_comm.address]
+        self.assert_equal(ocomm.client_model, 'test_client')
+        assert(self.send_instance.ocomm.send(
+            YGG_CLIENT_EOF, header_kwargs={'raw': True,
+                                           'client_model': 'test_client'}))
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        assert(self.recv_instance.is_empty_recv(msg_recv))
+        self.assert_equal(len(self.recv_instance.persistent_ocomm), 0)
+        assert(ocomm.name in self.recv_instance._used_response_comms)
@@ -0,0 +1,124 @@
+import unittest
+import copy
+import numpy as np
+from yggdrasil.tests import assert_equal
+from yggdrasil import tools
+from yggdrasil.communication import SharedMemoryComm, CommBase
+from yggdrasil.communication.tests import test_AsyncComm
+
+
+_shm_installed = SharedMemoryComm.SharedMemoryComm.is_installed(
+    language='python')
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+def test_segment():
+    r"""Test creation/removal of a shared memory segment."""
+    shm = SharedMemoryComm.get_segment(size=64)
+    key = shm.name
+    assert(CommBase.is_registered('SharedMemoryComm', key))
+    assert_equal(SharedMemoryComm.get_control(shm, 'capacity'), 64)
+    other = SharedMemoryComm.get_segment(key)
+    assert_equal(SharedMemoryComm.get_control(other, 'capacity'), 64)
+    other.close()
+    CommBase.unregister_comm('SharedMemoryComm', key)
+    assert(not CommBase.is_registered('SharedMemoryComm', key))
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+def test_record_wrap():
+    r"""Test reading/writing records that would wrap around the ring."""
+    shm = SharedMemoryComm.get_segment(size=32)
+    try:
+        msg = b'abcdefghij'
+        assert_equal(SharedMemoryComm.record_space(32, 12, len(msg)),
+                     (0, 18))
+        assert_equal(SharedMemoryComm.record_space(32, 20, len(msg)),
+                     (12, 30))
+        for position in [12, 20, 28]:
+            end = SharedMemoryComm.write_record(shm, 32, position, msg)
+            offset, size, end_read = SharedMemoryComm.read_record(
+                shm, 32, position)
+            assert_equal(end_read, end)
+            assert_equal(size, len(msg))
+            assert_equal(shm.buf[offset:(offset + size)].tobytes(), msg)
+    finally:
+        CommBase.unregister_comm('SharedMemoryComm', shm.name)
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+def test_installed():
+    r"""Test that the shared memory comm is reported as installed."""
+    assert('shm' in tools.get_installed_comm(language='python'))
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+class TestSharedMemoryComm(test_AsyncComm.TestAsyncComm):
+    r"""Test for SharedMemoryComm communication class."""
+
+    comm = 'SharedMemoryComm'
+    attr_list = (copy.deepcopy(test_AsyncComm.TestAsyncComm.attr_list)
+                 + ['shm'])
+
+    def test_ring_full(self):
+        r"""Test sending more data than fits in the ring at once."""
+        msg_send = self.send_instance._ring_size // 3 * b'\x01'
+        self.send_instance.stop_backlog()
+        self.recv_instance.stop_backlog()
+        assert(self.send_instance._send_direct(msg_send))
+        assert(self.send_instance._send_direct(msg_send))
+        try:
+            self.send_instance._send_direct(msg_send)
+        except SharedMemoryComm.AsyncComm.AsyncTryAgain:
+            pass
+        else:  # pragma: debug
+            raise AssertionError("Ring should be full.")
+        assert_equal(self.send_instance.n_msg_direct_send, 2)
+        for _ in range(2):
+            flag, msg_recv = self.recv_instance._recv_direct()
+            assert(flag)
+            assert(isinstance(msg_recv, memoryview))
+            assert_equal(msg_recv, msg_send)
+        # Space is only released once the received messages are unused
+        try:
+            self.send_instance._send_direct(msg_send)
+        except SharedMemoryComm.AsyncComm.AsyncTryAgain:
+            pass
+        else:  # pragma: debug
+            raise AssertionError("Ring should be full.")
+        del msg_recv
+        self.recv_instance.release_slots()
+        assert(self.send_instance._send_direct(msg_send))
+        flag, msg_recv = self.recv_instance._recv_direct()
+        assert_equal(msg_recv, msg_send)
+
+    def test_send_recv_parts(self):
+        r"""Test that the parts of large messages are sent through the
+        ring rather than through a work comm."""
+        msg_send = (3 * self.send_instance.maxMsgSize) * b'\x01'
+        assert(self.send_instance.send(msg_send))
+        flag, msg_recv = self.recv_instance.recv(self.timeout)
+        assert(flag)
+        assert_equal(msg_recv, msg_send)
+        assert_equal(len(self.send_instance._work_comms), 0)
+        assert_equal(len(self.recv_instance._work_comms), 0)
+
+    def test_send_recv_view(self):
+        r"""Test that the body of a large message is received as a view
+        into the ring that is released once it is unused."""
+        msg_send = np.ones(self.send_instance.maxMsgSize // 8 + 10,
+                           dtype='float64')
+        self.send_instance.binary_body = True
+        try:
+            assert(self.send_instance.send(msg_send))
+        finally:
+            self.send_instance.binary_body = False
+        flag, msg_recv = self.recv_instance.recv(self.timeout)
+        assert(flag)
+        np.testing.assert_array_equal(msg_recv, msg_send)
+        assert(not msg_recv.flags.owndata)
+        assert(not all(released for _, released
+                       in self.recv_instance._slots))
+        del msg_recv
+        self.recv_instance.release_slots()
+        assert_equal(len(self.recv_instance._slots), 0)
@@ -1,4 +1,7 @@
+import os
+import time
 import unittest
+import threading
 import copy
 from yggdrasil import platform
 from yggdrasil.tests import assert_raises, assert_equal
@@ -66,7 +69,8 @@ class TestZMQComm(test_AsyncComm.TestAsyncComm):
     comm = 'ZMQComm'
     attr_list = (copy.deepcopy(test_AsyncComm.TestAsyncComm.attr_list)
                  + ['context', 'socket', 'socket_type_name',
-                    'socket_type', 'protocol', 'host', 'port'])
+                    'socket_type', 'protocol', 'host', 'port',
+                    'confirm_window'])
     protocol = None
     socket_type = None
 
@@ -94,6 +98,73 @@ class TestZMQComm(test_AsyncComm.TestAsyncComm):
         if self.__class__ != TestZMQComm:
             raise unittest.SkipTest('Only test once')
         super(TestZMQComm, self).test_eof_no_close()
+
+    def test_recv_direct_frame(self):
+        r"""Test that large frames without a header are received without
+        copying them."""
+        if self.__class__ != TestZMQComm:
+            raise unittest.SkipTest('Only test once')
+        self.recv_instance.stop_backlog()
+        nbytes = self.recv_instance.socket.copy_threshold
+        for msg_send, cls in [(b'x' * (2 * nbytes), memoryview),
+                              (b'x' * 10, bytes)]:
+            assert(self.send_instance._send_direct(msg_send))
+            assert(self.recv_instance._wait_direct_recv(self.timeout))
+            flag, msg_recv = self.recv_instance._recv_direct()
+            assert(flag)
+            assert(isinstance(msg_recv, cls))
+            self.assert_equal(bytes(msg_recv), msg_send)
+
+    def test_wait_direct_recv_lock(self):
+        r"""Test that the socket lock is not held for the whole time that
+        a thread waits for a message."""
+        if self.__class__ != TestZMQComm:
+            raise unittest.SkipTest('Only test once')
+        self.recv_instance.stop_backlog()
+        out = []
+        thread = threading.Thread(
+            target=lambda: out.append(
+                self.recv_instance._wait_direct_recv(10 * self.timeout)))
+        thread.start()
+        try:
+            self.recv_instance.sleep(2 * self.sleeptime)
+            t0 = time.perf_counter()
+            with self.recv_instance.socket_lock:
+                assert(thread.is_alive())
+            assert((time.perf_counter() - t0) < self.timeout)
+        finally:
+            assert(self.send_instance._send_direct(b'x' * 10))
+            thread.join(self.timeout)
+        self.assert_equal(out, [True])
+        flag, msg_recv = self.recv_instance._recv_direct()
+        assert(flag)
+
+    def test_parsed_header(self):
+        r"""Test that headers parsed for the reply address are not parsed
+        again when the message is deserialized."""
+        if self.__class__ != TestZMQComm:
+            raise unittest.SkipTest('Only test once')
+        self.recv_instance.stop_backlog()
+        assert(self.send_instance.send(self.test_msg))
+        assert(self.recv_instance._wait_direct_recv(self.timeout))
+        flag, s_msg = self.recv_instance._recv_direct()
+        assert(flag)
+        assert(id(s_msg) in self.recv_instance._parsed_headers)
+        header = self.recv_instance._parsed_headers[id(s_msg)][1]
+        datatype = self.recv_instance.serializer.encoded_datatype
+
+        def decode_header(*args, **kwargs):  # pragma: debug
+            raise AssertionError("Header decoded again.")
+
+        datatype.decode_header = decode_header
+        try:
+            flag, msg_recv, header_recv = self.recv_instance.on_recv(s_msg)
+        finally:
+            del datatype.decode_header
+        assert(flag)
+        assert(header_recv is header)
+        self.assert_equal(msg_recv, self.test_msg)
+        assert(id(s_msg) not in self.recv_instance._parsed_headers)
         
     
 # Tests for server/client
@@ -185,8 +256,69 @@ class TestZMQCommREQ(TestZMQComm):
     def test_send_recv_condition(self):
         r"""Test send/recv with conditional."""
         pass
+
+    def test_send_recv_batch(self):
+        r"""Test sending/receiving a batch of messages."""
+        pass
     
 
+class TestZMQCommWindow(TestZMQComm):
+    r"""Test for ZMQComm communication class with a confirmation window."""
+
+    confirm_window = 3
+
+    @property
+    def send_inst_kwargs(self):
+        r"""Keyword arguments for send instance."""
+        out = super(TestZMQCommWindow, self).send_inst_kwargs
+        out['confirm_window'] = self.confirm_window
+        return out
+
+    def test_confirm_window(self):
+        r"""Test confirming messages in batches."""
+        self.assert_equal(self.recv_instance.confirm_window,
+                          self.confirm_window)
+        nmsg = 2 * self.confirm_window + 1
+        for i in range(nmsg):
+            assert(self.send_instance.send(self.test_msg))
+        for i in range(nmsg):
+            flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_msg_equal(msg_recv, self.test_msg)
+        assert(self.send_instance.wait_for_confirm(timeout=self.timeout))
+        assert(self.recv_instance.wait_for_confirm(timeout=self.timeout))
+        self.assert_equal(self.send_instance._n_reply_sent, nmsg)
+
+    def test_confirm_window_env(self):
+        r"""Test passing the confirmation window to a model's comm via the
+        environment."""
+        name = self.send_instance.name
+        key = name + '_CONFIRM_WINDOW'
+        env = self.send_instance.opp_comms
+        self.assert_equal(env[key], str(self.confirm_window))
+        self.assert_equal(self.import_cls.get_confirm_window_env(name), 1)
+        os.environ[key] = env[key]
+        try:
+            self.assert_equal(self.import_cls.get_confirm_window_env(name),
+                              self.confirm_window)
+        finally:
+            del os.environ[key]
+
+    def test_confirm_window_linger(self):
+        r"""Test confirming messages in the window when a send comm
+        without a backlog is closed."""
+        self.send_instance.stop_backlog()
+        nmsg = self.confirm_window - 1
+        for i in range(nmsg):
+            assert(self.send_instance.send(self.test_msg))
+        for i in range(nmsg):
+            flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+            assert(flag)
+        self.send_instance.linger_close()
+        self.assert_equal(self.send_instance._n_reply_sent, nmsg)
+        assert(self.recv_instance.wait_for_confirm(timeout=self.timeout))
+
+
 class TestZMQCommROUTER(TestZMQComm):
     r"""Test for ZMQComm communication class with DEALER/ROUTER socket."""
 
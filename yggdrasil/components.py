@@ -15,6 +15,7 @@ _registry_defaults = {}
 _registry_base_classes = {}
 _registry_class2subtype = {}
 _registry_complete = False
+_validation_schemas = {}
 _comptype2key = {'comm': 'commtype',
                  'file': 'filetype',
                  'model': 'language',
@@ -244,7 +245,11 @@ def import_component(comptype, subtype=None, without_schema=False,
         if without_schema:
             if subtype is None:  # pragma: debug
                 raise ValueError("subtype must be provided if without_schema is True.")
-            class_name = subtype
+            # Use the index of subtypes so that all of the components
+            # are not imported if subtype is not a class name
+            from yggdrasil.schema import get_subtype_index
+            class_name = get_subtype_index().get(comptype, {}).get(
+                subtype, subtype)
         else:
             from yggdrasil.schema import get_schema
             s = get_schema().get(comptype, None)
@@ -629,20 +634,12 @@ class ComponentBase(object):
         # Parse keyword arguments using schema
         if (((comptype is not None) and (subtype is not None)
              and (not skip_component_schema_normalization))):
-            from yggdrasil.schema import get_schema
-            s = get_schema().get_component_schema(
-                comptype, subtype, relaxed=True,
-                allow_instance_definitions=True)
-            props = list(s['properties'].keys())
+            from yggdrasil import metaschema
+            props, s, key = self._get_validation_schema(comptype, subtype)
             if not skip_component_schema_normalization:
-                from yggdrasil import metaschema
                 kwargs.setdefault(self._schema_subtype_key, subtype)
-                # Remove properties that shouldn't ve validated in class
-                for k in self._schema_excluded_from_class_validation:
-                    if k in s['properties']:
-                        del s['properties'][k]
-                # Validate and normalize
-                metaschema.validate_instance(kwargs, s, normalize=False)
+                # Validate using a validator cached for the schema
+                metaschema.get_schema_validator(s, key=key).validate(kwargs)
                 # TODO: Normalization performance needs improvement
                 # import pprint
                 # print('before')
@@ -669,6 +666,39 @@ class ComponentBase(object):
             #                   % (k, v, getattr(self, k)))
         self.extra_kwargs = kwargs
 
+    @classmethod
+    def _get_validation_schema(cls, comptype, subtype):
+        r"""Get the schema used to validate keyword arguments passed to the
+        class constructor. The schema is cached so that it is only created
+        once for each component type/subtype.
+
+        Args:
+            comptype (str): Component type.
+            subtype (str): Component subtype.
+
+        Returns:
+            tuple: Properties in the full component schema, the schema with
+                properties in _schema_excluded_from_class_validation removed,
+                and the key that should be used to cache validators.
+
+        """
+        from yggdrasil.schema import get_schema
+        registry = get_schema()
+        key = ('component', comptype, subtype,
+               tuple(cls._schema_excluded_from_class_validation))
+        out = _validation_schemas.get(key, None)
+        if (out is None) or (out[0] is not registry):
+            s = registry.get_component_schema(
+                comptype, subtype, relaxed=True,
+                allow_instance_definitions=True)
+            props = list(s['properties'].keys())
+            # Remove properties that shouldn't be validated in class
+            for k in cls._schema_excluded_from_class_validation:
+                s['properties'].pop(k, None)
+            out = (registry, props, s)
+            _validation_schemas[key] = out
+        return out[1], out[2], key + (id(registry),)
+
     def __getstate__(self):
         out = self.__dict__.copy()
         del out['_input_args'], out['_input_kwargs']
@@ -51,6 +51,11 @@ _cfg_map = {
                  '\'True\': all messages (decreases performance), '
                  '\'False\': no messages, or '
                  '\'First\': only the first message a comm sends/receives.')},
+    ('jsonschema', 'cache_dir'): {
+        'env': 'YGG_CACHE_DIR', 'arg': 'cache-dir',
+        'help': ('Directory where the parsed schema and normalized YAML '
+                 'files are cached to speed up startup. Caching is '
+                 'disabled if set to \'False\'.')},
     ('rmq', 'namespace'): {
         'env': 'YGG_NAMESPACE', 'help': 'RabbitMQ namespace.'},
     ('rmq', 'host'): {
@@ -89,7 +94,17 @@ _cfg_map = {
         'help': 'Run production level tests when encountered.'},
     ('general', 'default_comm'): {
         'env': 'YGG_DEFAULT_COMM', 'type': str,
-        'help': 'Comm type that should be used by default.'}
+        'help': 'Comm type that should be used by default.'},
+    ('general', 'build_cache'): {
+        'env': 'YGG_BUILD_CACHE', 'type': str,
+        'help': ('Directory where compilation products should be cached '
+                 'and reused between runs. If \'True\', the products will '
+                 'be cached in ~/.yggdrasil/build_cache.')},
+    ('general', 'compile_nproc'): {
+        'env': 'YGG_COMPILE_NPROC', 'type': int,
+        'help': ('Maximum number of models and libraries that should be '
+                 'compiled at once when starting a run. Defaults to the '
+                 'number of CPUs.')}
 }
 _key2env = {}
 for k, v in _cfg_map.items():
@@ -279,13 +279,44 @@ class BuildModelDriver(CompiledModelDriver):
                 method.
 
         """
-        if self.target_language_driver is not None:
+        if ((self.target_language_driver is not None)
+                and (not kwargs.get('skip_dependencies', False))):
             self.target_language_driver.compile_dependencies(
                 toolname=self.target_compiler)
         kwargs['working_dir'] = self.compile_working_dir
         kwargs['target_compiler'] = self.target_compiler
         return super(BuildModelDriver, self).compile_model(**kwargs)
         
+    def get_build_tasks(self, tasks=None):
+        r"""Get the compilation tasks required to build the model and the
+        internal libraries it depends on without running them, including
+        the internal libraries for the target language.
+
+        Args:
+            tasks (OrderedDict, optional): Existing tasks that new tasks
+                should be added to. Defaults to None and a new OrderedDict is
+                created.
+
+        Returns:
+            OrderedDict: Mapping from task key to a tuple of the keys for
+                tasks that must be completed first, the function that should
+                be called, and the arguments and keyword arguments for the
+                function.
+
+        """
+        tasks = super(BuildModelDriver, self).get_build_tasks(tasks=tasks)
+        if self.target_language_driver is not None:
+            tasks, required = (
+                self.target_language_driver.get_dependency_tasks(
+                    toolname=self.target_compiler, tasks=tasks))
+            key = ('model', self.name)
+            prereqs, func, args, kwargs = tasks.pop(key)
+            # Re-added so that it comes after the new tasks
+            tasks[key] = (prereqs + [x for x in required
+                                     if x not in prereqs],
+                          func, args, kwargs)
+        return tasks
+
     def cleanup(self):
         r"""Remove compiled executable."""
         if (self.model_file is not None) and os.path.isfile(self.model_file):
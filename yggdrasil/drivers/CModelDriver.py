@@ -15,7 +15,6 @@ from yggdrasil.metaschema.properties.ScalarMetaschemaProperties import (
     _valid_types)
 from yggdrasil.languages import get_language_dir
 from yggdrasil.config import ygg_cfg
-from numpy import distutils as numpy_distutils
 
 
 _default_internal_libtype = 'object'
@@ -497,7 +496,7 @@ try:
 except BaseException as e:  # pragma: debug
     warnings.warn("ERROR LOCATING PYTHON LIBRARY: %s" % e)
     _python_lib = None
-_numpy_inc = numpy_distutils.misc_util.get_numpy_include_dirs()
+_numpy_inc = [np.get_include()]
 _numpy_lib = None  # os.path.join(os.path.dirname(_numpy_inc[0]), 'lib', 'npymath.lib')
 
 
@@ -49,11 +49,16 @@ class ClientRequestDriver(ConnectionDriver):
             server request driver.
         comm_address (str): Address for the server request driver.
         response_drivers (list): Response drivers created for each request.
+        persistent_response_drivers (dict): Response drivers that forward
+            responses to all requests sent by a client model using a
+            persistent response comm, keyed by the address of the client
+            model's response comm.
 
     """
 
     _connection_type = None
     _direction = 'output'
+    _can_batch = False
 
     def __init__(self, model_request_name, request_name=None,
                  comm=None, comm_address=None, **kwargs):
@@ -78,6 +83,7 @@ class ClientRequestDriver(ConnectionDriver):
         super(ClientRequestDriver, self).__init__(model_request_name, **kwargs)
         self.env[self.icomm.name] = self.icomm.address
         self.response_drivers = []
+        self.persistent_response_drivers = {}
         self.comm = comm
         self.comm_address = self.ocomm.opp_address
         self._block_response = False
@@ -134,6 +140,7 @@ class ClientRequestDriver(ConnectionDriver):
             for x in self.response_drivers:
                 x.terminate()
             self.response_drivers = []
+            self.persistent_response_drivers = {}
 
     def close_comm(self):
         r"""Close response drivers."""
@@ -180,22 +187,38 @@ class ClientRequestDriver(ConnectionDriver):
             with self.lock:
                 if (not self.is_comm_open) or self._block_response:  # pragma: debug
                     return False
-                drv_args = [self.model_response_address]
-                drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
-                                  request_name=self.name)
-                self.debug("Creating response comm: address = %s, request_id = %s",
-                           self.model_response_address, self.request_id)
-                try:
-                    response_driver = ClientResponseDriver(*drv_args, **drv_kwargs)
-                    self.response_drivers.append(response_driver)
-                    response_driver.start()
-                    self.debug("Started response comm: address = %s, request_id = %s",
+                persistent = self.last_header.get('persistent_response', False)
+                response_driver = None
+                if persistent:
+                    response_driver = self.persistent_response_drivers.get(
+                        self.model_response_address, None)
+                if response_driver is None:
+                    drv_args = [self.model_response_address]
+                    drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
+                                      request_name=self.name,
+                                      persistent_response=persistent)
+                    self.debug("Creating response comm: address = %s, "
+                               "request_id = %s",
                                self.model_response_address, self.request_id)
-                except BaseException:  # pragma: debug
-                    self.exception("Could not create/start response driver.")
-                    return False
+                    try:
+                        response_driver = ClientResponseDriver(*drv_args,
+                                                               **drv_kwargs)
+                        self.response_drivers.append(response_driver)
+                        response_driver.start()
+                        self.debug("Started response comm: address = %s, "
+                                   "request_id = %s",
+                                   self.model_response_address,
+                                   self.request_id)
+                    except BaseException:  # pragma: debug
+                        self.exception("Could not create/start response driver.")
+                        return False
+                    if persistent:
+                        self.persistent_response_drivers[
+                            self.model_response_address] = response_driver
             # Send response address in header
             kwargs.setdefault('header_kwargs', {})
+            if persistent:
+                kwargs['header_kwargs'].setdefault('persistent_response', True)
             kwargs['header_kwargs'].setdefault(
                 'response_address', response_driver.response_address)
             kwargs['header_kwargs'].setdefault('request_id', self.request_id)
@@ -223,3 +246,6 @@ class ClientRequestDriver(ConnectionDriver):
                     remove_idx.append(i)
             for i in remove_idx[::-1]:
                 self.response_drivers.pop(i)
+            for k, x in list(self.persistent_response_drivers.items()):
+                if not x.is_alive():
+                    self.persistent_response_drivers.pop(k)
@@ -1,4 +1,5 @@
 import uuid
+from yggdrasil.components import import_component
 from yggdrasil.drivers.ConnectionDriver import ConnectionDriver
 
 
@@ -13,6 +14,12 @@ class ClientResponseDriver(ConnectionDriver):
             tools.get_default_comm().
         msg_id (str, optional): ID associate with the request message this
             driver was created to respond to. Defaults to new unique ID.
+        persistent_response (bool, optional): If True, the client model
+            receives responses to all of its requests via a single
+            persistent response comm and the driver forwards responses to
+            all requests from the client model, using the request ID in the
+            header of each response, rather than a single response.
+            Defaults to False.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
@@ -20,13 +27,18 @@ class ClientResponseDriver(ConnectionDriver):
             server response driver.
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        persistent_response (bool): If True, the client model receives
+            responses to all of its requests via a single persistent
+            response comm.
 
     """
 
     _connection_type = None
+    _can_batch = False
 
     def __init__(self, model_response_address, request_name=None,
-                 comm=None, msg_id=None, **kwargs):
+                 comm=None, msg_id=None, persistent_response=False,
+                 **kwargs):
         if msg_id is None:
             msg_id = str(uuid.uuid4())
         response_name = 'ClientResponse.%s' % msg_id
@@ -37,6 +49,9 @@ class ClientResponseDriver(ConnectionDriver):
         icomm_kws['comm'] = comm
         icomm_kws['name'] = response_name
         icomm_kws['is_response_client'] = True
+        if persistent_response:
+            icomm_kws.update(import_component(
+                'comm', comm).shared_address_kwargs('recv'))
         kwargs['icomm_kws'] = icomm_kws
         # Output communicator
         ocomm_kws = kwargs.get('ocomm_kws', {})
@@ -44,14 +59,51 @@ class ClientResponseDriver(ConnectionDriver):
         ocomm_kws['name'] = 'client_model_response.' + msg_id
         if model_response_address is not None:
             ocomm_kws['address'] = model_response_address
+        if persistent_response:
+            ocomm_kws.update(import_component(
+                'comm', None).shared_address_kwargs('send'))
         kwargs['ocomm_kws'] = ocomm_kws
         # Overall keywords
-        kwargs['single_use'] = True
+        kwargs['single_use'] = (not persistent_response)
         super(ClientResponseDriver, self).__init__(response_name, **kwargs)
         self.comm = comm
         self.msg_id = msg_id
+        self.persistent_response = persistent_response
 
     @property
     def response_address(self):
         r"""str: Address of response comm."""
         return self.icomm.address
+
+    def send_message(self, *args, **kwargs):
+        r"""Send a single message with the ID of the request that it is a
+        response to in the header.
+
+        Args:
+            *args: Arguments are passed to parent class send_message.
+            **kwargs: Keyword arguments are passed to parent class send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if not kwargs.get('is_eof', False):
+            if self.persistent_response:
+                request_id = self._last_header['request_id']
+            else:
+                request_id = self.msg_id
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault('request_id', request_id)
+        return super(ClientResponseDriver, self).send_message(*args, **kwargs)
+
+    def send_eof(self):
+        r"""Send EOF message. Persistent response drivers do not send EOF
+        as the client model response comm is shared between requests.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if self.persistent_response:
+            return False
+        return super(ClientResponseDriver, self).send_eof()
@@ -3,11 +3,18 @@ import re
 import six
 import copy
 import glob
+import hashlib
+import filecmp
+import tempfile
+import threading
 import logging
 import subprocess
 import shutil
+import contextlib
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from yggdrasil import platform, tools, scanf
+from yggdrasil.config import ygg_cfg
 from yggdrasil.drivers.ModelDriver import ModelDriver, remove_products
 from yggdrasil.components import import_component
 
@@ -24,6 +31,15 @@ if _conda_prefix is not None:
     _system_suffix += '_' + os.path.basename(_conda_prefix)
 if _venv_prefix is not None:
     _system_suffix += '_' + os.path.basename(_venv_prefix)
+_build_cache_include_regex = re.compile(
+    r'^[ \t]*(?:#[ \t]*include|include)[ \t]*[<"\']([^>"\']+)[>"\']',
+    re.MULTILINE | re.IGNORECASE)
+_build_cache_executables = {}
+_dependency_locks = {}
+_dependency_locks_guard = threading.Lock()
+_dependency_lock_dir = os.path.join(tempfile.gettempdir(),
+                                    'yggdrasil_dependency_locks')
+_held_dependency_lock_files = set()
 
 
 def get_compatible_tool(tool, tooltype, language):
@@ -160,6 +176,317 @@ def get_compilation_tool(tooltype, name, default=False):
     return default
 
 
+def get_build_cache_dir(cfg=None):
+    r"""Determine the directory where compilation products should be
+    cached between runs.
+
+    Args:
+        cfg (:class:`yggdrasil.config.YggConfigParser`, optional): Config
+            parser that the option should be read from. Defaults to
+            :data:`yggdrasil.config.ygg_cfg`.
+
+    Returns:
+        str: Full path to the cache directory or None if products should
+            not be cached.
+
+    """
+    if cfg is None:
+        cfg = ygg_cfg
+    out = cfg.get('general', 'build_cache', None)
+    if (out is None) or (str(out).lower() in ['false', '0', 'none']):
+        return None
+    if str(out).lower() in ['true', '1']:
+        out = os.path.join('~', '.yggdrasil', 'build_cache')
+    return os.path.abspath(os.path.expanduser(str(out)))
+
+
+def get_file_hash(fname, hasher=None):
+    r"""Hash the contents of a file.
+
+    Args:
+        fname (str): Full path to the file.
+        hasher (hashlib._Hash, optional): Existing hash that the contents
+            should be added to. Defaults to None and a new sha256 hash is
+            created.
+
+    Returns:
+        str: Hex digest of the file contents.
+
+    """
+    if hasher is None:
+        hasher = hashlib.sha256()
+    with open(fname, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(2**20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def get_executable_hash(executable):
+    r"""Get a string identifying the installed version of an executable
+    from the resolved path, size, and modification time of the executable
+    file. Results are cached for the duration of the process.
+
+    Args:
+        executable (str): Name of (or path to) the executable.
+
+    Returns:
+        str: Identifier for the executable.
+
+    """
+    if executable not in _build_cache_executables:
+        path = shutil.which(executable) or executable
+        path = os.path.realpath(path)
+        if os.path.isfile(path):
+            st = os.stat(path)
+            out = '%s:%d:%d' % (path, st.st_size, int(st.st_mtime))
+        else:  # pragma: debug
+            out = path
+        _build_cache_executables[executable] = out
+    return _build_cache_executables[executable]
+
+
+def find_included_files(fname, include_dirs, found=None):
+    r"""Recursively locate files included by a source file via C style
+    #include directives or Fortran include statements. Included files that
+    cannot be found relative to the including file or in include_dirs
+    (e.g. system headers) are ignored.
+
+    Args:
+        fname (str): Full path to the source file.
+        include_dirs (list): Directories that should be searched for
+            included files.
+        found (list, optional): Existing list that located files should be
+            added to. Defaults to None and a new list is created.
+
+    Returns:
+        list: Full paths to included files in the order they were found.
+
+    """
+    if found is None:
+        found = []
+    try:
+        with open(fname, 'r', errors='ignore') as fd:
+            contents = fd.read()
+    except (IOError, OSError):  # pragma: debug
+        return found
+    search_dirs = [os.path.dirname(fname)] + include_dirs
+    for x in _build_cache_include_regex.findall(contents):
+        for d in search_dirs:
+            ifile = os.path.normpath(os.path.join(d, x))
+            if os.path.isfile(ifile):
+                if ifile not in found:
+                    found.append(ifile)
+                    find_included_files(ifile, include_dirs, found=found)
+                break
+    return found
+
+
+def fetch_build_product(cache_dir, key, out):
+    r"""Copy a cached compilation product to its destination.
+
+    Args:
+        cache_dir (str): Directory containing cached products.
+        key (str): Key identifying the product.
+        out (str): Full path to where the product should be copied.
+
+    Returns:
+        bool: True if the product was cached, False otherwise.
+
+    """
+    cached = os.path.join(cache_dir, key[:2], key)
+    if not os.path.isfile(cached):
+        return False
+    if os.path.isfile(out) and filecmp.cmp(cached, out, shallow=False):
+        return True
+    # Copy to a temporary file & then rename so that models compiling
+    # the same product at the same time never see a partial file
+    out_dir = os.path.dirname(os.path.abspath(out))
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=out_dir, prefix='.ygg_cache_')
+    os.close(fd)
+    try:
+        shutil.copy2(cached, tmp)
+        os.replace(tmp, out)
+    except BaseException:  # pragma: debug
+        if os.path.isfile(tmp):
+            os.remove(tmp)
+        raise
+    return True
+
+
+def store_build_product(cache_dir, key, out):
+    r"""Add a compilation product to the cache.
+
+    Args:
+        cache_dir (str): Directory containing cached products.
+        key (str): Key identifying the product.
+        out (str): Full path to the product.
+
+    """
+    cached_dir = os.path.join(cache_dir, key[:2])
+    os.makedirs(cached_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cached_dir, prefix='.tmp_')
+    os.close(fd)
+    try:
+        shutil.copy2(out, tmp)
+        os.replace(tmp, os.path.join(cached_dir, key))
+    except BaseException:  # pragma: debug
+        if os.path.isfile(tmp):
+            os.remove(tmp)
+        raise
+
+
+def get_dependency_lock(key):
+    r"""Get the lock that should be held while compiling an internal
+    library so that the same library is not compiled by more than one
+    thread at a time.
+
+    Args:
+        key (tuple): Key identifying the library.
+
+    Returns:
+        threading.RLock: Lock for the library.
+
+    """
+    with _dependency_locks_guard:
+        if key not in _dependency_locks:
+            _dependency_locks[key] = threading.RLock()
+        return _dependency_locks[key]
+
+
+def lock_file(fd):
+    r"""Block until an exclusive lock is acquired on an open file. The lock
+    is released when the file is closed or by unlock_file.
+
+    Args:
+        fd (file): Open file object.
+
+    """
+    if platform._is_win:  # pragma: windows
+        import msvcrt
+        fd.seek(0)
+        while True:
+            try:
+                msvcrt.locking(fd.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                # LK_LOCK gives up after 10 attempts
+                pass
+    else:
+        import fcntl
+        fcntl.flock(fd.fileno(), fcntl.LOCK_EX)
+
+
+def unlock_file(fd):
+    r"""Release a lock acquired by lock_file.
+
+    Args:
+        fd (file): Open file object.
+
+    """
+    if platform._is_win:  # pragma: windows
+        import msvcrt
+        fd.seek(0)
+        msvcrt.locking(fd.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd.fileno(), fcntl.LOCK_UN)
+
+
+def get_dependency_lock_file(key):
+    r"""Get the name of the file that is locked while compiling an internal
+    library so that the same library is not compiled by more than one
+    process at a time.
+
+    Args:
+        key (tuple): Key identifying the library.
+
+    Returns:
+        str: Full path to the lock file.
+
+    """
+    return os.path.join(
+        _dependency_lock_dir,
+        hashlib.sha1(repr(key).encode('utf-8')).hexdigest() + '.lock')
+
+
+@contextlib.contextmanager
+def dependency_lock(key):
+    r"""Context manager that holds the lock for compiling an internal
+    library in this process (see get_dependency_lock) along with a lock file
+    so that the library is not compiled by more than one process at a time
+    (e.g. by several yggrun processes using the same installation).
+
+    Args:
+        key (tuple): Key identifying the library.
+
+    """
+    lock_name = get_dependency_lock_file(key)
+    with get_dependency_lock(key):
+        if lock_name in _held_dependency_lock_files:
+            # Already held by this thread
+            yield
+            return
+        os.makedirs(_dependency_lock_dir, exist_ok=True)
+        with open(lock_name, 'a') as fd:
+            lock_file(fd)
+            _held_dependency_lock_files.add(lock_name)
+            try:
+                yield
+            finally:
+                _held_dependency_lock_files.discard(lock_name)
+                unlock_file(fd)
+
+
+def run_compilation_tasks(tasks, nproc=1):
+    r"""Run compilation tasks using a bounded pool of threads. Tasks are
+    started once all of the tasks they depend on have completed.
+
+    Args:
+        tasks (OrderedDict): Mapping from task key to a tuple of the keys for
+            tasks that must be completed first, the function that should be
+            called, and the arguments and keyword arguments for the function
+            (see CompiledModelDriver.get_dependency_tasks).
+        nproc (int, optional): Maximum number of tasks that should be run at
+            once. If None, the number of CPUs is used. Defaults to 1 and
+            tasks are run sequentially in the order they were added.
+
+    Returns:
+        dict: Mapping from task key to the value returned by the task.
+
+    Raises:
+        RuntimeError: If there are circular dependencies between tasks.
+
+    """
+    if nproc is None:
+        nproc = os.cpu_count() or 1
+    results = {}
+    if nproc <= 1:
+        for k, (prereqs, func, args, kwargs) in tasks.items():
+            results[k] = func(*args, **kwargs)
+        return results
+    pending = OrderedDict(tasks)
+    running = {}
+    with ThreadPoolExecutor(max_workers=nproc) as executor:
+        while pending or running:
+            for k in list(pending.keys()):
+                if len(running) >= nproc:
+                    break
+                if all((x in results) or (x not in tasks)
+                       for x in pending[k][0]):
+                    _, func, args, kwargs = pending.pop(k)
+                    running[executor.submit(func, *args, **kwargs)] = k
+            if not running:
+                raise RuntimeError("Circular dependencies between "
+                                   "compilation tasks: %s"
+                                   % list(pending.keys()))
+            done, _ = wait(list(running.keys()),
+                           return_when=FIRST_COMPLETED)
+            for f in done:
+                results[running.pop(f)] = f.result()
+    return results
+
+
 # TODO: Cannot currently make compilation tools components because
 # of circular imports
 class CompilationToolMeta(type):
@@ -974,6 +1301,88 @@ class CompilationToolBase(object):
                 if isrc in products:  # pragma: debug
                     products.remove(isrc)
 
+    @classmethod
+    def supports_build_cache(cls):
+        r"""Determine if products of this tool can be cached between runs.
+        Tools that produce products in addition to the output file (e.g.
+        Fortran module files) and build tools are not cached.
+
+        Returns:
+            bool: True if products can be cached, False otherwise.
+
+        """
+        return not (cls.is_build_tool or cls.product_exts
+                    or cls.product_files)
+
+    @classmethod
+    def get_build_cache_key(cls, args, out, cmd, working_dir=None):
+        r"""Determine the key that should be used to cache the product of
+        a command. The key is a hash of the tool executable, the command
+        line flags, and the contents of the input files, any files they
+        include, and any libraries linked via -l that can be located.
+        Paths to the input & output files are not included so that
+        products can be reused between working directories.
+
+        Args:
+            args (list): Input files passed to the tool.
+            out (str): Full path to the output file.
+            cmd (list): Complete command that will be run.
+            working_dir (str, optional): Working directory that the command
+                will be run in. Defaults to None and the current working
+                directory is used.
+
+        Returns:
+            str: Hex digest key for the product.
+
+        """
+        if working_dir is None:
+            working_dir = os.getcwd()
+
+        def to_path(x):
+            return os.path.normpath(os.path.join(working_dir, x))
+
+        hasher = hashlib.sha256()
+        hasher.update(('%s:%s:%s:%s\0' % (
+            cls.tooltype, cls.toolname, get_executable_hash(cmd[0]),
+            os.path.splitext(out)[-1])).encode('utf-8'))
+        include_dirs = []
+        library_dirs = []
+        libraries = []
+        inputs = []
+        prev = None
+        for x in cmd[1:]:
+            if prev in ['-I', '/I']:
+                include_dirs.append(to_path(x))
+            elif prev == '-L':
+                library_dirs.append(to_path(x))
+            elif x.startswith(('-I', '/I')) and (len(x) > 2):
+                include_dirs.append(to_path(x[2:]))
+            elif x.startswith('-L') and (len(x) > 2):
+                library_dirs.append(to_path(x[2:]))
+            elif x.startswith('-l') and (len(x) > 2):
+                libraries.append(x[2:])
+            prev = x
+            if out in x:
+                x = x.replace(out, '<out>')
+            elif ((not x.startswith('-')) and (x not in [out, ''])
+                  and os.path.isfile(to_path(x))):
+                inputs.append(to_path(x))
+                x = '<file%d>' % len(inputs)
+            hasher.update((x + '\0').encode('utf-8'))
+        if cls.tooltype == 'compiler':
+            for x in list(inputs):
+                inputs += [y for y in find_included_files(x, include_dirs)
+                           if y not in inputs]
+        for x in libraries:
+            for d in library_dirs:
+                for fmt in ['lib%s.a', 'lib%s.so', 'lib%s.dylib', '%s.lib']:
+                    ilib = os.path.join(d, fmt % x)
+                    if os.path.isfile(ilib) and (ilib not in inputs):
+                        inputs.append(ilib)
+        for x in inputs:
+            hasher.update(get_file_hash(x).encode('utf-8'))
+        return hasher.hexdigest()
+
     @classmethod
     def call(cls, args, language=None, toolname=None, skip_flags=False,
              dry_run=False, out=None, overwrite=False, products=None,
@@ -1004,7 +1413,10 @@ class CompilationToolBase(object):
                 be ignored if skip_flags is True.
             overwrite (bool, optional): If True, the existing compile file will
                 be overwritten. Otherwise, it will be kept and this function
-                will return without recompiling the source file.
+                will return without recompiling the source file. If the build
+                cache is enabled (see get_build_cache_dir), the output file is
+                instead replaced by the cached product for the current
+                inputs & flags when one exists.
             products (list, optional): Existing Python list that additional
                 products produced by the compilation should be appended to.
                 Defaults to None and is ignored.
@@ -1042,6 +1454,7 @@ class CompilationToolBase(object):
         if additional_args is not None:
             args = args + additional_args
         # Process arguments only valid if skip_flags is False
+        cache_dir = None
         if (not skip_flags):
             if products is None:
                 products = []
@@ -1058,7 +1471,12 @@ class CompilationToolBase(object):
                 cls.remove_products(args, out)
                 if os.path.isfile(out) or os.path.isdir(out):  # pragma: debug
                     raise RuntimeError("Product not removed: %s" % out)
-            if (not dry_run) and (os.path.isfile(out) or os.path.isdir(out)):
+            if (((not dry_run) and (out != 'clean')
+                 and (not os.path.isdir(out))
+                 and cls.supports_build_cache())):
+                cache_dir = get_build_cache_dir()
+            if (((cache_dir is None) and (not dry_run)
+                 and (os.path.isfile(out) or os.path.isdir(out)))):
                 cls.append_product(products, args, out)
                 return out
             kwargs['outfile'] = out
@@ -1067,6 +1485,15 @@ class CompilationToolBase(object):
         cmd = cls.get_executable_command(args, skip_flags=skip_flags,
                                          unused_kwargs=unused_kwargs,
                                          cwd=working_dir, **kwargs)
+        # Use the cached product if the inputs & flags are unchanged
+        if cache_dir is not None:
+            cache_key = cls.get_build_cache_key(args, out, cmd,
+                                                working_dir=working_dir)
+            if fetch_build_product(cache_dir, cache_key, out):
+                logger.debug("%s %s used cached product for %s"
+                             % (cls.tooltype.title(), cls.toolname, out))
+                cls.append_product(products, args, out)
+                return out
         # Return if dry run, adding potential output to product
         if dry_run:
             if skip_flags:
@@ -1087,6 +1514,9 @@ class CompilationToolBase(object):
             if (proc.returncode != 0) and (not allow_error):
                 raise RuntimeError("Command '%s' failed with code %d:\n%s."
                                    % (' '.join(cmd), proc.returncode, output))
+            if proc.returncode != 0:
+                # Don't cache products of a failed command
+                cache_dir = None
             try:
                 logger.debug(' '.join(cmd) + '\n' + output)
             except UnicodeDecodeError:  # pragma: debug
@@ -1095,6 +1525,7 @@ class CompilationToolBase(object):
             if not allow_error:
                 raise RuntimeError("Could not call command '%s': %s"
                                    % (' '.join(cmd), e))
+            cache_dir = None
         # Check for output
         if (not skip_flags):
             if (out != 'clean'):
@@ -1106,6 +1537,8 @@ class CompilationToolBase(object):
                                        % (cls.tooltype.title(), cls.toolname, out))
                 logger.debug("%s %s produced %s"
                              % (cls.tooltype.title(), cls.toolname, out))
+                if (cache_dir is not None) and os.path.isfile(out):
+                    store_build_product(cache_dir, cache_key, out)
                 cls.append_product(products, args, out)
             return out
         return output
@@ -2040,10 +2473,7 @@ class CompiledModelDriver(ModelDriver):
         super(CompiledModelDriver, self).__init__(name, args, **kwargs)
         # Compile
         if not skip_compile:
-            self.compile_model()
-            self.products.append(self.model_file)
-            assert(os.path.isfile(self.model_file))
-            self.debug("Compiled %s", self.model_file)
+            self.build_model()
 
     @staticmethod
     def after_registration(cls, **kwargs):
@@ -3416,11 +3846,40 @@ class CompiledModelDriver(ModelDriver):
         return out
         
     @classmethod
-    def compile_dependencies(cls, toolname=None, dep=None, **kwargs):
-        r"""Compile any required internal libraries, including the interface."""
+    def get_dependency_tasks(cls, toolname=None, dep=None, tasks=None,
+                             **kwargs):
+        r"""Get the compilation tasks required to compile internal libraries,
+        including the interface, without running them.
+
+        Args:
+            toolname (str, optional): Name of compiler tool that should be
+                used. Defaults to None and the default compiler for the
+                language will be used.
+            dep (str, optional): Internal library that should be compiled
+                along with its dependencies. Defaults to None and the
+                interface library is used.
+            tasks (OrderedDict, optional): Existing tasks that new tasks
+                should be added to. Tasks that are already present are not
+                duplicated. Defaults to None and a new OrderedDict is
+                created.
+            **kwargs: Additional keyword arguments are passed to
+                call_compiler for each task.
+
+        Returns:
+            tuple(OrderedDict, list): Mapping from task key to a tuple of
+                the keys for tasks that must be completed first, the
+                function that should be called, and the arguments and
+                keyword arguments for the function; and the keys for the
+                tasks required by dep. Tasks are ordered such that they can
+                be run sequentially.
+
+        """
         if dep is None:
             dep = cls.interface_library
+        if tasks is None:
+            tasks = OrderedDict()
         kwargs.setdefault('products', [])
+        required = []
         base_libraries = []
         compiler = cls.get_tool('compiler', toolname=toolname)
         for x in cls.base_languages:
@@ -3429,17 +3888,58 @@ class CompiledModelDriver(ModelDriver):
                 toolname = get_compatible_tool(compiler, 'compiler', x).toolname
             base_cls = import_component('model', x)
             base_libraries.append(base_cls.interface_library)
-            base_cls.compile_dependencies(toolname=toolname, **kwargs)
+            required += [x for x in base_cls.get_dependency_tasks(
+                toolname=toolname, tasks=tasks, **kwargs)[1]
+                if x not in required]
+        base_required = list(required)
         if (dep is not None) and cls.is_installed() and (dep not in base_libraries):
+            dep_keys = {}
             dep_order = cls.get_dependency_order(dep, toolname=toolname)
             for k in dep_order[::-1]:
                 if isinstance(k, tuple):
                     assert(len(k) == 2)
                     ikw = dict(kwargs, language=k[0],
                                toolname=get_compatible_tool(compiler, 'compiler', k[0]))
-                    cls.call_compiler(k[1], **ikw)
+                    ikey = (k[0], ikw['toolname'].toolname, k[1])
+                    iargs = (k[1], )
                 else:
-                    cls.call_compiler(k, toolname=toolname, **kwargs)
+                    ikw = dict(kwargs, toolname=toolname)
+                    ikey = (cls.language,
+                            cls.get_tool('compiler', toolname=toolname,
+                                         return_prop='name'), k)
+                    iargs = (k, )
+                dep_keys[k] = ikey
+                if ikey not in tasks:
+                    prereqs = base_required + [
+                        dep_keys[x] for x in
+                        cls.get_dependency_order(k, toolname=toolname)[1:]
+                        if x in dep_keys]
+                    tasks[ikey] = (prereqs, cls.call_compiler, iargs, ikw)
+                if ikey not in required:
+                    required.append(ikey)
+        return tasks, required
+
+    @classmethod
+    def compile_dependencies(cls, toolname=None, dep=None, nproc=1, **kwargs):
+        r"""Compile any required internal libraries, including the interface.
+
+        Args:
+            toolname (str, optional): Name of compiler tool that should be
+                used. Defaults to None and the default compiler for the
+                language will be used.
+            dep (str, optional): Internal library that should be compiled
+                along with its dependencies. Defaults to None and the
+                interface library is used.
+            nproc (int, optional): Maximum number of libraries that should
+                be compiled at once. Defaults to 1 and libraries are compiled
+                sequentially in dependency order.
+            **kwargs: Additional keyword arguments are passed to
+                call_compiler for each library.
+
+        """
+        tasks = cls.get_dependency_tasks(toolname=toolname, dep=dep,
+                                         **kwargs)[0]
+        run_compilation_tasks(tasks, nproc=nproc)
 
     @classmethod
     def cleanup_dependencies(cls, products=None, verbose=False, **kwargs):
@@ -3462,7 +3962,7 @@ class CompiledModelDriver(ModelDriver):
             products=products, verbose=verbose)
 
     def compile_model(self, source_files=None, skip_interface_flags=False,
-                      **kwargs):
+                      skip_dependencies=False, **kwargs):
         r"""Compile model executable(s).
 
         Args:
@@ -3471,6 +3971,10 @@ class CompiledModelDriver(ModelDriver):
             skip_interface_flags (bool, optional): If True, interface flags will
                 not be added. This includes the logger flag specifying the
                 current logging level. Defaults to False.
+            skip_dependencies (bool, optional): If True, the internal
+                libraries that the model depends on are not compiled first
+                because they were already compiled (e.g. by the tasks from
+                get_build_tasks). Defaults to False.
             **kwargs: Keyword arguments are passed on to the call_compiler
                 method.
 
@@ -3499,13 +4003,48 @@ class CompiledModelDriver(ModelDriver):
             kwargs['env'] = self.set_env(for_compile=True,
                                          toolname=kwargs['toolname'])
         try:
-            if not kwargs.get('dry_run', False):
+            if not (skip_dependencies or kwargs.get('dry_run', False)):
                 self.compile_dependencies(toolname=kwargs['toolname'])
             return self.call_compiler(source_files, **kwargs)
         except BaseException:
             self.cleanup_products()
             raise
 
+    def build_model(self, **kwargs):
+        r"""Compile the model executable, adding it to the products.
+
+        Args:
+            **kwargs: Keyword arguments are passed to compile_model.
+
+        """
+        self.compile_model(**kwargs)
+        self.products.append(self.model_file)
+        assert(os.path.isfile(self.model_file))
+        self.debug("Compiled %s", self.model_file)
+
+    def get_build_tasks(self, tasks=None):
+        r"""Get the compilation tasks required to build the model and the
+        internal libraries it depends on without running them.
+
+        Args:
+            tasks (OrderedDict, optional): Existing tasks that new tasks
+                should be added to. Defaults to None and a new OrderedDict is
+                created.
+
+        Returns:
+            OrderedDict: Mapping from task key to a tuple of the keys for
+                tasks that must be completed first, the function that should
+                be called, and the arguments and keyword arguments for the
+                function.
+
+        """
+        tasks, required = self.get_dependency_tasks(
+            toolname=self.get_tool_instance('compiler', return_prop='name'),
+            tasks=tasks)
+        tasks[('model', self.name)] = (required, self.build_model, (),
+                                       {'skip_dependencies': True})
+        return tasks
+
     @classmethod
     def get_internal_suffix(cls, commtype=None):
         r"""Determine the suffix that should be used for internal libraries.
@@ -3606,7 +4145,10 @@ class CompiledModelDriver(ModelDriver):
                     kwargs['archiver_language'] = kwargs.pop('linker_language')
             kwargs['suffix'] = cls.get_internal_suffix(
                 commtype=kwargs.get('commtype', None))
-            return cls.call_compiler(src, toolname=toolname, **kwargs)
+            lock_key = (cls.language, dep, kwargs.get('out', None),
+                        kwargs['libtype'], kwargs['suffix'])
+            with dependency_lock(lock_key):
+                return cls.call_compiler(src, toolname=toolname, **kwargs)
         # Compile using the compiler after updating the flags
         kwargs = cls.update_compiler_kwargs(toolname=toolname, **kwargs)
         tool = cls.get_tool('compiler', toolname=toolname)
@@ -140,6 +140,24 @@ class ConnectionDriver(Driver):
         onexit (str, optional): Class method that should be called when a
             model that the connection interacts with exits, but before the
             connection driver is shut down. Defaults to None.
+        batch (int, optional): Maximum number of messages that should be
+            sent together under a single header when more than one message
+            is waiting to be passed along. Defaults to 1 and messages are
+            sent individually.
+        dispatch (str, optional): Method used to determine which of the
+            output comms each message is sent to when there is more than
+            one. 'broadcast' sends every message to every output comm,
+            'round_robin' sends messages to each output comm in turn,
+            'least_outstanding' sends each message to the output comm with
+            the fewest messages waiting to be received, and 'hash' sends
+            messages with the same value of dispatch_field to the same
+            output comm. EOF messages are always sent to every output comm.
+            Defaults to 'broadcast'.
+        dispatch_field (str, int, optional): Key or index of the element
+            in messages that should be hashed when dispatch is 'hash'. If a
+            name is provided and messages are lists or tuples, the name is
+            converted to an index using the field names for the channel.
+            Defaults to None and the entire message is hashed.
         **kwargs: Additonal keyword arguments are passed to the parent class.
 
     Attributes:
@@ -160,6 +178,16 @@ class ConnectionDriver(Driver):
             loop.
         onexit (str): Class method that should be called when the corresponding
             model exits, but before the driver is shut down.
+        batch (int): Maximum number of messages that will be sent together
+            under a single header.
+        dispatch (str): Method used to determine which of the output comms
+            each message is sent to.
+        dispatch_field (str, int): Key or index of the element in messages
+            that is hashed when dispatch is 'hash'.
+
+    Class Attributes:
+        _can_batch (bool): True if messages passed by the driver can be
+            sent in batches.
 
     """
 
@@ -173,6 +201,7 @@ class ConnectionDriver(Driver):
                                    'and one or more comms/files.')
     _schema_subtype_default = 'default'
     _schema_required = ['inputs', 'outputs']
+    _can_batch = True
     _schema_properties = {
         'connection_type': {'type': 'string'},  # 'default': 'default'},
         'inputs': {'type': 'array', 'minItems': 1,
@@ -199,7 +228,12 @@ class ConnectionDriver(Driver):
                        'items': {'oneOf': [
                            {'type': 'function'},
                            {'$ref': '#/definitions/transform'}]}},
-        'onexit': {'type': 'string'}}
+        'onexit': {'type': 'string'},
+        'batch': {'type': 'integer', 'default': 1},
+        'dispatch': {'type': 'string', 'default': 'broadcast',
+                     'enum': ['broadcast', 'round_robin',
+                              'least_outstanding', 'hash']},
+        'dispatch_field': {'type': ['string', 'integer']}}
     _schema_excluded_from_class_validation = ['inputs', 'outputs']
     _disconnect_attr = Driver._disconnect_attr + [
         '_comm_closed', '_skip_after_loop', 'shared', 'task_thread']
@@ -214,10 +248,15 @@ class ConnectionDriver(Driver):
         r"""bool: True if the connection is retreiving output from a model."""
         return (self._direction == 'output')
 
-    def __init__(self, name, translator=None, single_use=False, onexit=None, **kwargs):
+    def __init__(self, name, translator=None, single_use=False, onexit=None,
+                 batch=1, dispatch='broadcast', dispatch_field=None,
+                 **kwargs):
         super(ConnectionDriver, self).__init__(name, **kwargs)
         # Shared attributes (set once or synced using events)
         self.single_use = single_use
+        self.batch = batch
+        self.dispatch = dispatch
+        self.dispatch_field = dispatch_field
         self.shared = self.context.Dict()
         self.shared.update(nrecv=0, nproc=0, nsent=0, nskip=0,
                            state='started', close_state='',
@@ -292,6 +331,10 @@ class ConnectionDriver(Driver):
             elif not isinstance(x, dict):
                 comm_kws['comm'][i] = dict(comm=x)
             comm_kws['comm'][i].setdefault('comm', comm_type)
+        if ((io == 'output') and (len(comm_kws['comm']) > 1)
+                and (self.dispatch != 'broadcast')):
+            comm_kws['dispatch'] = self.dispatch
+            comm_kws['dispatch_field'] = self.dispatch_field
         any_files = False
         all_files = True
         if not touches_model:
@@ -916,6 +959,51 @@ class ConnectionDriver(Driver):
         #         self.icomm.close()
         return flag
 
+    def recv_batch(self, msg):
+        r"""Receive and process messages that are already waiting so that
+        they can be sent in a batch with the provided message.
+
+        Args:
+            msg (object): Processed message that starts the batch.
+
+        Returns:
+            list: Processed messages in the batch.
+
+        """
+        out = [msg]
+        while (len(out) < self.batch) and self.icomm.wait_for_recv(0):
+            msg = self.recv_message()
+            if (msg is False) or self.icomm.is_empty_recv(msg):
+                break
+            self.nrecv += 1
+            msg = self.on_message(msg)
+            if msg is False:  # pragma: debug
+                break
+            elif self.ocomm.is_empty_send(msg):
+                self.nskip += 1
+                continue
+            self.nproc += 1
+            out.append(msg)
+        return out
+
+    def send_batch(self, msgs):
+        r"""Send a batch of messages.
+
+        Args:
+            msgs (list): Messages to send.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        assert(self.in_process)
+        self.debug('Sending batch of %d messages', len(msgs))
+        with self.lock:
+            self._used = True
+            if self.ocomm.is_closed:
+                return False
+        return self.ocomm.send_batch(msgs)
+
     def set_close_state(self, state):
         r"""Set the close state if its not already set."""
         out = False
@@ -966,7 +1054,7 @@ class ConnectionDriver(Driver):
         if self.icomm.is_empty_recv(msg):
             self.state = 'waiting'
             self.verbose_debug(':run: Waiting for next message.')
-            self.sleep()
+            self.icomm.wait_for_recv(self.sleeptime)
             return
         self.nrecv += 1
         self.state = 'received'
@@ -995,13 +1083,20 @@ class ConnectionDriver(Driver):
         self.state = 'processed'
         self.debug('Processed message.')
         # Send a message
+        if self._can_batch and (self.batch > 1) and self._first_send_done:
+            msgs = self.recv_batch(msg)
+        else:
+            msgs = [msg]
         self.state = 'sending'
-        ret = self.send_message(msg)
+        if len(msgs) > 1:
+            ret = self.send_batch(msgs)
+        else:
+            ret = self.send_message(msg)
         if ret is False:
             self.error('Could not send message.')
             self.set_break_flag()
             self.set_close_state('sending')
             return
-        self.nsent += 1
+        self.nsent += len(msgs)
         self.state = 'sent'
         self.debug('Sent message to %s.', self.ocomm.address)
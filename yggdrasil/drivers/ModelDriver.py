@@ -122,6 +122,11 @@ class ModelDriver(Driver):
             There will be one channel created for each server the model is a
             client of. Defaults to empty list. Use of `client_of` with `function`
             is not currently supported.
+        persistent_response (bool, optional): If True, the RPC clients
+            created by the model receive the responses to all of their
+            requests via a single long-lived response comm and responses are
+            matched to requests by request ID. Defaults to False and a new
+            response comm is created for each request.
         timesync (bool, str, optional): If set, the model is assumed to
             call a send then receive of the state at each timestep
             for syncronization with other models that are also
@@ -241,6 +246,8 @@ class ModelDriver(Driver):
             names in the dict will be replaced with a server.
         client_of (list): The names of server models that this model is a
             client of.
+        persistent_response (bool): If True, the RPC clients created by the
+            model receive responses via a single long-lived response comm.
         timesync (str): If set, the name of the server performing
             timestep synchronization for the model.
         with_strace (bool): If True, the command is run with strace or dtrace.
@@ -309,6 +316,7 @@ class ModelDriver(Driver):
                       'default': False},
         'client_of': {'type': 'array', 'items': {'type': 'string'},
                       'default': []},
+        'persistent_response': {'type': 'boolean', 'default': False},
         'timesync': {
             'anyOf': [
                 {'type': 'boolean'}, {'type': 'string'},
@@ -1179,6 +1187,8 @@ class ModelDriver(Driver):
         env['YGG_PYTHON_EXEC'] = sys.executable
         env['YGG_DEFAULT_COMM'] = tools.get_default_comm()
         env['YGG_NCLIENTS'] = str(len(self.clients))
+        if self.persistent_response:
+            env['YGG_PERSISTENT_RESPONSE'] = 'True'
         if isinstance(self.is_server, dict):
             env['YGG_SERVER_INPUT'] = self.is_server['input']
             env['YGG_SERVER_OUTPUT'] = self.is_server['output']
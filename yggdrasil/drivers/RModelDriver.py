@@ -1,10 +1,9 @@
 import re
 import os
 import numpy as np
-import pandas as pd
 import logging
 from collections import OrderedDict
-from yggdrasil import serialize, platform
+from yggdrasil import serialize, platform, tools
 from yggdrasil.drivers.InterpretedModelDriver import InterpretedModelDriver
 from yggdrasil.drivers.PythonModelDriver import PythonModelDriver
 from yggdrasil.drivers.CModelDriver import CModelDriver
@@ -224,7 +223,7 @@ class RModelDriver(InterpretedModelDriver):  # pragma: R
                     for k, v in pyobj.items()}
         elif isinstance(pyobj, np.string_):
             return pyobj.decode("utf-8")
-        elif isinstance(pyobj, pd.DataFrame):
+        elif isinstance(pyobj, tools.DeferredDataFrame):
             # R dosn't have int64 and will cast 64bit ints as floats if passed
             # without casting them to int32 first
             for n in pyobj.columns:
@@ -24,12 +24,17 @@ class ServerRequestDriver(ConnectionDriver):
             with the server driver. Defaults to tools.get_default_comm().
         comm_address (str): Address for the client request driver.
         response_drivers (list): Response drivers created for each request.
+        persistent_response_drivers (dict): Response drivers that forward
+            responses to all requests from a client using a persistent
+            response comm, keyed by the address of the client response
+            driver.
         nclients (int): Number of clients signed on.
 
     """
 
     _connection_type = None
     _direction = 'input'
+    _can_batch = False
 
     def __init__(self, model_request_name, request_name=None,
                  comm=None, comm_address=None, **kwargs):
@@ -54,6 +59,7 @@ class ServerRequestDriver(ConnectionDriver):
         super(ServerRequestDriver, self).__init__(model_request_name, **kwargs)
         self.env[self.ocomm.name] = self.ocomm.address
         self.response_drivers = []
+        self.persistent_response_drivers = {}
         self.nclients = 0
         self.comm = comm
         self.comm_address = self.icomm.address  # opp_address
@@ -103,6 +109,7 @@ class ServerRequestDriver(ConnectionDriver):
                 # finish
                 x.terminate()
             self.response_drivers = []
+            self.persistent_response_drivers = {}
 
     def close_comm(self):
         r"""Close response drivers."""
@@ -175,25 +182,38 @@ class ServerRequestDriver(ConnectionDriver):
         # Start response driver
         is_eof = kwargs.get('is_eof', False)
         if not is_eof:
-            self.debug("Starting new ServerResponseDriver at: %s" %
-                       self.response_address)
             with self.lock:
                 if (not self.is_comm_open) or self._block_response:  # pragma: debug
                     self.debug("Comm closed, not creating response driver.")
                     return False
-                drv_args = [self.response_address]
-                drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
-                                  request_name=self.name)
-                try:
-                    response_driver = ServerResponseDriver(*drv_args, **drv_kwargs)
-                    self.response_drivers.append(response_driver)
-                    response_driver.start()
-                    self.debug("ServerResponseDriver started.")
-                except BaseException:  # pragma: debug
-                    self.exception("Could not create/start response driver.")
-                    return False
+                persistent = self.last_header.get('persistent_response', False)
+                response_driver = None
+                if persistent:
+                    response_driver = self.persistent_response_drivers.get(
+                        self.response_address, None)
+                if response_driver is None:
+                    self.debug("Starting new ServerResponseDriver at: %s" %
+                               self.response_address)
+                    drv_args = [self.response_address]
+                    drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
+                                      request_name=self.name,
+                                      persistent_response=persistent)
+                    try:
+                        response_driver = ServerResponseDriver(*drv_args,
+                                                               **drv_kwargs)
+                        self.response_drivers.append(response_driver)
+                        response_driver.start()
+                        self.debug("ServerResponseDriver started.")
+                    except BaseException:  # pragma: debug
+                        self.exception("Could not create/start response driver.")
+                        return False
+                    if persistent:
+                        self.persistent_response_drivers[
+                            self.response_address] = response_driver
             # Send response address in header
             kwargs.setdefault('header_kwargs', {})
+            if persistent:
+                kwargs['header_kwargs'].setdefault('persistent_response', True)
             kwargs['header_kwargs'].setdefault(
                 'response_address', response_driver.model_response_address)
             kwargs['header_kwargs'].setdefault('request_id', self.request_id)
@@ -221,3 +241,6 @@ class ServerRequestDriver(ConnectionDriver):
                     remove_idx.append(i)
             for i in remove_idx[::-1]:
                 self.response_drivers.pop(i)
+            for k, x in list(self.persistent_response_drivers.items()):
+                if not x.is_alive():
+                    self.persistent_response_drivers.pop(k)
@@ -1,4 +1,5 @@
 import uuid
+from yggdrasil.components import import_component
 from yggdrasil.drivers.ConnectionDriver import ConnectionDriver
 
 
@@ -13,6 +14,10 @@ class ServerResponseDriver(ConnectionDriver):
             tools.get_default_comm().
         msg_id (str, optional): ID associate with the request message this
             driver was created to respond to. Defaults to new unique ID.
+        persistent_response (bool, optional): If True, the driver forwards
+            responses to all requests from a client model, using the request
+            ID in the header of each response, rather than a single response.
+            Defaults to False.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
@@ -20,13 +25,16 @@ class ServerResponseDriver(ConnectionDriver):
             with the server driver. Defaults to tools.get_default_comm().
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        persistent_response (bool): If True, the driver forwards responses
+            to all requests from a client model.
 
     """
 
     _connection_type = None
+    _can_batch = False
 
     def __init__(self, response_address, comm=None, msg_id=None,
-                 request_name=None, **kwargs):
+                 request_name=None, persistent_response=False, **kwargs):
         if msg_id is None:
             msg_id = str(uuid.uuid4())
         response_name = 'ServerResponse.%s' % msg_id
@@ -37,6 +45,9 @@ class ServerResponseDriver(ConnectionDriver):
         icomm_kws['comm'] = None
         icomm_kws['name'] = 'server_model_response.' + msg_id
         icomm_kws['is_response_server'] = True
+        if persistent_response:
+            icomm_kws.update(import_component(
+                'comm', None).shared_address_kwargs('recv'))
         kwargs['icomm_kws'] = icomm_kws
         # Output communicator to client response driver
         ocomm_kws = kwargs.get('ocomm_kws', {})
@@ -44,12 +55,16 @@ class ServerResponseDriver(ConnectionDriver):
         ocomm_kws['name'] = response_name
         if response_address is not None:
             ocomm_kws['address'] = response_address
+        if persistent_response:
+            ocomm_kws.update(import_component(
+                'comm', comm).shared_address_kwargs('send'))
         kwargs['ocomm_kws'] = ocomm_kws
         # Overall keywords
-        kwargs['single_use'] = True
+        kwargs['single_use'] = (not persistent_response)
         super(ServerResponseDriver, self).__init__(response_name, **kwargs)
         self.comm = comm
         self.msg_id = msg_id
+        self.persistent_response = persistent_response
         
     @property
     def model_response_name(self):
@@ -68,3 +83,34 @@ class ServerResponseDriver(ConnectionDriver):
         r"""str: The address of the channel used to send responses to the client
         response driver."""
         return self.ocomm.address
+
+    def send_message(self, *args, **kwargs):
+        r"""Send a single message. Persistent response drivers include the
+        ID of the request that the message responds to in the header so that
+        the client response driver can route it.
+
+        Args:
+            *args: Arguments are passed to parent class send_message.
+            **kwargs: Keyword arguments are passed to parent class send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if self.persistent_response and (not kwargs.get('is_eof', False)):
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault(
+                'request_id', self._last_header['request_id'])
+        return super(ServerResponseDriver, self).send_message(*args, **kwargs)
+
+    def send_eof(self):
+        r"""Send EOF message. Persistent response drivers do not send EOF
+        as the client response comm is shared between requests.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if self.persistent_response:
+            return False
+        return super(ServerResponseDriver, self).send_eof()
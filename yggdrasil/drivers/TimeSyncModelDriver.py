@@ -1,11 +1,47 @@
 import os
-import pandas as pd
 from yggdrasil import units, tools, multitasking
 from yggdrasil.drivers.DSLModelDriver import DSLModelDriver
 
 
 _default_agg = 'mean'
 _default_interp = 'index'
+# Interpolation methods that only use the nearest valid values so that
+# an update only changes the rows between the surrounding valid rows
+_local_interp = ('index', 'values', 'linear', 'pad', 'ffill',
+                 'backfill', 'bfill')
+
+
+class TimeSyncMergeCache(object):
+    r"""Results of previous calls to TimeSyncModelDriver.merge that
+    allow the merge to be updated incrementally.
+
+    Attributes:
+        updated (set): Times that have been updated since the last merge.
+        tables (dict): Mapping from model name to the table processed
+            (interpolated, renamed, & unit converted) for the model.
+        kws (dict): Mapping from model name to the interpolation
+            keyword arguments used to process the model's table.
+        columns (dict): Mapping from model name to the columns in the
+            model's table when it was processed.
+        merged (pandas.DataFrame): Result of the last merge.
+
+    """
+
+    def __init__(self):
+        self.updated = set()
+        self.tables = {}
+        self.kws = {}
+        self.columns = {}
+        self.merged = None
+
+    def update(self, time):
+        r"""Mark a time as having been updated.
+
+        Args:
+            time (pandas.Timedelta): Time that was updated.
+
+        """
+        self.updated.add(time)
 
 
 class TimeSyncModelDriver(DSLModelDriver):
@@ -149,6 +185,7 @@ class TimeSyncModelDriver(DSLModelDriver):
                       aggregation, additional_variables, env=None):
         r"""Model wrapper."""
         from yggdrasil.languages.Python.YggInterface import YggTimesyncServer
+        import pandas as pd
         if env is not None:
             os.environ.update(env)
         rpc = YggTimesyncServer(name)
@@ -157,6 +194,7 @@ class TimeSyncModelDriver(DSLModelDriver):
         tables = {}
         table_units = {'base': {}}
         table_lock = multitasking.RLock()
+        merge_cache = TimeSyncMergeCache()
         default_agg = _default_agg
         if not isinstance(aggregation, dict):
             default_agg = aggregation
@@ -211,28 +249,16 @@ class TimeSyncModelDriver(DSLModelDriver):
                     for k in list(set(state.keys()) - set(alt_vars)):
                         aggregation.setdefault(k, default_agg)
                 # Update the state
-                if t_pd not in times:
-                    times.append(t_pd)
-                for model, table in tables.items():
-                    new_data = {'time': [t_pd]}
-                    if model == client_model:
-                        new_data.update({k: [units.get_data(v)]
-                                         for k, v in state.items()})
-                    new_data = pd.DataFrame(new_data)
-                    idx = table['time'].isin([t_pd])
-                    if not idx.any():
-                        table = table.append(new_data, sort=False)
-                    elif model == client_model:
-                        table = table.drop(table.index[idx])
-                        table = table.append(new_data, sort=False)
-                    tables[model] = table.sort_values('time')
+                cls.update_tables(tables, times, client_model, t_pd,
+                                  state, merge_cache=merge_cache)
             # Assign thread to handle checking when data is filled in
             threads[request_id] = multitasking.YggTaskLoop(
                 target=cls.response_loop,
                 args=(client_model, request_id, rpc, t_pd,
                       internal_variables, external_variables,
                       tables, table_units, table_lock,
-                      synonyms, interpolation, aggregation))
+                      synonyms, interpolation, aggregation),
+                kwargs={'merge_cache': merge_cache})
             threads[request_id].start()
         # Cleanup threads (only called if there is an error since the
         # loop will only be broken when all of the clients have signed
@@ -244,6 +270,43 @@ class TimeSyncModelDriver(DSLModelDriver):
             if v.is_alive():  # pragma: debug
                 v.terminate()
 
+    @classmethod
+    def update_tables(cls, tables, times, client_model, time, state,
+                      merge_cache=None):
+        r"""Update the tables with the state from a model at a time.
+
+        Args:
+            tables (dict): Mapping from model name to pandas DataFrames
+                containing variables supplied by the model.
+            times (list): Times that have been added to the tables.
+            client_model (str): Name of model that provided the state.
+            time (pandas.Timedelta): Time that the state is for.
+            state (dict): Mapping from variable name to value.
+            merge_cache (TimeSyncMergeCache, optional): Merge cache that
+                should be notified of the updated time. Defaults to None.
+
+        """
+        import pandas as pd
+        if time not in times:
+            times.append(time)
+        for model, table in tables.items():
+            new_data = {'time': [time]}
+            if model == client_model:
+                new_data.update({k: [units.get_data(v)]
+                                 for k, v in state.items()})
+            new_data = pd.DataFrame(new_data)
+            idx = table['time'].isin([time])
+            if not idx.any():
+                table = table.append(new_data, sort=False)
+            elif model == client_model:
+                # Rows are selected by mask rather than label as the
+                # appended rows all share the same index label
+                table = table[~idx]
+                table = table.append(new_data, sort=False)
+            tables[model] = table.sort_values('time')
+        if merge_cache is not None:
+            merge_cache.update(time)
+
     @classmethod
     def check_for_data(cls, time, tables, table_units, table_lock,
                        open_clients):
@@ -276,7 +339,8 @@ class TimeSyncModelDriver(DSLModelDriver):
     def response_loop(cls, client_model, request_id, rpc, time,
                       internal_variables, external_variables,
                       tables, table_units, table_lock,
-                      synonyms, interpolation, aggregation):
+                      synonyms, interpolation, aggregation,
+                      merge_cache=None):
         r"""Check for available data and send response if it is
         available.
 
@@ -306,6 +370,10 @@ class TimeSyncModelDriver(DSLModelDriver):
             aggregation (dict): Mapping from variable name to the
                 aggregation method that should be used. Defaults to
                 empty dictionary.
+            merge_cache (TimeSyncMergeCache, optional): Cache containing
+                the results of previous merges that should be updated
+                incrementally. Defaults to None and the tables are
+                merged from scratch.
 
         """
         if not (rpc.all_clients_connected
@@ -316,7 +384,11 @@ class TimeSyncModelDriver(DSLModelDriver):
             tools.sleep(1.0)
             return
         tot = cls.merge(tables, table_units, table_lock, rpc.open_clients,
-                        synonyms, interpolation, aggregation)
+                        synonyms, interpolation, aggregation,
+                        merge_cache=merge_cache)
+        # Only the requested timestep is returned so the remaining
+        # rows do not need to be converted
+        tot = tot.loc[[time]]
         # Update external units
         for k in external_variables:
             if k not in table_units[client_model]:
@@ -326,7 +398,7 @@ class TimeSyncModelDriver(DSLModelDriver):
         for k in tot.columns:
             funits = units.get_conversion_function(table_units['base'][k],
                                                    table_units[client_model][k])
-            tot[k] = tot[k].apply(funits)
+            tot[k] = funits(tot[k])
         # Transform back to variables expected by the model
         for kbase, alt in synonyms.get(client_model, {}).items():
             if alt['base2alt'] is not None:
@@ -357,7 +429,7 @@ class TimeSyncModelDriver(DSLModelDriver):
     
     @classmethod
     def merge(cls, tables, table_units, table_lock, open_clients,
-              synonyms, interpolation, aggregation):
+              synonyms, interpolation, aggregation, merge_cache=None):
         r"""Merge tables from models to get data.
 
         Args:
@@ -377,58 +449,218 @@ class TimeSyncModelDriver(DSLModelDriver):
             aggregation (dict): Mapping from variable name to the
                 aggregation method that should be used. Defaults to
                 empty dictionary.
+            merge_cache (TimeSyncMergeCache, optional): Cache containing
+                the results of previous merges. If provided, only rows
+                within the interpolation windows of times that were
+                updated since the last merge will be reprocessed.
+                Defaults to None and all of the tables are processed.
 
+        Returns:
+            pandas.DataFrame: Merged table. If merge_cache is provided,
+                the returned table is owned by the cache and should not
+                be modified.
+
+        """
+        if merge_cache is None:
+            merge_cache = TimeSyncMergeCache()
+        with table_lock:
+            windows = {}
+            for k, v in tables.items():
+                kws = cls.interpolation_kws(k, v, open_clients,
+                                            interpolation)
+                columns = list(v.columns)
+                if ((k not in merge_cache.tables)
+                        or (merge_cache.kws[k] != kws)
+                        or (merge_cache.columns[k] != columns)
+                        or (kws.get('method', None) not in _local_interp)
+                        or ('order' in kws)):
+                    windows[k] = None
+                    merge_cache.kws[k] = kws
+                    merge_cache.columns[k] = columns
+                elif merge_cache.updated:
+                    windows[k] = cls.interpolation_window(
+                        v, merge_cache.updated)
+            # Interpolate, rename, & convert units within the windows
+            tmin = None
+            tmax = None
+            for k, w in windows.items():
+                v = tables[k]
+                if w is not None:
+                    v = v.iloc[w[0]:(w[1] + 1)]
+                new = cls.process_table(k, v, table_units, synonyms,
+                                        merge_cache.kws[k])
+                if w is None:
+                    merge_cache.tables[k] = new
+                    merge_cache.merged = None
+                    continue
+                merge_cache.tables[k] = cls.splice_rows(
+                    merge_cache.tables[k], new)
+                if (tmin is None) or (new.index[0] < tmin):
+                    tmin = new.index[0]
+                if (tmax is None) or (new.index[-1] > tmax):
+                    tmax = new.index[-1]
+            # Aggregate
+            if merge_cache.merged is None:
+                merge_cache.merged = cls.aggregate(
+                    list(merge_cache.tables.values()), aggregation)
+            elif tmin is not None:
+                new = cls.aggregate(
+                    [v.loc[tmin:tmax] for v in merge_cache.tables.values()],
+                    aggregation)
+                merge_cache.merged = cls.splice_rows(merge_cache.merged,
+                                                     new)
+            merge_cache.updated = set()
+            return merge_cache.merged
+
+    @classmethod
+    def interpolation_kws(cls, model, table, open_clients, interpolation):
+        r"""Determine the keyword arguments that should be used to
+        interpolate a table.
+
+        Args:
+            model (str): Name of the model that the table belongs to.
+            table (pandas.DataFrame): Table containing variables supplied
+                by the model.
+            open_clients (list): Clients that are still open.
+            interpolation (dict): Mapping from model name to the
+                interpolation kwargs that should be used or interpolation
+                kwargs that should be used for all models.
+
+        Returns:
+            dict: Keyword arguments for pandas.DataFrame.interpolate.
 
         """
-        # Adjust input arguments
         interp_default = {'method': _default_interp}
         if 'method' in interpolation:
             interp_default = interpolation
             interpolation = {}
-        # Interpolate
-        table_temp = {}
-        with table_lock:
-            for k, v in tables.items():
-                kws = interpolation.get(k, interp_default).copy()
-                if k not in open_clients:
-                    # Ensure that clients that have signed of are
-                    # extrapolated, otherwise they would never produce
-                    # valid data
-                    kws['limit_area'] = None
-                if 'order' in kws:
-                    kws['order'] = min(v.dropna().shape[0] - 1,
-                                       kws['order'])
-                    if kws['order'] == 0:
-                        kws.pop('order')
-                        kws.update(interp_default)
-                v = v.set_index('time')
-                # Cannot interpolate on pandas timedelta as of pandas 1.0.1
-                ind = v.index
-                v.index = v.index.total_seconds()
-                table_temp[k] = v.interpolate(**kws)
-                table_temp[k].index = ind
+        kws = interpolation.get(model, interp_default).copy()
+        if model not in open_clients:
+            # Ensure that clients that have signed of are
+            # extrapolated, otherwise they would never produce
+            # valid data
+            kws['limit_area'] = None
+        if 'order' in kws:
+            kws['order'] = min(table.dropna().shape[0] - 1,
+                               kws['order'])
+            if kws['order'] == 0:
+                kws.pop('order')
+                kws.update(interp_default)
+        return kws
+
+    @classmethod
+    def interpolation_window(cls, table, times):
+        r"""Determine the range of rows in a table that are effected by
+        an update to the table at one or more times. For interpolation
+        methods that only use the nearest valid values, this is the
+        range bounded by the closest rows before and after the updated
+        times that contain values for all variables.
+
+        Args:
+            table (pandas.DataFrame): Table sorted by time.
+            times (set): Times that were updated.
+
+        Returns:
+            tuple: Indices of the first and last row in the window.
+
+        """
+        import pandas as pd
+        columns = [table[k].values for k in table.columns if k != 'time']
+
+        def is_valid(i):
+            return not any(pd.isna(x[i]) for x in columns)
+
+        table_times = table['time']
+        nrow = table.shape[0]
+        lo = table_times.searchsorted(min(times)) - 1
+        while (lo > 0) and (not is_valid(lo)):
+            lo -= 1
+        hi = table_times.searchsorted(max(times), side='right')
+        while (hi < (nrow - 1)) and (not is_valid(hi)):
+            hi += 1
+        return (max(lo, 0), min(hi, nrow - 1))
+
+    @classmethod
+    def process_table(cls, model, table, table_units, synonyms, kws):
+        r"""Interpolate a model's table, convert alternate variables to
+        base variables, and convert to base units.
+
+        Args:
+            model (str): Name of the model that the table belongs to.
+            table (pandas.DataFrame): Table containing variables supplied
+                by the model.
+            table_units (dict): Mapping from model name to dictionaries
+                mapping from variable names to units.
+            synonyms (dict): Dictionary mapping from base variables to
+                alternate variables and mapping functions used to convert
+                between the variables.
+            kws (dict): Keyword arguments for pandas.DataFrame.interpolate.
+
+        Returns:
+            pandas.DataFrame: Processed table indexed by time.
+
+        """
+        v = table.set_index('time')
+        # Cannot interpolate on pandas timedelta as of pandas 1.0.1
+        ind = v.index
+        v.index = v.index.total_seconds()
+        v = v.interpolate(**kws)
+        v.index = ind
         # Rename + transformation
-        for model, v in table_temp.items():
-            drop = []
-            for kbase, alt in synonyms.get(model, {}).items():
-                if alt['alt2base'] is not None:
-                    args = [v[k] for k in alt['alt']]
-                    v[kbase] = alt['alt2base'](*args)
-                else:
-                    v[kbase] = v[alt['alt'][0]]
-                drop += alt['alt']
-            for k in drop:
-                v = v.drop(k, axis=1)
-            # Units
-            for k in v.columns:
-                funits = units.get_conversion_function(table_units[model][k],
-                                                       table_units['base'][k])
-                v[k] = v[k].apply(funits)
-            table_temp[model] = v
-        # Append
+        drop = []
+        for kbase, alt in synonyms.get(model, {}).items():
+            if alt['alt2base'] is not None:
+                args = [v[k] for k in alt['alt']]
+                v[kbase] = alt['alt2base'](*args)
+            else:
+                v[kbase] = v[alt['alt'][0]]
+            drop += alt['alt']
+        for k in drop:
+            v = v.drop(k, axis=1)
+        # Units
+        for k in v.columns:
+            funits = units.get_conversion_function(table_units[model][k],
+                                                   table_units['base'][k])
+            v[k] = funits(v[k])
+        return v
+
+    @classmethod
+    def aggregate(cls, tables, aggregation):
+        r"""Aggregate processed tables from multiple models.
+
+        Args:
+            tables (list): Processed tables indexed by time.
+            aggregation (dict): Mapping from variable name to the
+                aggregation method that should be used.
+
+        Returns:
+            pandas.DataFrame: Aggregated table.
+
+        """
+        import pandas as pd
         out = pd.DataFrame()
-        for k, v in table_temp.items():
+        for v in tables:
             out = out.append(v, sort=False)
         # Groupby + aggregate
-        out = out.groupby('time').agg(aggregation)
-        return out
+        return out.groupby('time').agg(aggregation)
+
+    @staticmethod
+    def splice_rows(table, new):
+        r"""Replace the rows in a table indexed by time with rows
+        from another table covering the same time range.
+
+        Args:
+            table (pandas.DataFrame): Table sorted by time.
+            new (pandas.DataFrame): Table sorted by time containing
+                rows that should replace those in table.
+
+        Returns:
+            pandas.DataFrame: Updated table.
+
+        """
+        import pandas as pd
+        if new.shape[0] == 0:
+            return table
+        lo = table.index.searchsorted(new.index[0])
+        hi = table.index.searchsorted(new.index[-1], side='right')
+        return pd.concat([table.iloc[:lo], new, table.iloc[hi:]], sort=False)
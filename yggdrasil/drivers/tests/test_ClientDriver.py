@@ -138,3 +138,43 @@ class TestClientDriver(TestClientParam, parent.TestConnectionDriver):
     def test_send_recv_nolimit(self):
         r"""Test routing of a large message between client and server."""
         self.test_send_recv(msg_send=self.msg_long)
+
+
+class TestClientDriverPersistent(TestClientDriver):
+    r"""Test class for ClientDriver class with a persistent response comm."""
+
+    @property
+    def send_comm_kwargs(self):
+        r"""dict: Keyword arguments for send comm."""
+        out = super(TestClientDriverPersistent, self).send_comm_kwargs
+        out['persistent_response'] = True
+        return out
+
+    def test_send_recv_multiple(self):
+        r"""Test that responses to multiple requests are routed through a
+        single response driver on each side."""
+        nmsg = 3
+        for i in range(nmsg):
+            self.test_send_recv(msg_send=self.test_msg + str(i).encode())
+        assert_equal(len(self.instance.persistent_response_drivers), 1)
+        assert_equal(len(self.srv_drv.persistent_response_drivers), 1)
+        assert_equal(len(self.instance.response_drivers), 1)
+        assert_equal(len(self.srv_drv.response_drivers), 1)
+        # Out of order responses are routed by request ID
+        futures = [self.send_comm.call_async(self.test_msg + str(i).encode())
+                   for i in range(nmsg)]
+        srv_msgs = []
+        for i in range(nmsg):
+            flag, srv_msg, request_id = self.recv_comm.recv_from(
+                timeout=self.route_timeout)
+            assert(flag)
+            srv_msgs.append((request_id, srv_msg))
+        for request_id, srv_msg in srv_msgs[::-1]:
+            flag = self.recv_comm.send_to(request_id, srv_msg)
+            assert(flag)
+        for i, x in enumerate(futures):
+            flag, cli_msg = x.result(timeout=self.route_timeout)
+            assert(flag)
+            assert_equal(cli_msg, self.test_msg + str(i).encode())
+        assert_equal(len(self.instance.response_drivers), 1)
+        assert_equal(len(self.srv_drv.response_drivers), 1)
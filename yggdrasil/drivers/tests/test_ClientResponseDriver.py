@@ -51,3 +51,13 @@ class TestClientResponseDriver(TestClientResponseParam,
         super(TestClientResponseDriver, self).test_send_recv_nolimit()
         assert(self.instance._used)
         assert(not self.instance.is_valid)
+
+    def test_send_recv_request_id(self):
+        r"""Test that the response header contains the request ID."""
+        flag = self.send_comm.send(self.test_msg)
+        assert(flag)
+        flag, msg_recv, header = self.recv_comm.recv(self.timeout,
+                                                     return_header=True)
+        assert(flag)
+        self.assert_msg_equal(msg_recv, self.test_msg)
+        self.assert_equal(header['request_id'], self.instance.msg_id)
@@ -1,4 +1,11 @@
 import os
+import sys
+import uuid
+import shutil
+import tempfile
+import unittest
+import subprocess
+from yggdrasil import config, platform
 from yggdrasil.config import ygg_cfg
 from yggdrasil.tests import assert_equal, assert_raises, YggTestClass
 from yggdrasil.drivers import CompiledModelDriver
@@ -53,6 +60,135 @@ def test_CompilationToolBase():
                   invalid='invalid')
 
 
+def test_get_build_cache_dir():
+    r"""Test get_build_cache_dir."""
+    with config.temp_config(build_cache='False'):
+        assert_equal(CompiledModelDriver.get_build_cache_dir(), None)
+    with config.temp_config(build_cache='True'):
+        assert_equal(CompiledModelDriver.get_build_cache_dir(),
+                     os.path.join(os.path.expanduser('~'), '.yggdrasil',
+                                  'build_cache'))
+    with config.temp_config(build_cache='cache'):
+        assert_equal(CompiledModelDriver.get_build_cache_dir(),
+                     os.path.abspath('cache'))
+
+
+def test_find_included_files():
+    r"""Test find_included_files."""
+    tempdir = tempfile.mkdtemp()
+    try:
+        incdir = os.path.join(tempdir, 'include')
+        os.mkdir(incdir)
+        files = {os.path.join(tempdir, 'src.c'): ('#include "a.h"\n'
+                                                  '#include <stdio.h>\n'),
+                 os.path.join(tempdir, 'a.h'): '  # include <b.h>\n',
+                 os.path.join(incdir, 'b.h'): '#include "a.h"\n'}
+        for k, v in files.items():
+            with open(k, 'w') as fd:
+                fd.write(v)
+        assert_equal(CompiledModelDriver.find_included_files(
+            os.path.join(tempdir, 'src.c'), [incdir]),
+            [os.path.join(tempdir, 'a.h'), os.path.join(incdir, 'b.h')])
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_build_cache():
+    r"""Test that compilation products are reused from the build cache."""
+    import_component('model', subtype='c')
+    gcc = CompiledModelDriver.get_compilation_tool('compiler', 'gcc',
+                                                   default=None)
+    if (gcc is None) or (not gcc.is_installed()):  # pragma: debug
+        raise unittest.SkipTest("gcc not installed.")
+    tempdir = tempfile.mkdtemp()
+    try:
+        cache_dir = os.path.join(tempdir, 'cache')
+        src = os.path.join(tempdir, 'src.c')
+        inc = os.path.join(tempdir, 'src.h')
+        out = os.path.join(tempdir, 'src.o')
+        with open(src, 'w') as fd:
+            fd.write('#include "src.h"\nint f(void) { return VAL; }\n')
+
+        def compile_src(val, **kwargs):
+            with open(inc, 'w') as fd:
+                fd.write('#define VAL %d\n' % val)
+            return gcc.call(src, out=out, dont_link=True,
+                            working_dir=tempdir, **kwargs)
+
+        def count_cached():
+            return sum(len(f) for _, _, f in os.walk(cache_dir))
+
+        with config.temp_config(build_cache=cache_dir):
+            compile_src(1)
+            assert_equal(count_cached(), 1)
+            with open(out, 'rb') as fd:
+                obj1 = fd.read()
+            # Changes to included files & flags produce new products
+            compile_src(2)
+            assert_equal(count_cached(), 2)
+            compile_src(2, flags=['-O2'])
+            assert_equal(count_cached(), 3)
+            # Unchanged inputs use the cached product
+            os.remove(out)
+            compile_src(1)
+            assert_equal(count_cached(), 3)
+            with open(out, 'rb') as fd:
+                assert_equal(fd.read(), obj1)
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_run_compilation_tasks():
+    r"""Test run_compilation_tasks."""
+    import threading
+    from collections import OrderedDict
+    order = []
+    lock = threading.Lock()
+
+    def task(x):
+        with lock:
+            order.append(x)
+        return x
+
+    tasks = OrderedDict([
+        ('a', ([], task, ('a', ), {})),
+        ('b', ([], task, ('b', ), {})),
+        ('c', (['a', 'b'], task, ('c', ), {})),
+        ('d', (['c', 'external'], task, ('d', ), {}))])
+    out = CompiledModelDriver.run_compilation_tasks(tasks)
+    assert_equal(order, ['a', 'b', 'c', 'd'])
+    assert_equal(out, {k: k for k in tasks.keys()})
+    for nproc in [2, None]:
+        order.clear()
+        out = CompiledModelDriver.run_compilation_tasks(tasks, nproc=nproc)
+        assert_equal(sorted(order[:2]), ['a', 'b'])
+        assert_equal(order[2:], ['c', 'd'])
+        assert_equal(out, {k: k for k in tasks.keys()})
+    tasks['a'] = (['d'], task, ('a', ), {})
+    assert_raises(RuntimeError, CompiledModelDriver.run_compilation_tasks,
+                  tasks, nproc=2)
+
+
+@unittest.skipIf(platform._is_win, "Lock is tested using fcntl")
+def test_dependency_lock():
+    r"""Test that dependency_lock excludes other processes."""
+    key = ('test', str(uuid.uuid4()))
+    fname = CompiledModelDriver.get_dependency_lock_file(key)
+    code = ("import fcntl\n"
+            "fd = open(%r, 'a')\n"
+            "try:\n"
+            "    fcntl.flock(fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+            "except OSError:\n"
+            "    raise SystemExit(1)\n") % fname
+    with CompiledModelDriver.dependency_lock(key):
+        # Locks can be nested in the same thread
+        with CompiledModelDriver.dependency_lock(key):
+            assert(os.path.isfile(fname))
+        assert_equal(subprocess.call([sys.executable, '-c', code]), 1)
+    assert_equal(subprocess.call([sys.executable, '-c', code]), 0)
+    os.remove(fname)
+
+
 class DummyCompiler(CompiledModelDriver.CompilerBase):
     r"""Dummy test class."""
     _dont_register = True
@@ -184,6 +320,16 @@ class TestCompiledModelDriverNoInit(TestCompiledModelParam,
                     libtype=libtype, overwrite=False)
             self.import_cls.cleanup_dependencies(libtype=libtype)
 
+    def test_get_dependency_tasks(self):
+        r"""Test get_dependency_tasks."""
+        tasks, required = self.import_cls.get_dependency_tasks()
+        keys = list(tasks.keys())
+        assert_equal(sorted(required, key=keys.index), required)
+        for i, (k, v) in enumerate(tasks.items()):
+            for x in v[0]:
+                assert(keys.index(x) < i)
+        self.import_cls.compile_dependencies(nproc=2)
+
     def test_get_tool(self):
         r"""Test other methods of calling get_tool."""
         self.import_cls.get_tool('compiler', return_prop='name')
@@ -377,6 +523,15 @@ class TestCompiledModelDriverNoStart(TestCompiledModelParam,
         for k, v in old_tools.items():
             setattr(self.instance, k, v)
 
+    def test_get_build_tasks(self):
+        r"""Test that the model task does not compile the libraries that
+        the other tasks compile."""
+        tasks = self.instance.get_build_tasks()
+        prereqs, _, _, kwargs = tasks[('model', self.instance.name)]
+        assert(kwargs.get('skip_dependencies', False))
+        for k in prereqs:
+            assert(k in tasks)
+
     def test_compile_model(self):
         r"""Test compile model with alternate set of input arguments."""
         fname = self.src[0]
@@ -413,6 +413,70 @@ class TestConnectionDriverFork(TestConnectionDriver):
         return out
 
 
+class TestConnectionDriverBatch(TestConnectionDriver):
+    r"""Test class for the ConnectionDriver class with batched sends."""
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestConnectionDriverBatch, self).inst_kwargs
+        out['batch'] = 3
+        return out
+
+    @pytest.mark.timeout(timeout=600)
+    def test_send_recv_batch(self):
+        r"""Test sending/receiving messages that are passed in batches."""
+        nmsg = 2 * self.instance.batch
+        for i in range(nmsg):
+            flag = self.send_comm.send(self.test_msg)
+            if self.comm_name != 'CommBase':
+                assert(flag)
+        for i in range(nmsg):
+            flag, msg_recv = self.recv_comm.recv(self.timeout)
+            if self.comm_name != 'CommBase':
+                assert(flag)
+                self.assert_msg_equal(msg_recv, self.test_msg)
+        if self.comm_name != 'CommBase':
+            self.assert_equal(self.instance.n_msg, 0)
+            self.assert_equal(self.instance.nsent, nmsg)
+
+
+class TestConnectionDriverDispatch(TestConnectionDriver):
+    r"""Test class for the ConnectionDriver class with messages dispatched
+    to one of several output comms."""
+
+    def setup(self, *args, **kwargs):
+        r"""Initialize comm object pair."""
+        self.ncomm_output = 2
+        super(TestConnectionDriverDispatch, self).setup(*args, **kwargs)
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestConnectionDriverDispatch, self).inst_kwargs
+        out['ocomm_kws']['comm'] = [None for i in range(self.ncomm_output)]
+        out['dispatch'] = 'round_robin'
+        return out
+
+    @pytest.mark.timeout(timeout=600)
+    def test_send_recv_dispatch(self):
+        r"""Test that messages are distributed between output comms."""
+        nmsg = 2 * self.ncomm_output
+        for i in range(nmsg):
+            flag = self.send_comm.send(self.test_msg)
+            if self.comm_name != 'CommBase':
+                assert(flag)
+        if self.comm_name == 'CommBase':
+            return
+        for x in self.recv_comm.comm_list:
+            for i in range(nmsg // self.ncomm_output):
+                flag, msg_recv = x.recv(self.timeout)
+                assert(flag)
+                self.assert_msg_equal(msg_recv, self.test_msg)
+        self.assert_equal(self.instance.n_msg, 0)
+        self.assert_equal(self.instance.nsent, nmsg)
+
+
 invalid_translate = True
 
 
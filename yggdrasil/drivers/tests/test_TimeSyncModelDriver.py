@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from yggdrasil.tests import YggTestBase
+from yggdrasil import units, multitasking
+from yggdrasil.drivers.TimeSyncModelDriver import (
+    TimeSyncModelDriver, TimeSyncMergeCache)
+
+
+class TestTimeSyncModelDriverMerge(YggTestBase):
+    r"""Test merging tables for TimeSyncModelDriver."""
+
+    def setup(self, *args, **kwargs):
+        r"""Setup, create variables for testing."""
+        self.tables = {}
+        self.times = []
+        self.table_units = {
+            'base': {'time': 's', 'x': 'm', 'y': 'g'},
+            'modelA': {'time': 's', 'x': 'm', 'y': 'g'},
+            'modelB': {'time': 's', 'x': 'cm', 'y': 'kg', 'z': 'kg'}}
+        self.table_lock = multitasking.RLock()
+        self.synonyms = {'modelB': {'y': {'alt': ['z'], 'alt2base': None,
+                                          'base2alt': None}}}
+        self.aggregation = {'x': 'mean', 'y': 'mean'}
+        self.open_clients = ['modelA', 'modelB']
+        super(TestTimeSyncModelDriverMerge, self).setup(*args, **kwargs)
+
+    def add_state(self, model, t):
+        r"""Add a state to the tables for a model."""
+        if model == 'modelA':
+            state = {'x': units.add_units(np.sin(t), 'm'),
+                     'y': units.add_units(np.cos(t), 'g')}
+        else:
+            state = {'x': units.add_units(100 * np.sin(t), 'cm'),
+                     'z': units.add_units(np.cos(t) / 1000, 'kg')}
+        if model not in self.tables:
+            self.tables[model] = pd.DataFrame({'time': self.times})
+        TimeSyncModelDriver.update_tables(
+            self.tables, self.times, model,
+            units.convert_to_pandas_timedelta(units.add_units(t, 's')),
+            state, merge_cache=self.merge_cache)
+
+    def merge(self, interpolation, merge_cache=None):
+        r"""Merge the tables."""
+        return TimeSyncModelDriver.merge(
+            self.tables, self.table_units, self.table_lock,
+            self.open_clients, self.synonyms, interpolation,
+            self.aggregation, merge_cache=merge_cache)
+
+    def test_merge_cache(self):
+        r"""Test that incremental merges match complete merges."""
+        for interpolation in [{'method': 'index'},
+                              {'modelA': {'method': 'pad'},
+                               'modelB': {'method': 'index'}},
+                              {'method': 'polynomial', 'order': 2}]:
+            self.setup()
+            self.merge_cache = TimeSyncMergeCache()
+            tA = 0.0
+            tB = 0.0
+            for i in range(10):
+                self.add_state('modelA', tA)
+                self.add_state('modelB', tB)
+                if i == 5:
+                    self.open_clients.remove('modelA')
+                tA += 3.0
+                tB += 2.0
+                pd.testing.assert_frame_equal(
+                    self.merge(interpolation,
+                               merge_cache=self.merge_cache),
+                    self.merge(interpolation))
+            # Overwrite an existing time
+            self.add_state('modelB', 2.0)
+            pd.testing.assert_frame_equal(
+                self.merge(interpolation, merge_cache=self.merge_cache),
+                self.merge(interpolation))
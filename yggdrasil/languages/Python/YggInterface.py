@@ -170,7 +170,8 @@ def YggRpcServer(name, infmt=None, outfmt=None, **kwargs):
     return InterfaceComm(name, **kwargs)
 
 
-def YggRpcClient(name, outfmt=None, infmt=None, **kwargs):
+def YggRpcClient(name, outfmt=None, infmt=None, persistent_response=None,
+                 **kwargs):
     r"""Get class for handling requests and response to an RPC Server from a
     client.
 
@@ -180,6 +181,10 @@ def YggRpcClient(name, outfmt=None, infmt=None, **kwargs):
             message sent to the request queue. Defautls to '%s'.
         infmt (str, optional): Format string used to recover variables from
             messages received from the response queue. Defautls to '%s'.
+        persistent_response (bool, optional): If True, responses to all
+            requests are received via a single long-lived response comm. If
+            False, a new response comm is created for each request. Defaults
+            to None and the value set for the model in the YAML is used.
         **kwargs: Additional keyword arguments are passed to InterfaceComm.
 
     Returns:
@@ -194,7 +199,8 @@ def YggRpcClient(name, outfmt=None, infmt=None, **kwargs):
     if outfmt is not None:
         ocomm_kwargs['format_str'] = outfmt
     kwargs.update(ocomm_kwargs, comm_class=ClientComm.ClientComm,
-                  response_kwargs=icomm_kwargs)
+                  response_kwargs=icomm_kwargs,
+                  persistent_response=persistent_response)
     kwargs.setdefault('recv_timeout', False)
     return InterfaceComm(name, **kwargs)
 
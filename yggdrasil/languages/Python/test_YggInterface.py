@@ -1,13 +1,19 @@
 import os
+import sys
+import unittest
+import subprocess
+import tempfile
 import numpy as np
 import flaky
 from yggdrasil.communication import get_comm
 from yggdrasil.interface import YggInterface
 from yggdrasil.tools import (
-    YGG_MSG_EOF, get_YGG_MSG_MAX, YGG_MSG_BUF, is_lang_installed)
+    YGG_MSG_EOF, get_YGG_MSG_MAX, YGG_MSG_BUF, is_lang_installed,
+    get_default_comm)
 from yggdrasil.components import import_component
 from yggdrasil.drivers import (InputDriver, OutputDriver)
-from yggdrasil.tests import YggTestClassInfo, assert_equal, assert_raises
+from yggdrasil.tests import (
+    YggTestClassInfo, assert_equal, assert_raises, long_running)
 
 
 YGG_MSG_MAX = get_YGG_MSG_MAX()
@@ -118,6 +124,89 @@ def test_YggInit_backwards():
                  output_interface='PsiOutput')
 
 
+def get_import_times(module, env=None):
+    r"""Get the cumulative time taken to import a module and each of the
+    modules it imports in a new Python process using -X importtime.
+
+    Args:
+        module (str): Name of the module that should be imported.
+        env (dict, optional): Environment variables for the process.
+            Defaults to None and the current environment is used.
+
+    Returns:
+        dict: Mapping from the names of the modules imported to the
+            cumulative time (in seconds) taken to import them.
+
+    """
+    out = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+        env=env, cwd=tempfile.gettempdir(), stderr=subprocess.PIPE,
+        check=True).stderr
+    times = {}
+    for line in out.decode("utf-8").splitlines():
+        parts = line.split('|')
+        if (not line.startswith('import time:')) or (len(parts) != 3):
+            continue
+        try:
+            times[parts[2].strip()] = 1.0e-6 * int(parts[1])
+        except ValueError:
+            continue  # Column headers
+    return times
+
+
+def get_imported_modules(module, env=None):
+    r"""Get the names of the modules loaded after importing a module in a
+    new Python process.
+
+    Args:
+        module (str): Name of the module that should be imported.
+        env (dict, optional): Environment variables for the process.
+            Defaults to None and the current environment is used.
+
+    Returns:
+        list: Names of the modules in sys.modules following the import.
+
+    """
+    out = subprocess.run(
+        [sys.executable, '-c',
+         'import sys; import %s; print("\\n".join(sys.modules))' % module],
+        env=env, cwd=tempfile.gettempdir(), stdout=subprocess.PIPE,
+        check=True).stdout
+    return out.decode("utf-8").splitlines()
+
+
+_deferred_modules = ['pandas', 'unyt', 'sympy', 'scipy', 'astropy', 'trimesh']
+
+
+def test_import_deferred():
+    r"""Test that heavy dependencies are not loaded by the interface import."""
+    module = 'yggdrasil.languages.Python.YggInterface'
+    env = dict(os.environ)
+    env.pop('YGG_DEFAULT_COMM', None)
+    modules = get_imported_modules(module, env=env)
+    assert(module in modules)
+    assert_equal([k for k in _deferred_modules if k in modules], [])
+    env['YGG_DEFAULT_COMM'] = get_default_comm()
+    modules = get_imported_modules(module, env=env)
+    assert_equal([k for k in _deferred_modules + ['distutils']
+                  if k in modules], [])
+
+
+@long_running
+@unittest.skipIf(sys.version_info < (3, 7),
+                 "-X importtime requires Python 3.7 or later")
+def test_import_time():
+    r"""Test the time taken to import the interface."""
+    module = 'yggdrasil.languages.Python.YggInterface'
+    env = dict(os.environ)
+    env.pop('YGG_DEFAULT_COMM', None)
+    times = get_import_times(module, env=env)
+    assert(times[module] < 2.0)
+    env['YGG_DEFAULT_COMM'] = get_default_comm()
+    times = get_import_times(module, env=env)
+    assert(times[module] < 1.0)
+
+
 def test_YggInit_variables():
     r"""Test Matlab interface for variables."""
     assert_equal(YggInterface.YggInit('YGG_MSG_MAX'), YGG_MSG_MAX)
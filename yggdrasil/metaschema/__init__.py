@@ -1,6 +1,8 @@
 import os
 import copy
+import json
 import pprint
+import threading
 import jsonschema
 import yggdrasil
 from yggdrasil.metaschema.encoder import encode_json, decode_json
@@ -13,6 +15,8 @@ _metaschema_fname = os.path.abspath(os.path.join(
     os.path.dirname(yggdrasil.__file__), _metaschema_fbase))
 _metaschema = None
 _validator = None
+_validator_cache = threading.local()
+_validator_cache_size = 1000
 _base_schema = {u'$schema': u'http://json-schema.org/draft-04/schema'}
 
 
@@ -134,6 +138,57 @@ def get_validator(overwrite=False, normalizers=None, **kwargs):
     return _validator
 
 
+def get_schema_key(schema):
+    r"""Get a key that uniquely identifies a schema for caching.
+
+    Args:
+        schema (dict): Schema to get a key for.
+
+    Returns:
+        str: JSON serialization of the schema with sorted keys. None is
+            returned if the schema cannot be serialized.
+
+    """
+    try:
+        return json.dumps(schema, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_schema_validator(schema, key=None):
+    r"""Get a validator for a schema. The schema is checked against the
+    metaschema and the validator is created the first time that it is
+    requested and then cached (per thread as validators store state during
+    validation).
+
+    Args:
+        schema (dict): Schema that objects will be validated against.
+        key (object, optional): Hashable key that uniquely identifies the
+            schema. Defaults to None and get_schema_key is used.
+
+    Returns:
+        jsonschema.IValidator: Validator for the schema.
+
+    """
+    cls = get_validator()
+    # Validators created by a previous validator class are discarded
+    if getattr(_validator_cache, 'cls', None) is not cls:
+        _validator_cache.cls = cls
+        _validator_cache.validators = {}
+    cache = _validator_cache.validators
+    if key is None:
+        key = get_schema_key(schema)
+    out = cache.get(key, None) if key is not None else None
+    if out is None:
+        cls.check_schema(schema)
+        out = cls(schema)
+        if key is not None:
+            if len(cache) >= _validator_cache_size:
+                cache.clear()
+            cache[key] = out
+    return out
+
+
 def validate_schema(obj):
     r"""Validate a schema against the metaschema.
 
@@ -174,9 +229,11 @@ def validate_instance(obj, schema, **kwargs):
         ValidationError: If the object is not valid.
 
     """
-    cls = get_validator()
-    cls.check_schema(schema)
-    return cls(schema).validate(obj, **kwargs)
+    validator = get_schema_validator(schema)
+    if kwargs.get('normalize', False):
+        # Normalization modifies the validator so a new one is used
+        validator = get_validator()(validator.schema)
+    return validator.validate(obj, **kwargs)
 
 
 def normalize_instance(obj, schema, **kwargs):
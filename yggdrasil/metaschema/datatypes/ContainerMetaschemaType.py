@@ -167,6 +167,76 @@ class ContainerMetaschemaType(MetaschemaType):
                 cls._assign(container, k, vcls.decode_data(v, vtypedef))
         return container
 
+    @classmethod
+    def supports_binary(cls, typedef):
+        r"""Determine if objects of this type can be encoded as raw binary
+        buffers via encode_data_binary. This is only True if there is a
+        type definition for each element in the container and each
+        element supports binary encoding.
+
+        Args:
+            typedef (dict): Type definition for the object.
+
+        Returns:
+            bool: True if the type supports binary encoding, False otherwise.
+
+        """
+        if not (isinstance(typedef, dict)
+                and isinstance(typedef.get(cls._json_property, None),
+                               cls._container_type)
+                and typedef[cls._json_property]):
+            return False
+        for _, v in cls._iterate(typedef[cls._json_property]):
+            if not (isinstance(v, dict) and ('type' in v)
+                    and get_type_class(v['type']).supports_binary(v)):
+                return False
+        return True
+
+    @classmethod
+    def encode_data_binary(cls, obj, typedef):
+        r"""Encode an object's data as raw binary buffers. Elements are
+        encoded in sorted order of their index.
+
+        Args:
+            obj (object): Object to encode.
+            typedef (dict): Type definition that should be used to encode the
+                object.
+
+        Returns:
+            list: Contiguous np.ndarray objects containing the object data.
+
+        """
+        out = []
+        vtypedefs = typedef[cls._json_property]
+        for k in sorted([k for k, _ in cls._iterate(vtypedefs)]):
+            vtypedef = vtypedefs[k]
+            vcls = get_type_class(vtypedef['type'])
+            out += vcls.encode_data_binary(obj[k], vtypedef)
+        return out
+
+    @classmethod
+    def decode_data_binary(cls, buffers, typedef):
+        r"""Decode an object from raw binary buffers.
+
+        Args:
+            buffers (iterator): Iterator over tuples containing buffers
+                produced by encode_data_binary and the memory layout ('C'
+                or 'F') of the array in each buffer.
+            typedef (dict): Type definition that should be used to decode the
+                object.
+
+        Returns:
+            object: Decoded object.
+
+        """
+        container = cls._container_type()
+        vtypedefs = typedef[cls._json_property]
+        for k in sorted([k for k, _ in cls._iterate(vtypedefs)]):
+            vtypedef = vtypedefs[k]
+            vcls = get_type_class(vtypedef['type'])
+            cls._assign(container, k, vcls.decode_data_binary(buffers, vtypedef))
+        return container
+
     @classmethod
     def coerce_type(cls, obj, typedef=None, **kwargs):
         r"""Coerce objects of specific types to match the data type.
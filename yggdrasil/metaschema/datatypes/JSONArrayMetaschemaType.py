@@ -1,5 +1,5 @@
 import numpy as np
-import pandas as pd
+from yggdrasil.tools import DeferredDataFrame
 from yggdrasil.metaschema.datatypes import generate_data
 from yggdrasil.metaschema.datatypes.ContainerMetaschemaType import (
     ContainerMetaschemaType)
@@ -18,7 +18,7 @@ class JSONArrayMetaschemaType(ContainerMetaschemaType):
     properties = ['items']
     metadata_properties = ['items']
     extract_properties = ['items']
-    python_types = (list, tuple, np.ndarray, pd.DataFrame)
+    python_types = (list, tuple, np.ndarray, DeferredDataFrame)
     _replaces_existing = True
 
     _container_type = list
@@ -78,7 +78,7 @@ class JSONArrayMetaschemaType(ContainerMetaschemaType):
 
         """
         names = None
-        if isinstance(obj, pd.DataFrame):
+        if isinstance(obj, DeferredDataFrame):
             names = obj.columns
             if all([isinstance(n, int) for n in names]):
                 names = None
@@ -117,7 +117,7 @@ class JSONArrayMetaschemaType(ContainerMetaschemaType):
 
         """
         from yggdrasil.serialize import pandas2list, numpy2list, dict2list
-        if isinstance(obj, pd.DataFrame):
+        if isinstance(obj, DeferredDataFrame):
             obj = pandas2list(obj)
         elif isinstance(obj, np.ndarray) and (len(obj.dtype) == 0):
             obj = [obj]
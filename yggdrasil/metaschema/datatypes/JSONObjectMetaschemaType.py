@@ -1,5 +1,5 @@
 import numpy as np
-import pandas as pd
+from yggdrasil.tools import DeferredDataFrame
 from collections import OrderedDict
 from yggdrasil.metaschema.datatypes.ContainerMetaschemaType import (
     ContainerMetaschemaType)
@@ -47,7 +47,7 @@ class JSONObjectMetaschemaType(ContainerMetaschemaType):
 
         """
         from yggdrasil.serialize import pandas2dict, numpy2dict, list2dict
-        if isinstance(obj, pd.DataFrame):
+        if isinstance(obj, DeferredDataFrame):
             obj = pandas2dict(obj)
         elif isinstance(obj, np.ndarray) and (len(obj.dtype) > 0):
             obj = numpy2dict(obj)
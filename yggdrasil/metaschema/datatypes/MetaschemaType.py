@@ -1,5 +1,6 @@
 import six
 import copy
+import numpy as np
 import uuid
 import importlib
 import jsonschema
@@ -12,10 +13,79 @@ from yggdrasil.metaschema.datatypes import (
 from yggdrasil.metaschema.properties import get_metaschema_property
 
 
+_header_varying_keys = ['size', 'id', 'request_id', 'response_address',
+                        'address', 'zmq_reply_worker', 'batch',
+                        'batch_datatype', 'binary_body', 'batch_binary_body']
+
+
 def _get_single_array_element(arr):
     return arr[0]
 
 
+def _header_equal(a, b):
+    try:
+        return bool(a == b)
+    except ValueError:  # pragma: debug
+        return False
+
+
+class _FrozenDict(dict):
+    r"""Dictionary that cannot be modified. Used for the datatype shared by
+    headers decoded from the same cached static entries. Copies are
+    regular dictionaries."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("The datatype of a received message is shared with "
+                        "other messages and cannot be modified. Modify a "
+                        "copy instead.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def copy(self):
+        return dict(self)
+
+
+class _FrozenList(list):
+    r"""List that cannot be modified. Copies are regular lists."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("The datatype of a received message is shared with "
+                        "other messages and cannot be modified. Modify a "
+                        "copy instead.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = _readonly
+    reverse = sort = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def copy(self):
+        return list(self)
+
+
+def _freeze(x):
+    if isinstance(x, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in x.items())
+    if isinstance(x, list):
+        return _FrozenList(_freeze(v) for v in x)
+    return x
+
+
+def _array2buffer(arr):
+    if (arr.ndim > 1) and arr.flags.f_contiguous and (not arr.flags.c_contiguous):
+        order = 'F'
+        arr = arr.T
+    else:
+        order = 'C'
+        arr = np.ascontiguousarray(arr)
+    return arr.reshape(-1).view(np.uint8), order
+
+
 @six.add_metaclass(MetaschemaTypeMeta)
 class MetaschemaType(object):
     r"""Base type that should be subclassed by user defined types. Attributes
@@ -141,6 +211,52 @@ class MetaschemaType(object):
         """
         raise NotImplementedError("Method must be overridden by the subclass.")
 
+    @classmethod
+    def supports_binary(cls, typedef):
+        r"""Determine if objects of this type can be encoded as raw binary
+        buffers via encode_data_binary.
+
+        Args:
+            typedef (dict): Type definition for the object.
+
+        Returns:
+            bool: True if the type supports binary encoding, False otherwise.
+
+        """
+        return False
+
+    @classmethod
+    def encode_data_binary(cls, obj, typedef):
+        r"""Encode an object's data as raw binary buffers.
+
+        Args:
+            obj (object): Object to encode.
+            typedef (dict): Type definition that should be used to encode the
+                object.
+
+        Returns:
+            list: Contiguous np.ndarray objects containing the object data.
+
+        """
+        raise NotImplementedError("Method must be overridden by the subclass.")
+
+    @classmethod
+    def decode_data_binary(cls, buffers, typedef):
+        r"""Decode an object from raw binary buffers.
+
+        Args:
+            buffers (iterator): Iterator over tuples containing buffers
+                produced by encode_data_binary and the memory layout ('C'
+                or 'F') of the array in each buffer.
+            typedef (dict): Type definition that should be used to decode the
+                object.
+
+        Returns:
+            object: Decoded object.
+
+        """
+        raise NotImplementedError("Method must be overridden by the subclass.")
+
     @classmethod
     def transform_type(cls, obj, typedef=None):
         r"""Transform an object based on type info.
@@ -346,6 +462,10 @@ class MetaschemaType(object):
             self._typedef[k] = kwargs.pop(k)
         # Validate
         self.validate_definition(self._typedef)
+        # Reset cached headers
+        self._header_encode_cache = None
+        self._header_decode_cache = None
+        self._header_checked_datatype = None
         return kwargs
 
     @classmethod
@@ -535,7 +655,7 @@ class MetaschemaType(object):
 
     @classmethod
     def encode(cls, obj, typedef=None, typedef_validated=False,
-               dont_check=False, **kwargs):
+               dont_check=False, binary=False, **kwargs):
         r"""Encode an object.
 
         Args:
@@ -549,6 +669,8 @@ class MetaschemaType(object):
                 validated again during the encoding process. Defaults to False.
             dont_check (bool, optional): If True, the object will not be
                 checked against the type definition. Defaults to False.
+            binary (bool, optional): If True, the data will be encoded as
+                raw binary buffers via encode_data_binary. Defaults to False.
             **kwargs: Additional keyword arguments are added to the metadata.
 
         Returns:
@@ -571,12 +693,15 @@ class MetaschemaType(object):
         obj_t = cls.transform_type(obj, typedef)
         # Encode
         metadata = cls.encode_type(obj_t, typedef=typedef)
-        data = cls.encode_data(obj_t, metadata)
+        if binary:
+            data = cls.encode_data_binary(obj_t, metadata)
+        else:
+            data = cls.encode_data(obj_t, metadata)
         return metadata, data
 
     @classmethod
     def decode(cls, metadata, data, typedef=None, typedef_validated=False,
-               dont_check=False):
+               dont_check=False, binary=False):
         r"""Decode an object.
 
         Args:
@@ -590,6 +715,9 @@ class MetaschemaType(object):
                 validated again during the encoding process. Defaults to False.
             dont_check (bool, optional): If True, the metadata will not be
                 checked against the type definition. Defaults to False.
+            binary (bool, optional): If True, data is an iterator over raw
+                binary buffers that will be decoded via decode_data_binary.
+                Defaults to False.
 
         Returns:
             object: Decoded object.
@@ -604,7 +732,8 @@ class MetaschemaType(object):
             metatype = metadata.get('type', None)
             if (metatype not in [None, 'bytes']) and is_default_typedef(typedef):
                 new_cls = get_type_class(metatype)
-                return new_cls.decode(metadata, data, dont_check=dont_check)
+                return new_cls.decode(metadata, data, dont_check=dont_check,
+                                      binary=binary)
             if metatype != cls.name:
                 conv_func = conversions.get_conversion(metatype, cls.name)
                 if (((conv_func is None)
@@ -616,14 +745,251 @@ class MetaschemaType(object):
                               typedef_validated=typedef_validated)
         if conv_func:
             new_cls = get_type_class(metadata['type'])
-            out = conv_func(new_cls.decode(metadata, data, dont_check=dont_check))
+            out = conv_func(new_cls.decode(metadata, data, dont_check=dont_check,
+                                           binary=binary))
+        elif binary:
+            out = cls.decode_data_binary(data, metadata)
         else:
             out = cls.decode_data(data, metadata)
         out = cls.transform_type(out, typedef)
         return out
 
+    def encode_header(self, metadata):
+        r"""Encode message metadata as JSON. The encoding of the static
+        portion of the metadata (everything except the entries that change
+        with every message, e.g. size and id) is cached and reused as long
+        as it does not change, so that only the varying entries need to be
+        encoded for each message. The static entries are placed first so
+        that the cached encoding can be recognized by decode_header.
+
+        Args:
+            metadata (dict): Metadata to encode.
+
+        Returns:
+            bytes: Encoded metadata.
+
+        """
+        static = {}
+        varying = {}
+        for k, v in metadata.items():
+            if k in _header_varying_keys:
+                varying[k] = v
+            else:
+                static[k] = v
+        if not static:
+            return encoder.encode_json(varying)
+        cache = self._header_encode_cache
+        if (cache is None) or (not _header_equal(cache[0], static)):
+            cache = (copy.deepcopy(static), encoder.encode_json(static))
+            self._header_encode_cache = cache
+        if not varying:
+            return cache[1]
+        return cache[1][:-1] + b',' + encoder.encode_json(varying)[1:]
+
+    def decode_header(self, header):
+        r"""Decode message metadata from JSON. If the header begins with the
+        same static entries as the previous header (as produced by
+        encode_header), only the remaining varying entries are decoded.
+        The decoded datatype cannot be modified and is shared by all of the
+        headers decoded from the same static entries so that it is neither
+        copied nor checked again for every message.
+
+        Args:
+            header (bytes): Encoded metadata.
+
+        Returns:
+            dict: Decoded metadata.
+
+        """
+        cache = self._header_decode_cache
+        if (cache is not None) and header.startswith(cache[1]):
+            rest = header[len(cache[1]):]
+            varying = None
+            if rest == b'}':
+                varying = {}
+            elif rest.startswith(b','):
+                varying = encoder.decode_json(b'{' + rest[1:])
+            if varying is not None:
+                metadata = dict(cache[0])
+                for k in cache[2]:
+                    metadata[k] = copy.deepcopy(metadata[k])
+                metadata.update(varying)
+                return metadata
+        metadata = encoder.decode_json(header)
+        if 'datatype' in metadata:
+            metadata['datatype'] = _freeze(metadata['datatype'])
+        static = {k: v for k, v in metadata.items()
+                  if k not in _header_varying_keys}
+        self._header_decode_cache = None
+        if static:
+            prefix = encoder.encode_json(static)[:-1]
+            if header.startswith(prefix):
+                # Mutable static entries other than the datatype are copied
+                # for each message
+                mutable = [k for k, v in static.items()
+                           if (k != 'datatype')
+                           and isinstance(v, (dict, list))]
+                for k in mutable:
+                    static[k] = copy.deepcopy(static[k])
+                self._header_decode_cache = (static, prefix, mutable)
+        return metadata
+
+    def serialize_data(self, obj, dont_encode=False, dont_check=False,
+                       binary_body=False, **kwargs):
+        r"""Encode a message without adding a header.
+
+        Args:
+            obj (object): Python object to be encoded.
+            dont_encode (bool, optional): If True, the input message will not
+                be encoded using type specific or JSON encoding. Defaults to
+                False.
+            dont_check (bool, optional): If True, the object being encoded
+                will not be checked against the type definition. Defaults to
+                False.
+            binary_body (bool, optional): If True and the type supports it,
+                the data will be encoded as raw binary buffers rather than
+                JSON. Defaults to False.
+            **kwargs: Additional keyword arguments are passed to encode.
+
+        Returns:
+            tuple(dict, bytes, list): Type definition describing the encoded
+                message (None if the message was not encoded), the encoded
+                message, and the sizes and memory layouts of the buffers
+                comprising a binary encoded message (None if the message
+                was not binary encoded).
+
+        """
+        if ((isinstance(obj, bytes)
+             and ((obj == tools.YGG_MSG_EOF) or kwargs.get('raw', False)
+                  or dont_encode))):
+            return None, obj, None
+        if binary_body and self.supports_binary(self._typedef):
+            typedef, arrays = self.encode(obj, typedef=self._typedef,
+                                          typedef_validated=True,
+                                          dont_check=dont_check, binary=True,
+                                          **kwargs)
+            buffers = [_array2buffer(x) for x in arrays]
+            layout = [[len(x), order] for x, order in buffers]
+            return typedef, b''.join([x for x, _ in buffers]), layout
+        typedef, data = self.encode(obj, typedef=self._typedef,
+                                    typedef_validated=True,
+                                    dont_check=dont_check, **kwargs)
+        return typedef, encoder.encode_json(data), None
+
+    def serialize_body(self, obj, dont_encode=False, dont_check=False,
+                       batch=False, binary_body=False, **kwargs):
+        r"""Encode the body of a message and determine the header entries
+        that describe it.
+
+        Args:
+            obj (object): Python object to be encoded.
+            dont_encode (bool, optional): If True, the input message will not
+                be encoded using type specific or JSON encoding. Defaults to
+                False.
+            dont_check (bool, optional): If True, the object being encoded
+                will not be checked against the type definition. Defaults to
+                False.
+            batch (bool, optional): If True, obj is a list of Python objects
+                that should be encoded together. Defaults to False.
+            binary_body (bool, optional): If True and the type supports it,
+                the data will be encoded as raw binary buffers rather than
+                JSON. Defaults to False.
+            **kwargs: Additional keyword arguments are passed to encode.
+
+        Returns:
+            tuple(dict, bytes, dict): Type definition describing the encoded
+                message (None if the message was not encoded), the encoded
+                message, and header entries describing the batch sizes
+                and/or binary layout of the encoded message.
+
+        """
+        body_metadata = {}
+        if batch:
+            typedef = None
+            data = []
+            batch_sizes = []
+            batch_datatype = {}
+            batch_binary_body = {}
+            for i, x in enumerate(obj):
+                itypedef, idata, ilayout = self.serialize_data(
+                    x, dont_encode=dont_encode, dont_check=dont_check,
+                    binary_body=binary_body, **kwargs)
+                if i == 0:
+                    typedef = itypedef
+                elif itypedef != typedef:
+                    batch_datatype[str(i)] = itypedef
+                if ilayout is not None:
+                    batch_binary_body[str(i)] = ilayout
+                data.append(idata)
+                batch_sizes.append(len(idata))
+            data = b''.join(data)
+            body_metadata['batch'] = batch_sizes
+            if batch_datatype:
+                body_metadata['batch_datatype'] = batch_datatype
+            if batch_binary_body:
+                body_metadata['batch_binary_body'] = batch_binary_body
+        else:
+            typedef, data, layout = self.serialize_data(
+                obj, dont_encode=dont_encode, dont_check=dont_check,
+                binary_body=binary_body, **kwargs)
+            if layout is not None:
+                body_metadata['binary_body'] = layout
+        return typedef, data, body_metadata
+
+    def deserialize_data(self, data, metadata, dont_decode=False,
+                         dont_check=False, keep_buffers=False):
+        r"""Decode a message that has already been separated from its
+        header.
+
+        Args:
+            data (bytes, memoryview): Encoded message.
+            metadata (dict): Header information describing the message.
+            dont_decode (bool, optional): If True, type specific and JSON
+                decoding will not be used to decode the message. Defaults to
+                False.
+            dont_check (bool, optional): If True, the metadata will not be
+                checked against the type definition. Defaults to False.
+            keep_buffers (bool, optional): If True and decoding is not
+                used, memoryview messages are returned without copying
+                them into bytes. Defaults to False.
+
+        Returns:
+            object: Decoded message.
+
+        """
+        if (len(data) == 0) and ('binary_body' not in metadata):
+            return self._empty_msg
+        if (metadata.get('type', None) == 'direct') or dont_decode:
+            if isinstance(data, memoryview) and (not keep_buffers):
+                data = data.tobytes()
+            return data
+        binary = ('binary_body' in metadata)
+        if binary:
+            # Arrays are created from views into the received message
+            data = memoryview(data)
+            buffers = []
+            prev = 0
+            for n, order in metadata['binary_body']:
+                buffers.append((data[prev:(prev + n)], order))
+                prev += n
+            data = iter(buffers)
+        else:
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            data = encoder.decode_json(data)
+        # Skip checking a shared datatype that was already checked
+        if metadata['datatype'] is self._header_checked_datatype:
+            dont_check = True
+        out = self.decode(metadata['datatype'], data, self._typedef,
+                          typedef_validated=True, dont_check=dont_check,
+                          binary=binary)
+        if (not dont_check) and isinstance(metadata['datatype'], _FrozenDict):
+            self._header_checked_datatype = metadata['datatype']
+        return out
+
     def serialize(self, obj, no_metadata=False, dont_encode=False,
-                  dont_check=False, max_header_size=0, **kwargs):
+                  dont_check=False, max_header_size=0, batch=False,
+                  binary_body=False, data_cache=None, **kwargs):
         r"""Serialize a message.
 
         Args:
@@ -640,41 +1006,62 @@ class MetaschemaType(object):
                 should occupy in order to be sent in a single message.
                 A value of 0 indicates that any size header is valid.
                 Defaults to 0.
+            batch (bool, optional): If True, obj is a list of Python objects
+                that should be serialized together under a single header.
+                The size of each message is stored in the 'batch' entry of
+                the header and the type definition is only stored for
+                messages whose type differs from the first. Defaults to
+                False.
+            binary_body (bool, optional): If True and the type supports it
+                (e.g. scalars, arrays, and tables of arrays), the message
+                data is sent as the raw bytes of the underlying arrays
+                rather than being encoded as JSON. The sizes and memory
+                layouts of the arrays are stored in the 'binary_body' entry
+                of the header (or 'batch_binary_body' for batches) so that
+                the receiver can create arrays directly from the received
+                bytes. Defaults to False.
+            data_cache (dict, optional): Dictionary that the serialized
+                message body and the associated type information should be
+                stored in and/or retrieved from. If the dictionary already
+                contains a serialized body (e.g. from serializing the same
+                object for another comm), the body is reused and only the
+                header is constructed. Defaults to None and the body is
+                always serialized.
             **kwargs: Additional keyword arguments are added to the metadata.
 
         Returns:
             bytes, str: Serialized message.
 
         """
-        for k in ['size', 'data', 'datatype']:
+        for k in ['size', 'data', 'datatype', 'batch', 'batch_datatype',
+                  'binary_body', 'batch_binary_body']:
             if k in kwargs:
                 raise RuntimeError("'%s' is a reserved keyword in the metadata." % k)
-        if ((isinstance(obj, bytes)
-             and ((obj == tools.YGG_MSG_EOF) or kwargs.get('raw', False)
-                  or dont_encode))):
+        if (data_cache is not None) and ('body' in data_cache):
+            typedef, data, body_metadata = data_cache['body']
+        else:
+            typedef, data, body_metadata = self.serialize_body(
+                obj, dont_encode=dont_encode, dont_check=dont_check,
+                batch=batch, binary_body=binary_body, **kwargs)
+            if data_cache is not None:
+                data_cache['body'] = (typedef, data, body_metadata)
+        if typedef is None:
             metadata = kwargs
-            data = obj
-            is_raw = True
         else:
-            typedef, data = self.encode(obj, typedef=self._typedef,
-                                        typedef_validated=True,
-                                        dont_check=dont_check, **kwargs)
             metadata = {'datatype': typedef}
             metadata.update(kwargs)
-            is_raw = False
-        if not is_raw:
-            data = encoder.encode_json(data)
+        metadata.update(body_metadata)
         if no_metadata:
             return data
         metadata['size'] = len(data)
         metadata.setdefault('id', str(uuid.uuid4()))
-        header = YGG_MSG_HEAD + encoder.encode_json(metadata) + YGG_MSG_HEAD
+        header = YGG_MSG_HEAD + self.encode_header(metadata) + YGG_MSG_HEAD
         if (max_header_size > 0) and (len(header) > max_header_size):
             metadata_type = metadata
             metadata = {}
             for k in ['address', 'size', 'id', 'request_id',
-                      'response_address', 'zmq_reply',
-                      'zmq_reply_worker', 'model']:
+                      'response_address', 'persistent_response',
+                      'zmq_reply', 'zmq_reply_worker', 'model']:
                 if k in metadata_type:
                     metadata[k] = metadata_type.pop(k)
             assert(metadata)
@@ -690,11 +1077,11 @@ class MetaschemaType(object):
         return msg
     
     def deserialize(self, msg, no_data=False, metadata=None, dont_decode=False,
-                    dont_check=False):
+                    dont_check=False, keep_buffers=False, header=None):
         r"""Deserialize a message.
 
         Args:
-            msg (str, bytes): Message to be deserialized.
+            msg (str, bytes, memoryview): Message to be deserialized.
             no_data (bool, optional): If True, only the metadata is returned.
                 Defaults to False.
             metadata (dict, optional): Metadata that should be used to deserialize
@@ -705,28 +1092,59 @@ class MetaschemaType(object):
                 False.
             dont_check (bool, optional): If True, the metadata will not be
                 checked against the type definition. Defaults to False.
+            keep_buffers (bool, optional): If True and decoding is not
+                used, the data from memoryview messages without a header is
+                returned without copying it into bytes. Defaults to False.
+            header (dict, optional): Header information that was already
+                parsed from msg (e.g. by calling this method with no_data)
+                that should be used instead of decoding the header again.
+                Defaults to None and the header is decoded.
 
         Returns:
             tuple(obj, dict): Deserialized message and header information.
+                If the message is a batch, the deserialized message will be
+                a list of the messages in the batch. The 'datatype' entry
+                in the header information may be shared with other messages,
+                in which case modifying it raises a TypeError. Copies of it
+                can be modified.
 
         Raises:
             TypeError: If msg is not bytes type (str on Python 2).
             ValueError: If msg does not contain the header separator.
 
         """
-        if not isinstance(msg, bytes):
+        if isinstance(msg, memoryview):
+            # Only the data from messages without a header is kept as a view
+            if ((msg[:len(YGG_MSG_HEAD)] == YGG_MSG_HEAD)
+                    or (isinstance(metadata, dict)
+                        and metadata.get('type_in_data', False))):
+                msg = msg.tobytes()
+        elif not isinstance(msg, bytes):
             raise TypeError("Message to be deserialized is not bytes type.")
         # Check for header
-        if msg.startswith(YGG_MSG_HEAD):
+        if isinstance(msg, bytes) and msg.startswith(YGG_MSG_HEAD):
             if metadata is not None:
                 raise ValueError("Metadata in header and provided by keyword.")
-            _, metadata, data = msg.split(YGG_MSG_HEAD, 2)
-            if len(metadata) == 0:
-                metadata = dict(size=len(data))
+            nhead = len(YGG_MSG_HEAD)
+            iend = msg.find(YGG_MSG_HEAD, nhead)
+            if iend < 0:
+                raise ValueError("Header end marker not in message.")
+            if header is not None:
+                metadata = header
+            elif iend == nhead:
+                metadata = dict(size=(len(msg) - iend - nhead))
             else:
-                metadata = encoder.decode_json(metadata)
+                metadata = self.decode_header(msg[nhead:iend])
+            if no_data or (
+                    (('binary_body' in metadata)
+                     or ('batch_binary_body' in metadata))
+                    and ((len(msg) - iend - nhead) >= metadata['size'])):
+                # Avoid copying the body when only the header is needed or
+                # for the binary body of complete messages
+                data = memoryview(msg)[(iend + nhead):]
+            else:
+                data = msg[(iend + nhead):]
         elif isinstance(metadata, dict) and metadata.get('type_in_data', False):
-            assert(msg.count(YGG_MSG_HEAD) == 1)
             typedef, data = msg.split(YGG_MSG_HEAD, 1)
             if len(typedef) > 0:
                 metadata.update(encoder.decode_json(typedef))
@@ -747,16 +1165,35 @@ class MetaschemaType(object):
         # Return based on flags
         if no_data:
             return metadata
-        elif len(data) == 0:
+        elif (('batch' in metadata) and (not metadata['incomplete'])
+              and (not metadata.get('raw', False))):
+            obj = []
+            prev = 0
+            batch_datatype = metadata.get('batch_datatype', {})
+            batch_binary_body = metadata.get('batch_binary_body', {})
+            for i, n in enumerate(metadata['batch']):
+                imetadata = metadata
+                if str(i) in batch_datatype:
+                    imetadata = dict(imetadata,
+                                     datatype=batch_datatype[str(i)])
+                if str(i) in batch_binary_body:
+                    imetadata = dict(imetadata,
+                                     binary_body=batch_binary_body[str(i)])
+                obj.append(self.deserialize_data(
+                    data[prev:(prev + n)], imetadata,
+                    dont_decode=dont_decode, dont_check=dont_check,
+                    keep_buffers=keep_buffers))
+                prev += n
+            return obj, metadata
+        elif ((len(data) == 0) and ('binary_body' not in metadata)
+              and (not metadata['incomplete'])):
             return self._empty_msg, metadata
-        elif (metadata['incomplete'] or metadata.get('raw', False)
-              or (metadata.get('type', None) == 'direct') or dont_decode):
+        elif metadata['incomplete'] or metadata.get('raw', False):
             return data, metadata
-        else:
-            data = encoder.decode_json(data)
-            obj = self.decode(metadata['datatype'], data, self._typedef,
-                              typedef_validated=True, dont_check=dont_check)
-        return obj, metadata
+        return (self.deserialize_data(data, metadata, dont_decode=dont_decode,
+                                      dont_check=dont_check,
+                                      keep_buffers=keep_buffers),
+                metadata)
 
     # TESTING METHODS
     @classmethod
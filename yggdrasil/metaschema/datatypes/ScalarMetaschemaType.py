@@ -183,11 +183,59 @@ class ScalarMetaschemaType(MetaschemaType):
 
         """
         bytes = base64.decodebytes(obj.encode('ascii'))
+        return cls.decode_data_binary(iter([(bytes, 'C')]), typedef)
+
+    @classmethod
+    def supports_binary(cls, typedef):
+        r"""Determine if objects of this type can be encoded as raw binary
+        buffers via encode_data_binary.
+
+        Args:
+            typedef (dict): Type definition for the object.
+
+        Returns:
+            bool: True if the type supports binary encoding, False otherwise.
+
+        """
+        return True
+
+    @classmethod
+    def encode_data_binary(cls, obj, typedef):
+        r"""Encode an object's data as raw binary buffers.
+
+        Args:
+            obj (object): Object to encode.
+            typedef (dict): Type definition that should be used to encode the
+                object.
+
+        Returns:
+            list: Contiguous np.ndarray objects containing the object data.
+
+        """
+        return [cls.to_array(obj)]
+
+    @classmethod
+    def decode_data_binary(cls, buffers, typedef):
+        r"""Decode an object from raw binary buffers. The returned array
+        is a view into the buffer and is not copied.
+
+        Args:
+            buffers (iterator): Iterator over tuples containing buffers
+                produced by encode_data_binary and the memory layout ('C'
+                or 'F') of the array in each buffer.
+            typedef (dict): Type definition that should be used to decode the
+                object.
+
+        Returns:
+            object: Decoded object.
+
+        """
+        buf, order = next(buffers)
         dtype = ScalarMetaschemaProperties.definition2dtype(typedef)
-        arr = np.frombuffer(bytes, dtype=dtype)
+        arr = np.frombuffer(buf, dtype=dtype)
         # arr = np.fromstring(bytes, dtype=dtype)
         if 'shape' in typedef:
-            arr = arr.reshape(typedef['shape'])
+            arr = arr.reshape(typedef['shape'], order=order)
         out = cls.from_array(arr, unit_str=typedef.get('units', None),
                              dtype=dtype, typedef=typedef)
         return out
@@ -211,7 +259,7 @@ class ScalarMetaschemaType(MetaschemaType):
         typedef1 = copy.deepcopy(typedef0)
         typedef1.update(**typedef)
         dtype = ScalarMetaschemaProperties.definition2dtype(typedef1)
-        arr = cls.to_array(obj).astype(dtype, casting='same_kind')
+        arr = cls.to_array(obj).astype(dtype, casting='same_kind', copy=False)
         out = cls.from_array(arr, unit_str=typedef0.get('units', None),
                              dtype=dtype, typedef=typedef)
         return units.convert_to(out, typedef1.get('units', None))
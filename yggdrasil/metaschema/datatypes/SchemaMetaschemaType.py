@@ -1,5 +1,6 @@
 import copy
 import jsonschema
+from yggdrasil.metaschema import get_schema_validator
 from yggdrasil.metaschema.datatypes import get_type_class, _type_registry
 from yggdrasil.metaschema.properties import get_metaschema_property
 from yggdrasil.metaschema.datatypes.JSONObjectMetaschemaType import (
@@ -90,6 +91,7 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
     inherit_properties = ['extract_properties']
     _replaces_existing = False
     example_data = {'type': 'boolean'}
+    _strict_metaschema = None
 
     @classmethod
     def encode_data(cls, obj, typedef):
@@ -122,6 +124,25 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
         """
         return obj
 
+    @classmethod
+    def strict_metaschema(cls):
+        r"""Get the metaschema that schemas are validated against. The
+        type property is required and additional properties are not
+        allowed.
+
+        Returns:
+            dict: Metaschema.
+
+        """
+        if cls._strict_metaschema is None:
+            x = copy.deepcopy(cls.metaschema())
+            x.setdefault('required', [])
+            if 'type' not in x['required']:
+                x['required'].append('type')
+            x['additionalProperties'] = False
+            cls._strict_metaschema = x
+        return cls._strict_metaschema
+
     @classmethod
     def validate(cls, obj, raise_errors=False):
         r"""Validate an object to check if it could be of this type.
@@ -139,12 +160,8 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
                                                          raise_errors=raise_errors):
             return False
         try:
-            x = copy.deepcopy(cls.metaschema())
-            x.setdefault('required', [])
-            if 'type' not in x['required']:
-                x['required'].append('type')
-            x['additionalProperties'] = False
-            jsonschema.validate(obj, x, cls=cls.validator())
+            get_schema_validator(cls.strict_metaschema(),
+                                 key='strict_metaschema').validate(obj)
         except jsonschema.exceptions.ValidationError:
             if raise_errors:
                 raise
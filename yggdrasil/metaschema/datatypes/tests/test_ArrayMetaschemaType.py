@@ -1,4 +1,5 @@
 import numpy as np
+from yggdrasil.metaschema.datatypes import YGG_MSG_HEAD
 from yggdrasil.metaschema.datatypes.tests import (
     test_ScalarMetaschemaType as parent)
 
@@ -18,6 +19,20 @@ class TestOneDArrayMetaschemaType(parent.TestScalarMetaschemaType):
     def assert_result_equal(cls, x, y):
         r"""Assert that serialized/deserialized objects equal."""
         np.testing.assert_array_equal(x, y)
+
+    def test_serialize_binary_body_marker(self):
+        r"""Test serialize/deserialize of a raw binary body that contains
+        the header marker with a header that is moved into the data."""
+        x = np.frombuffer(YGG_MSG_HEAD * self._array.dtype.itemsize,
+                          dtype=self._array.dtype)
+        msg = self.instance.serialize(x, binary_body=True,
+                                      max_header_size=100)
+        metadata = self.instance.deserialize(msg, no_data=True)
+        assert(metadata['type_in_data'])
+        data = msg.split(YGG_MSG_HEAD, 2)[2]
+        y, metadata = self.instance.deserialize(data, metadata=metadata)
+        assert('binary_body' in metadata)
+        self.assert_equal(y.tobytes(), x.tobytes())
         
 
 class TestNDArrayMetaschemaType(parent.TestScalarMetaschemaType):
@@ -278,6 +278,71 @@ class TestMetaschemaType(YggTestClassInfo):
                 y = self.instance.deserialize(msg)
                 self.assert_result_equal(y[0], x)
 
+    def test_header_cache(self):
+        r"""Test serialize/deserialize with cached header encoding."""
+        if (self._cls == 'MetaschemaType') or (len(self._valid_decoded) == 0):
+            return
+        x = self._valid_decoded[0]
+        datatypes = []
+        for request_id in ['a', 'b']:
+            msg = self.instance.serialize(x, request_id=request_id)
+            y, metadata = self.instance.deserialize(msg)
+            self.assert_result_equal(y, x)
+            self.assert_equal(metadata['request_id'], request_id)
+            datatypes.append(metadata['datatype'])
+        assert(datatypes[0] is datatypes[1])
+        # The shared datatype cannot be modified, but copies can
+        self.assert_raises(TypeError, datatypes[1].__setitem__,
+                           'test_property', 'changed')
+        datatype_copy = copy.deepcopy(datatypes[1])
+        datatype_copy['test_property'] = 'changed'
+        self.assert_equal(type(datatype_copy), dict)
+        # Changes to the returned metadata do not affect later messages
+        metadata['test_property'] = 'changed'
+        msg = self.instance.serialize(x, request_id='b')
+        y, metadata = self.instance.deserialize(msg)
+        assert('test_property' not in metadata)
+        assert('test_property' not in metadata['datatype'])
+        # Changes to the static metadata are picked up
+        msg = self.instance.serialize(x, request_id='c', model='modelA')
+        y, metadata = self.instance.deserialize(msg)
+        self.assert_result_equal(y, x)
+        self.assert_equal(metadata['request_id'], 'c')
+        self.assert_equal(metadata['model'], 'modelA')
+        # Entries describing the body of batches and binary messages vary
+        # with every message and are not part of the cached entries
+        for kws in [{'batch': True}, {'batch': True, 'binary_body': True},
+                    {'binary_body': True}]:
+            datatypes = []
+            for n in [1, 2]:
+                xmsg = [x for _ in range(n)] if kws.get('batch', False) else x
+                msg = self.instance.serialize(xmsg, **kws)
+                y, metadata = self.instance.deserialize(msg)
+                datatypes.append(metadata['datatype'])
+                header = msg.split(YGG_MSG_HEAD)[1]
+                assert(header.startswith(
+                    self.instance._header_encode_cache[1][:-1]))
+            assert(datatypes[0] is datatypes[1])
+
+    def test_serialize_binary_body(self):
+        r"""Test serialize/deserialize with a raw binary body."""
+        if (self._cls == 'MetaschemaType') or (len(self._valid_decoded) == 0):
+            return
+        for x in self._valid_decoded:
+            msg = self.instance.serialize(x, binary_body=True)
+            y, metadata = self.instance.deserialize(msg)
+            self.assert_result_equal(y, x)
+            self.assert_equal(
+                ('binary_body' in metadata),
+                self.instance.supports_binary(self.instance._typedef))
+        # Batches
+        x = self._valid_decoded[0]
+        msg = self.instance.serialize([x, x], batch=True, binary_body=True)
+        y, metadata = self.instance.deserialize(msg)
+        self.assert_equal(len(y), 2)
+        for iy in y:
+            self.assert_result_equal(iy, x)
+
     def test_serialize_error(self):
         r"""Test serialization errors."""
         if (self._cls != 'MetaschemaType') and (len(self._valid_decoded) > 0):
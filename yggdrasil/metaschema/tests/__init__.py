@@ -3,6 +3,7 @@ import pprint
 import numpy as np
 import shutil
 import tempfile
+import jsonschema
 import warnings
 from yggdrasil import metaschema
 from yggdrasil.tests import assert_raises, assert_equal
@@ -125,6 +126,23 @@ def test_validate_instance():
         metaschema.validate_instance(v, {'type': k})
 
 
+def test_get_schema_validator():
+    r"""Test get_schema_validator."""
+    x = metaschema.get_schema_validator({'type': 'int', 'precision': 64})
+    y = metaschema.get_schema_validator({'precision': 64, 'type': 'int'})
+    assert(x is y)
+    x.validate(int(1))
+    assert_raises(jsonschema.exceptions.ValidationError, x.validate, 'hello')
+    z = metaschema.get_schema_validator({'type': 'float'}, key='test_key')
+    assert(metaschema.get_schema_validator({}, key='test_key') is z)
+    assert_raises(jsonschema.exceptions.SchemaError,
+                  metaschema.get_schema_validator, {'type': 'invalid'})
+    assert(metaschema.get_schema_key({'function': test_func}))
+    circular = {'type': 'object'}
+    circular['properties'] = {'a': circular}
+    assert_equal(metaschema.get_schema_key(circular), None)
+
+
 def test_normalize_instance():
     r"""Test normalize_instance."""
     for schema, x, y in _normalize_objects:
@@ -6,11 +6,13 @@ import signal
 import traceback
 from pprint import pformat
 from itertools import chain
+from collections import OrderedDict
 import socket
 from yggdrasil.tools import YggClass
 from yggdrasil.config import ygg_cfg, cfg_environment, temp_config
 from yggdrasil import platform, yamlfile
 from yggdrasil.drivers import create_driver
+from yggdrasil.components import import_component
 
 
 COLOR_TRACE = '\033[30;43;22m'
@@ -37,12 +39,18 @@ class YggRunner(YggClass):
             Defaults to environment variable 'RMQ_DEBUG'.
         ygg_debug_prefix (str, optional): Prefix for Ygg debug messages.
             Defaults to namespace.
+        compile_nproc (int, optional): Maximum number of models and
+            libraries that should be compiled at once. Defaults to the
+            general/compile_nproc config option or the number of CPUs if
+            it is not set.
 
     Attributes:
         namespace (str): Name that should be used to uniquely identify any RMQ
             exchange.
         host (str): Name of the host that the models will be launched from.
         rank (int): Rank of this set of models if run in parallel.
+        compile_nproc (int): Maximum number of models and libraries that
+            should be compiled at once.
         modeldrivers (dict): Model drivers associated with this run.
         inputdrivers (dict): Input drivers associated with this run.
         outputdrivers (dict): Output drivers associated with this run.
@@ -57,7 +65,7 @@ class YggRunner(YggClass):
     def __init__(self, modelYmls, namespace=None, host=None, rank=0,
                  ygg_debug_level=None, rmq_debug_level=None,
                  ygg_debug_prefix=None, connection_task_method='thread',
-                 production_run=False):
+                 production_run=False, compile_nproc=None):
         super(YggRunner, self).__init__('runner')
         if namespace is None:
             namespace = ygg_cfg.get('rmq', 'namespace', False)
@@ -67,6 +75,11 @@ class YggRunner(YggClass):
         self.host = host
         self.rank = rank
         self.connection_task_method = connection_task_method
+        if compile_nproc is None:
+            compile_nproc = ygg_cfg.get('general', 'compile_nproc', None)
+        if compile_nproc is None:
+            compile_nproc = os.cpu_count() or 1
+        self.compile_nproc = int(compile_nproc)
         self.modeldrivers = {}
         self.inputdrivers = {}
         self.outputdrivers = {}
@@ -255,11 +268,21 @@ class YggRunner(YggClass):
             object: An instance of the specified driver.
 
         """
+        from yggdrasil.drivers.CompiledModelDriver import CompiledModelDriver
         yml.setdefault('env', {})
         for iod in self.io_drivers(yml['name']):
             yml['env'].update(iod['instance'].env)
             iod['models'].append(yml['name'])
+        # Compilation is done for all models at once by compileModels,
+        # except for models that the user asked not to compile
+        drv_cls = import_component('model', yml['driver'],
+                                   without_schema=True)
+        deferred = (issubclass(drv_cls, CompiledModelDriver)
+                    and (not yml.get('skip_compile', False)))
+        if deferred:
+            yml['skip_compile'] = True
         drv = self.createDriver(yml)
+        yml['_deferred_compile'] = deferred
         if 'client_of' in yml:
             for srv in yml['client_of']:
                 self.modeldrivers[srv]['clients'].append(yml['name'])
@@ -332,11 +355,29 @@ class YggRunner(YggClass):
             self.debug("Loading model drivers")
             for driver in self.modeldrivers.values():
                 self.createModelDriver(driver)
+            self.compileModels()
         except BaseException:  # pragma: debug
             self.error("%s could not be created.", driver['name'])
             self.terminate()
             raise
 
+    def compileModels(self):
+        r"""Compile the models whose compilation was deferred when they
+        were created along with the internal libraries they depend on.
+        Models that the user set skip_compile for are not compiled.
+        Compilation tasks for all of the models are combined so that shared
+        libraries are only compiled once and independent tasks are run in
+        parallel (up to compile_nproc at a time)."""
+        from yggdrasil.drivers.CompiledModelDriver import run_compilation_tasks
+        tasks = OrderedDict()
+        for driver in self.modeldrivers.values():
+            if driver.get('_deferred_compile', False):
+                driver['instance'].get_build_tasks(tasks=tasks)
+        if tasks:
+            self.debug("Compiling %d models/libraries with %d processes",
+                       len(tasks), self.compile_nproc)
+            run_compilation_tasks(tasks, nproc=self.compile_nproc)
+
     def startDrivers(self):
         r"""Start drivers, starting with the IO drivers."""
         self.info('Starting I/O drivers and models on system '
@@ -1,8 +1,12 @@
 import os
 import copy
+import time
 import pprint
+import pickle
+import hashlib
 import yaml
 import json
+import yggdrasil
 from collections import OrderedDict
 from jsonschema.exceptions import ValidationError
 from yggdrasil import metaschema
@@ -11,6 +15,10 @@ from yggdrasil import metaschema
 _schema_fname = os.path.abspath(os.path.join(
     os.path.dirname(__file__), '.ygg_schema.yml'))
 _schema = None
+_subtype_index = None
+_source_hash = None
+_cache_max_files = 200
+_cache_max_age = 30 * 24 * 60 * 60
 
 
 class SchemaDict(OrderedDict):
@@ -58,7 +66,9 @@ def ordered_dump(data, **kwargs):
 def clear_schema():
     r"""Clear global schema."""
     global _schema
+    global _subtype_index
     _schema = None
+    _subtype_index = None
 
 
 def init_schema(fname=None):
@@ -124,6 +134,203 @@ def get_schema(fname=None):
     return out
 
 
+def get_cache_dir():
+    r"""Get the directory where the parsed schema and normalized YAML
+    files are cached.
+
+    Returns:
+        str: Full path to the cache directory. None is returned if caching
+            is disabled by setting the YGG_CACHE_DIR environment variable to
+            'False'.
+
+    """
+    out = os.environ.get('YGG_CACHE_DIR', None)
+    if out is None:
+        from yggdrasil.config import usr_dir
+        out = os.path.join(usr_dir, '.yggdrasil_cache')
+    if (not out) or (out.lower() in ['false', '0', 'none']):
+        return None
+    return os.path.abspath(out)
+
+
+def get_source_hash():
+    r"""Get a hash of the source code for the modules that load and
+    normalize the schema so that cached results are not reused after the
+    code that produced them changes (e.g. in a development install where
+    the version is not updated for every change).
+
+    Returns:
+        str: Hash of the module source code.
+
+    """
+    global _source_hash
+    if _source_hash is None:
+        pkg_dir = os.path.dirname(os.path.abspath(__file__))
+        fnames = [os.path.join(pkg_dir, x) for x in
+                  ['schema.py', 'yamlfile.py', 'components.py']]
+        for root, dirs, files in os.walk(os.path.join(pkg_dir, 'metaschema')):
+            dirs[:] = sorted(x for x in dirs if x != 'tests')
+            fnames += [os.path.join(root, x) for x in sorted(files)
+                       if x.endswith('.py')]
+        h = hashlib.sha256()
+        for x in fnames:
+            with open(x, 'rb') as fd:
+                h.update(fd.read())
+        _source_hash = h.hexdigest()
+    return _source_hash
+
+
+def get_cache_file(prefix, *contents):
+    r"""Get the name of the cache file for a set of contents. The file name
+    contains a hash of the contents, the yggdrasil version, and the source
+    code used to normalize the schema so that changes to any of them will
+    result in a different file.
+
+    Args:
+        prefix (str): Prefix identifying the type of information cached.
+        *contents (str, bytes): Contents that uniquely identify the cached
+            information.
+
+    Returns:
+        str: Full path to the cache file. None is returned if caching is
+            disabled.
+
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    h = hashlib.sha256(yggdrasil.__version__.encode('utf-8'))
+    h.update(get_source_hash().encode('utf-8'))
+    for x in contents:
+        if isinstance(x, str):
+            x = x.encode('utf-8')
+        h.update(x)
+    return os.path.join(cache_dir, '%s_%s.pkl' % (prefix, h.hexdigest()))
+
+
+def read_cache(fname):
+    r"""Load cached information from a file.
+
+    Args:
+        fname (str): Full path to the cache file.
+
+    Returns:
+        object: Cached information. None is returned if fname is None, the
+            file dosn't exist, or the file cannot be loaded.
+
+    """
+    if (fname is None) or (not os.path.isfile(fname)):
+        return None
+    try:
+        with open(fname, 'rb') as fd:
+            out = pickle.load(fd)
+        # Mark the file as used so that it is not pruned
+        os.utime(fname)
+        return out
+    except BaseException:  # pragma: debug
+        return None
+
+
+def write_cache(fname, obj):
+    r"""Save information to a cache file. The file is first written to a
+    temporary file and then moved so that other processes never read a
+    partially written file. Errors are ignored as caching is optional.
+    Old cache files are pruned after the new file is written.
+
+    Args:
+        fname (str): Full path to the cache file. If None, nothing is
+            written.
+        obj (object): Information that should be cached.
+
+    """
+    if fname is None:
+        return
+    temp = '%s.%d' % (fname, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(fname), exist_ok=True)
+        with open(temp, 'wb') as fd:
+            pickle.dump(obj, fd)
+        os.replace(temp, fname)
+    except BaseException:  # pragma: debug
+        if os.path.isfile(temp):
+            os.remove(temp)
+        return
+    prune_cache(os.path.dirname(fname))
+
+
+def prune_cache(cache_dir=None, max_files=None, max_age=None):
+    r"""Remove cache files that have not been used recently.
+
+    Args:
+        cache_dir (str, optional): Cache directory that should be pruned.
+            Defaults to the directory returned by get_cache_dir.
+        max_files (int, optional): Maximum number of files that should be
+            kept. The least recently used files are removed first. Defaults
+            to _cache_max_files.
+        max_age (float, optional): Time (in seconds) since a file was last
+            used after which it is removed. Defaults to _cache_max_age.
+
+    """
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    if max_files is None:
+        max_files = _cache_max_files
+    if max_age is None:
+        max_age = _cache_max_age
+    if (cache_dir is None) or (not os.path.isdir(cache_dir)):
+        return
+    files = []
+    for x in os.listdir(cache_dir):
+        if not x.endswith('.pkl'):
+            continue
+        x = os.path.join(cache_dir, x)
+        try:
+            files.append((os.path.getmtime(x), x))
+        except OSError:  # pragma: debug
+            pass
+    files.sort(reverse=True)
+    tmin = time.time() - max_age
+    for i, (t, x) in enumerate(files):
+        if (i >= max_files) or (t < tmin):
+            try:
+                os.remove(x)
+            except OSError:  # pragma: debug
+                pass
+
+
+def get_subtype_index():
+    r"""Get the mapping from component subtypes to the names of the classes
+    that implement them. The index is created from the schema the first
+    time that it is needed and cached so that other processes can import
+    components without loading the full schema.
+
+    Returns:
+        dict: Mapping from component type to a mapping from subtype to class
+            name. An empty dictionary is returned if the schema has not been
+            created yet or caching is disabled.
+
+    """
+    global _subtype_index
+    if _subtype_index is None:
+        # Calls during the index creation get an empty index
+        _subtype_index = {}
+        out = None
+        if ((os.path.isfile(_schema_fname)
+             and (not os.environ.get('YGG_RUNNING_YGGSCHEMA', None)))):
+            with open(_schema_fname, 'r') as fd:
+                contents = fd.read()
+            cache_file = get_cache_file(
+                'index', hashlib.sha256(contents.encode('utf-8')).hexdigest())
+            out = read_cache(cache_file)
+            if (out is None) and ((cache_file is not None)
+                                  or (_schema is not None)):
+                s = get_schema()
+                out = {k: s[k].subtype2class for k in s.keys()}
+                write_cache(cache_file, out)
+        _subtype_index = out or {}
+    return _subtype_index
+
+
 def convert_extended2base(s):
     r"""Covert schema from the extended form to a strictly JSON form.
 
@@ -636,6 +843,11 @@ class SchemaRegistry(object):
         required (list, optional): Components that are required. Defaults to
             ['comm', 'file', 'model', 'connection']. Ignored if registry is None.
 
+    Attributes:
+        source_hash (str): Hash of the contents of the file the schema was
+            loaded from. None if the schema was not loaded from a file or
+            has been modified since.
+
     Raises:
         ValueError: If registry is provided and one of the required components
             is missing.
@@ -649,6 +861,7 @@ class SchemaRegistry(object):
         super(SchemaRegistry, self).__init__()
         self._cache = {}
         self._storage = SchemaDict()
+        self.source_hash = None
         if required is None:
             required = self._default_required_components
         self.required_components = required
@@ -664,6 +877,7 @@ class SchemaRegistry(object):
     def add(self, k, v, verify=False):
         r"""Add a new component schema to the registry."""
         self._cache = {}
+        self.source_hash = None
         self._storage[k] = v
         if verify:
             metaschema.validate_schema(self.schema)
@@ -911,13 +1125,19 @@ class SchemaRegistry(object):
         """
         with open(fname, 'r') as f:
             contents = f.read()
-            schema = ordered_load(contents, Loader=yaml.SafeLoader)
+        contents_hash = hashlib.sha256(contents.encode('utf-8')).hexdigest()
+        cache_file = get_cache_file('schema', contents_hash)
+        schema = read_cache(cache_file)
         if schema is None:
-            raise Exception("Failed to load schema from %s" % fname)
+            schema = ordered_load(contents, Loader=yaml.SafeLoader)
+            if schema is None:
+                raise Exception("Failed to load schema from %s" % fname)
+            write_cache(cache_file, schema)
         # Create components
         for k, v in schema.get('definitions', {}).items():
             icomp = ComponentSchema.from_schema(v, schema_registry=self)
             self.add(k, icomp)
+        self.source_hash = contents_hash
 
     def save(self, fname):
         r"""Save the schema to a file.
@@ -955,8 +1175,11 @@ class SchemaRegistry(object):
                 get_component_schema.
 
         """
-        comp_schema = self.get_component_schema(comp_name, **kwargs)
-        return metaschema.validate_instance(obj, comp_schema)
+        cache_key = ('component', comp_name) + tuple(sorted(kwargs.items()))
+        if cache_key not in self._cache:
+            self._cache[cache_key] = self.get_component_schema(
+                comp_name, **kwargs)
+        return metaschema.validate_instance(obj, self._cache[cache_key])
 
     def normalize(self, obj, backwards_compat=False, **kwargs):
         r"""Normalize an object against this schema.
@@ -137,6 +137,25 @@ class AsciiTableSerialize(DefaultSerialize):
             out = serialize.format_message(args, self.format_str)
         return tools.str2bytes(out)
 
+    def func_serialize_batch(self, args):
+        r"""Serialize a batch of messages.
+
+        Args:
+            args (list): Rows or arrays to be serialized.
+
+        Returns:
+            list: Serialized messages.
+
+        """
+        if self.as_array:
+            return super(AsciiTableSerialize, self).func_serialize_batch(args)
+        if self.format_str is None:
+            raise RuntimeError("Format string is not defined.")
+        field_names = self.get_field_names()
+        return [tools.str2bytes(serialize.format_message(
+            self.datatype.coerce_type(x, key_order=field_names),
+            self.format_str)) for x in args]
+
     def func_deserialize(self, msg):
         r"""Deserialize a message.
 
@@ -187,6 +206,33 @@ class AsciiTableSerialize(DefaultSerialize):
         else:
             return 'readline'
 
+    def get_chunk_end(self, msg, state=None):
+        r"""Determine how much of a partial file (e.g. a chunk read from the
+        file) can be deserialized on its own.
+
+        Args:
+            msg (bytes): Message read from a file that may end part way
+                through a row.
+            state (dict, optional): State that is passed to successive calls
+                for the same chunk as it grows (each msg begins with the
+                previous one) so that the part of msg that was already
+                searched for a newline is not searched again. Defaults to
+                None.
+
+        Returns:
+            int: Number of bytes at the start of msg that contain complete
+                rows. 0 if msg does not contain any.
+
+        """
+        start = 0
+        if state is not None:
+            start = max(state.get('pos', 0) - len(self.newline) + 1, 0)
+            state['pos'] = len(msg)
+        idx = msg.rfind(self.newline, start)
+        if idx < 0:
+            return 0
+        return idx + len(self.newline)
+
     def serialize_file_header(self):
         r"""Return the serialized header information that should be prepended
         to files serialized using this class.
@@ -9,6 +9,7 @@ class DirectSerialize(SerializeBase):
     _seritype = 'direct'
     _schema_subtype_description = ('Direct serialization of bytes.')
     default_datatype = {'type': 'bytes'}
+    deserializes_buffers = True
 
     def func_serialize(self, args):
         r"""Serialize a message.
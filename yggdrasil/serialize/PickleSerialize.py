@@ -1,9 +1,115 @@
 import sys
 import pickle
-import io as sio
+import struct
+import pickletools
 from yggdrasil.serialize.DefaultSerialize import DefaultSerialize
 
 
+# Number of bytes taken by the argument of each opcode or the format of
+# the length that precedes the argument
+_arg_lengths = {pickletools.TAKEN_FROM_ARGUMENT1: '<B',
+                pickletools.TAKEN_FROM_ARGUMENT4: '<i',
+                pickletools.TAKEN_FROM_ARGUMENT4U: '<I',
+                pickletools.TAKEN_FROM_ARGUMENT8U: '<Q'}
+_opcode_args = {}
+for _op in pickletools.opcodes:
+    if _op.arg is None:
+        _opcode_args[ord(_op.code)] = 0
+    elif _op.arg.name == 'stringnl_noescape_pair':
+        _opcode_args[ord(_op.code)] = (pickletools.UP_TO_NEWLINE, 2)
+    elif _op.arg.n == pickletools.UP_TO_NEWLINE:
+        _opcode_args[ord(_op.code)] = (pickletools.UP_TO_NEWLINE, 1)
+    elif _op.arg.n < 0:
+        _opcode_args[ord(_op.code)] = _arg_lengths[_op.arg.n]
+    else:
+        _opcode_args[ord(_op.code)] = _op.arg.n
+_STOP = ord(pickle.STOP)
+_FRAME = ord(pickle.FRAME)
+# Opcodes that can follow a frame in the same pickle (large bytes & strings
+# are written outside of frames)
+_frame_successors = set(
+    ord(_op.code) for _op in pickletools.opcodes
+    if _op.name in ['FRAME', 'BINBYTES', 'BINBYTES8', 'BYTEARRAY8',
+                    'BINUNICODE', 'BINUNICODE8'])
+
+
+def _find_newline(msg, pos):
+    r"""Find the next newline in a message without copying the message.
+
+    Args:
+        msg (bytes, memoryview): Message to search.
+        pos (int): Position to start the search from.
+
+    Returns:
+        int: Position of the next newline, -1 if there is not one.
+
+    """
+    if not isinstance(msg, memoryview):
+        return msg.find(b'\n', pos)
+    nwin = 256
+    while pos < len(msg):
+        idx = msg[pos:(pos + nwin)].tobytes().find(b'\n')
+        if idx >= 0:
+            return pos + idx
+        pos += nwin
+    return -1
+
+
+def find_pickle_end(msg, pos=0):
+    r"""Find the end of the pickle in a message by scanning its opcodes
+    (skipping their arguments) for STOP without building any objects.
+    Frames (protocol 4+) are skipped as a whole when the opcode following
+    them shows that the pickle continues past the frame.
+
+    Args:
+        msg (bytes, memoryview): Message containing the pickle.
+        pos (int, optional): Position of the opcode in msg that the scan
+            should start from. Defaults to 0.
+
+    Returns:
+        tuple(int, int): The position just after the pickle's STOP opcode
+            (-1 if msg ends before the pickle does) and the position of the
+            last opcode reached that the scan can be resumed from if more
+            data is added to the end of msg.
+
+    Raises:
+        ValueError: If an invalid opcode is encountered.
+
+    """
+    nmsg = len(msg)
+    while pos < nmsg:
+        code = msg[pos]
+        if code not in _opcode_args:
+            raise ValueError("Invalid pickle opcode %r at %d" % (code, pos))
+        if code == _STOP:
+            return pos + 1, pos + 1
+        arg = _opcode_args[code]
+        end = pos + 1
+        if isinstance(arg, int):
+            end += arg
+        elif isinstance(arg, tuple):
+            for _ in range(arg[1]):
+                idx = _find_newline(msg, end)
+                if idx < 0:
+                    return -1, pos
+                end = idx + 1
+        else:
+            nlen = struct.calcsize(arg)
+            if (end + nlen) > nmsg:
+                return -1, pos
+            end += nlen + struct.unpack_from(arg, msg, end)[0]
+        if end > nmsg:
+            return -1, pos
+        if code == _FRAME:
+            frame_end = end + struct.unpack_from('<Q', msg, pos + 1)[0]
+            if frame_end > nmsg:
+                return -1, pos
+            if (frame_end < nmsg) and (msg[frame_end] in _frame_successors):
+                end = frame_end
+        pos = end
+    return -1, pos
+
+
 class PickleSerialize(DefaultSerialize):
     r"""Class for serializing a python object into a bytes message by pickling.
     """
@@ -13,6 +119,7 @@ class PickleSerialize(DefaultSerialize):
                                    'pickle.')
     _default_type = {'type': 'bytes'}
     is_framed = True
+    deserializes_buffers = True
 
     def func_serialize(self, args):
         r"""Serialize a message.
@@ -51,15 +158,46 @@ class PickleSerialize(DefaultSerialize):
                 are found, an empty string will be returned.
 
         """
-        fd = sio.BytesIO(msg)
         try:
-            pickle.load(fd)
-            used = fd.tell()
-        except BaseException:
+            used = max(find_pickle_end(msg)[0], 0)
+        except ValueError:
             used = 0
-        fd.close()
         return msg[:used]
 
+    def get_chunk_end(self, msg, state=None):
+        r"""Determine how much of a partial file (e.g. a chunk read from the
+        file) can be deserialized on its own. The ends of frames are found
+        by scanning pickle opcodes so that objects are not built.
+
+        Args:
+            msg (bytes, memoryview): Message read from a file that may end
+                part way through a serialized object.
+            state (dict, optional): State that is passed to successive calls
+                for the same chunk as it grows (each msg begins with the
+                previous one) so that the scan resumes at the last opcode
+                reached by the previous call. Defaults to None.
+
+        Returns:
+            int: Number of bytes at the start of msg that contain complete
+                serialized objects. 0 if msg does not contain any.
+
+        """
+        if state is None:
+            state = {}
+        out = state.get('end', 0)
+        pos = state.get('pos', out)
+        while out < len(msg):
+            try:
+                end, pos = find_pickle_end(msg, pos)
+            except ValueError:
+                break
+            if end < 0:
+                break
+            out = end
+        state['end'] = out
+        state['pos'] = pos
+        return out
+
     @classmethod
     def concatenate(cls, objects, **kwargs):
         r"""Concatenate objects to get object that would be recieved if
@@ -43,6 +43,9 @@ class SerializeBase(tools.YggClass):
             multiple serialized objects to be recovered from a single message.
         concats_as_str (bool): True if serialized objects can be concatenated
             directly as strings.
+        deserializes_buffers (bool): True if func_deserialize can operate on
+            a memoryview (e.g. of a memory mapped file) so that the message
+            does not need to be copied into bytes before deserialization.
         encoded_datatype (schema): JSON schema defining the type of object
             produced by the class's func_serialize method. For most classes
             this will be {'type': 'bytes'}, indicating that the method will
@@ -71,6 +74,7 @@ class SerializeBase(tools.YggClass):
     default_read_meth = 'read'
     is_framed = False
     concats_as_str = True
+    deserializes_buffers = False
     
     def __init__(self, **kwargs):
         if ('format_str' in kwargs):
@@ -285,6 +289,33 @@ class SerializeBase(tools.YggClass):
     def read_meth(self):
         r"""str: Method that should be used to read data for deserialization."""
         return self.default_read_meth
+
+    def get_chunk_end(self, msg, state=None):
+        r"""Determine how much of a partial file (e.g. a chunk read from the
+        file) can be deserialized on its own.
+
+        Args:
+            msg (bytes): Message read from a file that may end part way
+                through a serialized object.
+            state (dict, optional): State that is passed to successive calls
+                for the same chunk as it grows (each msg begins with the
+                previous one) so that classes can resume their search from
+                where the previous call left off. Defaults to None.
+
+        Returns:
+            int: Number of bytes at the start of msg that contain complete
+                serialized objects. 0 if msg does not contain any.
+
+        """
+        if self.is_framed:
+            out = 0
+            buf = memoryview(msg)
+            frame = self.get_first_frame(buf)
+            while frame:
+                out += len(frame)
+                frame = self.get_first_frame(buf[out:])
+            return out
+        return len(msg)
         
     @classmethod
     def seri_kws(cls):
@@ -494,7 +525,9 @@ class SerializeBase(tools.YggClass):
                        'commtype', 'filetype', 'response_address', 'request_id',
                        'append', 'in_temp', 'is_series', 'working_dir', 'fmts',
                        'model_driver', 'env', 'send_converter', 'recv_converter',
-                       'typedef_base', 'client_model', 'closed_clients']
+                       'typedef_base', 'client_model', 'closed_clients',
+                       'batch', 'batch_datatype', 'binary_body',
+                       'batch_binary_body', 'persistent_response']
         kws = list(kwargs.keys())
         for k in kws:
             if (k in _remove_kws) or k.startswith('zmq'):
@@ -503,8 +536,9 @@ class SerializeBase(tools.YggClass):
         for k in self._schema_properties.keys():
             if (k in kwargs) and (k != 'datatype'):
                 setattr(self, k, kwargs.pop(k))
-        # Create preliminary typedef
-        typedef = kwargs.pop('datatype', {})
+        # Create preliminary typedef (copied as the datatype from a received
+        # header cannot be modified)
+        typedef = copy.deepcopy(kwargs.pop('datatype', {}))
         # Update extra keywords
         if (len(kwargs) > 0):
             self.extra_kwargs.update(kwargs)
@@ -649,6 +683,18 @@ class SerializeBase(tools.YggClass):
         """
         raise NotImplementedError("func_serialize not implemented.")
 
+    def func_serialize_batch(self, args):
+        r"""Serialize a batch of messages.
+
+        Args:
+            args (list): Messages to be serialized.
+
+        Returns:
+            list: Serialized messages.
+
+        """
+        return [self.func_serialize(x) for x in args]
+
     def func_deserialize(self, msg):
         r"""Deserialize a message.
 
@@ -662,7 +708,8 @@ class SerializeBase(tools.YggClass):
         raise NotImplementedError("func_deserialize not implemented.")
     
     def serialize(self, args, header_kwargs=None, add_serializer_info=False,
-                  no_metadata=False, max_header_size=0):
+                  no_metadata=False, max_header_size=0, batch=False,
+                  binary_body=False, data_cache=None):
         r"""Serialize a message.
 
         Args:
@@ -677,6 +724,22 @@ class SerializeBase(tools.YggClass):
                 should occupy in order to be sent in a single message.
                 A value of 0 indicates that any size header is valid.
                 Defaults to 0.
+            batch (bool, optional): If True, args is a list of messages
+                that should be serialized together under a single header.
+                Defaults to False.
+            binary_body (bool, optional): If True, the data for types that
+                support it (e.g. arrays and tables of arrays) will be sent
+                as raw bytes rather than being encoded as JSON. Defaults to
+                False.
+            data_cache (dict, optional): Dictionary that intermediate
+                results of serializing args (the output of func_serialize
+                and the encoded message body) should be stored in and/or
+                retrieved from so that the same message can be serialized
+                for multiple comms with different headers without encoding
+                the message body more than once. The dictionary should
+                only be shared between serializers with the same type
+                definition and serialization functions. Defaults to None
+                and the message body is always encoded.
 
         Returns:
             bytes, str: Serialized message.
@@ -688,11 +751,16 @@ class SerializeBase(tools.YggClass):
         """
         if header_kwargs is None:
             header_kwargs = {}
-        if isinstance(args, bytes) and (args == tools.YGG_MSG_EOF):
-            header_kwargs['raw'] = True
-        self.initialize_from_message(args, **header_kwargs)
+        if batch:
+            first = args[0]
+        else:
+            first = args
+            if isinstance(args, bytes) and (args == tools.YGG_MSG_EOF):
+                header_kwargs['raw'] = True
+        self.initialize_from_message(first, **header_kwargs)
         metadata = {'no_metadata': no_metadata,
-                    'max_header_size': max_header_size}
+                    'max_header_size': max_header_size,
+                    'binary_body': binary_body}
         if add_serializer_info:
             self.debug("serializer_info = %s", str(self.serializer_info))
             metadata.update(self.serializer_info)
@@ -705,34 +773,50 @@ class SerializeBase(tools.YggClass):
             if self.func_serialize is None:
                 data = args
             else:
-                data = self.func_serialize(args)
+                if (data_cache is not None) and ('func_serialize' in data_cache):
+                    data = data_cache['func_serialize']
+                elif batch:
+                    data = self.func_serialize_batch(args)
+                else:
+                    data = self.func_serialize(args)
+                if data_cache is not None:
+                    data_cache['func_serialize'] = data
                 if (self.encoded_typedef['type'] == 'bytes'):
-                    if not isinstance(data, bytes):
-                        raise TypeError(("Serialization function returned object "
-                                         + "of type '%s', not required '%s' type.")
-                                        % (type(data), bytes))
+                    for x in (data if batch else [data]):
+                        if not isinstance(x, bytes):
+                            raise TypeError(
+                                ("Serialization function returned object "
+                                 + "of type '%s', not required '%s' type.")
+                                % (type(x), bytes))
                     metadata['dont_encode'] = True
                     if not no_metadata:
                         metadata['metadata'] = {
                             'datatype': self.datatype.encode_type(
-                                args, typedef=self.typedef)}
+                                first, typedef=self.typedef)}
         validate_msgs = os.environ.get('YGG_VALIDATE_MESSAGES', 'first').lower()
         if (((self.initialized and (validate_msgs == 'first'))
              or (validate_msgs in ['false', '0']))):
             metadata.setdefault('dont_check', True)
-        out = self.encoded_datatype.serialize(data, **metadata)
+        out = self.encoded_datatype.serialize(data, batch=batch,
+                                              data_cache=data_cache,
+                                              **metadata)
         return out
 
     def deserialize(self, msg, **kwargs):
         r"""Deserialize a message.
 
         Args:
-            msg (str, bytes): Message to be deserialized.
+            msg (str, bytes, memoryview): Message to be deserialized.
             **kwargs: Additional keyword arguments are passed to the deserialize
                 method of the datatype class.
 
         Returns:
             tuple(obj, dict): Deserialized message and header information.
+                If the message is a batch, the deserialized message will be
+                a list of the messages in the batch. The 'datatype' entry
+                in the header information may be shared with other messages,
+                in which case modifying it raises a TypeError. Copies of it
+                can be modified.
 
         Raises:
             TypeError: If msg is not bytes type (str on Python 2).
@@ -741,6 +825,14 @@ class SerializeBase(tools.YggClass):
         if (((self.func_deserialize is not None)
              and (self.encoded_typedef['type'] == 'bytes'))):
             kwargs['dont_decode'] = True
+        if isinstance(msg, memoryview):
+            # The datatype only copies the parts of a view that it decodes
+            # so views are only copied here if they would be passed to
+            # func_deserialize as is
+            if self.deserializes_buffers:
+                kwargs['keep_buffers'] = True
+            elif kwargs.get('dont_decode', False):
+                msg = msg.tobytes()
         validate_msgs = os.environ.get('YGG_VALIDATE_MESSAGES', 'first').lower()
         if (((self.initialized and (validate_msgs == 'first'))
              or (validate_msgs in ['false', '0']))):
@@ -758,16 +850,20 @@ class SerializeBase(tools.YggClass):
                     metadata = metadata.pop('metadata')
                 if not self.initialized:
                     self.update_serializer(extract=True, **metadata)
-                out = self.func_deserialize(out)
+                if 'batch' in metadata:
+                    out = [self.func_deserialize(x) for x in out]
+                else:
+                    out = self.func_deserialize(out)
         # Update serializer
         if not ((metadata.get('size', 0) == 0)
                 or metadata.get('incomplete', False)
                 or metadata.get('raw', False)):
             typedef_base = metadata.pop('typedef_base', {})
-            typedef = copy.deepcopy(metadata)
-            typedef.setdefault('datatype', {})
-            typedef['datatype'].update(typedef_base)
-            self.initialize_serializer(typedef, extract=True)
+            if not self.initialized:
+                typedef = copy.deepcopy(metadata)
+                typedef.setdefault('datatype', {})
+                typedef['datatype'].update(typedef_base)
+                self.initialize_serializer(typedef, extract=True)
         return out, metadata
 
     def enable_file_header(self):  # pragma: no cover
@@ -52,6 +52,30 @@ class WOFOSTParamSerialize(AsciiMapSerialize):
             lines.append(iline)
         return tools.str2bytes('\n'.join(lines))
 
+    def get_chunk_end(self, msg, state=None):
+        r"""Determine how much of a partial file (e.g. a chunk read from the
+        file) can be deserialized on its own. Array values continue onto
+        indented lines so the chunk ends before the last unindented line.
+
+        Args:
+            msg (bytes): Message read from a file that may end part way
+                through a parameter.
+            state (dict, optional): State that is passed to successive calls
+                for the same chunk as it grows. Unused by this class.
+
+        Returns:
+            int: Number of bytes at the start of msg that contain complete
+                parameters. 0 if msg does not contain any.
+
+        """
+        idx = msg.rfind(self.newline)
+        while idx >= 0:
+            end = idx + len(self.newline)
+            if msg[end:(end + 1)].strip():
+                return end
+            idx = msg.rfind(self.newline, 0, idx)
+        return 0
+
     @classmethod
     def parse_units(cls, x):
         r"""Parse units.
@@ -1,18 +1,9 @@
 import re
 import copy
+import warnings
 import numpy as np
-import pandas
 import io as sio
 from yggdrasil import platform, units, scanf, tools
-try:
-    from astropy.io import ascii as apy_ascii
-    from astropy.table import Table as apy_Table
-    _use_astropy = True
-except ImportError:  # pragma: no cover
-    apy_ascii, apy_Table = None, None
-    # print("astropy is not installed, reading/writing as an array will be "
-    #       + "disabled. astropy can be installed using 'pip install astropy'.")
-    _use_astropy = False
 
 
 _fmt_char = b'%'
@@ -23,6 +14,27 @@ _fmt_char_str = _fmt_char.decode("utf-8")
 _default_comment_str = _default_comment.decode("utf-8")
 _default_delimiter_str = _default_delimiter.decode("utf-8")
 _default_newline_str = _default_newline.decode("utf-8")
+_row_format_cache = {}
+_table_format_cache = {}
+
+
+def get_astropy():
+    r"""Import the astropy modules used to read/write tables. astropy is slow
+    to import so it is only imported when it will be used.
+
+    Returns:
+        tuple: astropy.io.ascii module and astropy.table.Table class. None is
+            returned for both if astropy is not installed.
+
+    """
+    try:
+        from astropy.io import ascii as apy_ascii
+        from astropy.table import Table as apy_Table
+    except ImportError:  # pragma: no cover
+        # print("astropy is not installed, reading/writing as an array will be "
+        #       + "disabled. astropy can be installed using 'pip install astropy'.")
+        apy_ascii, apy_Table = None, None
+    return apy_ascii, apy_Table
 
 
 def extract_formats(fmt_str):
@@ -304,7 +316,7 @@ def format_message(args, fmt_str):
     """
     if not isinstance(args, (tuple, list)):
         args = (args, )
-    nfmt = len(extract_formats(fmt_str))
+    nfmt = compile_row_format(fmt_str)[0]
     args_ = []
     if len(args) < nfmt:
         raise RuntimeError("Number of arguments (%d) does not match " % len(args)
@@ -323,6 +335,38 @@ def format_message(args, fmt_str):
     return out
 
 
+def compile_row_format(fmt_str):
+    r"""Get the information required to parse table rows using a format
+    string. The information is cached for each format string so that it is
+    only computed once when parsing many rows.
+
+    Args:
+        fmt_str (str, bytes): Format string that should be used to parse
+            rows.
+
+    Returns:
+        tuple(int, str, list): The number of format codes in the format
+            string, the version of the format string that can be parsed by
+            scanf (None if there are no format codes), and the numpy data
+            type for each format code (None if there is only one format
+            code).
+
+    """
+    out = _row_format_cache.get(fmt_str, None)
+    if out is None:
+        nfmt = len(extract_formats(fmt_str))
+        py_fmt_str = None
+        if nfmt > 0:
+            py_fmt_str = tools.bytes2str(cformat2pyscanf(fmt_str))
+        dtype_list = None
+        if nfmt > 1:
+            dtype = cformat2nptype(fmt_str)
+            dtype_list = [dtype[i] for i in range(nfmt)]
+        out = (nfmt, py_fmt_str, dtype_list)
+        _row_format_cache[fmt_str] = out
+    return out
+
+
 def process_message(msg, fmt_str):
     r"""Extract python objects from a message using a format string.
 
@@ -342,16 +386,16 @@ def process_message(msg, fmt_str):
     """
     if not isinstance(msg, (str, bytes)):
         raise TypeError("Message must be a string or bytes string type.")
-    nfmt = len(extract_formats(fmt_str))
-    py_fmt_str = cformat2pyscanf(fmt_str)
+    nfmt, py_fmt_str, dtype_list = compile_row_format(fmt_str)
+    if nfmt == 0:
+        raise ValueError("Could not locate any format codes in the "
+                         + "provided format string (%s)." % fmt_str)
     args = scanf.scanf(py_fmt_str, msg)
     if args is None:
         nargs = 0
     else:
         nargs = len(args)
-        if len(args) > 1:
-            dtype = cformat2nptype(fmt_str)
-            dtype_list = [dtype[i] for i in range(nargs)]
+        if (nargs > 1) and (nargs == nfmt):
             args = tuple([np.array([a], idtype)[0] for
                           a, idtype in zip(args, dtype_list)])
     if nargs != nfmt:
@@ -644,6 +688,42 @@ def table2format(fmts=[], delimiter=None, newline=None, comment=None):
     return fmt_str
 
 
+def format_table_rows(arr, fmt_str):
+    r"""Format every element in a structured array as a table row. Each
+    column is converted to Python objects at once so that every row is
+    formatted with a single operation. The result is the same as calling
+    format_message for each element.
+
+    Args:
+        arr (np.ndarray): Structured array with one field for each
+            column in the format string.
+        fmt_str (str, bytes): Format string that should be used to format
+            each row.
+
+    Returns:
+        list: Formatted rows. The type of each row will match the type of
+            fmt_str. None if the array could not be formatted this way.
+
+    """
+    if arr.dtype.names is None:
+        return None
+    cols = []
+    for name in arr.dtype.names:
+        col = arr[name]
+        if col.dtype.kind == 'c':
+            cols += [col.real.tolist(), col.imag.tolist()]
+        elif (col.dtype.kind == 'U') and isinstance(fmt_str, bytes):
+            cols.append(np.char.encode(col, 'utf-8').tolist())
+        elif (col.dtype.kind == 'S') and isinstance(fmt_str, str):
+            cols.append(np.char.decode(col, 'utf-8').tolist())
+        else:
+            cols.append(col.tolist())
+    try:
+        return [fmt_str % row for row in zip(*cols)]
+    except TypeError:
+        return None
+
+
 def array_to_table(arrs, fmt_str, use_astropy=False):
     r"""Serialize an array as an ASCII table.
 
@@ -659,8 +739,9 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
         bytes: ASCII table.
 
     """
-    if not _use_astropy:
-        use_astropy = False
+    if use_astropy:
+        apy_ascii, apy_Table = get_astropy()
+        use_astropy = (apy_ascii is not None)
     dtype = cformat2nptype(fmt_str)
     if len(dtype) == 0:
         dtype = np.dtype([('f0', dtype)])
@@ -679,9 +760,13 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
     else:
         fd = sio.BytesIO()
         fmt_str = tools.str2bytes(fmt_str)
-        for ele in arr1:
-            line = format_message(ele.tolist(), fmt_str)
-            fd.write(line)
+        lines = format_table_rows(arr1, fmt_str)
+        if lines is not None:
+            fd.write(b''.join(lines))
+        else:
+            for ele in arr1:
+                line = format_message(ele.tolist(), fmt_str)
+                fd.write(line)
         # fmt = fmt_str.split(info['newline'])[0]
         # np.savetxt(fd, arr1,
         #            fmt=fmt, delimiter=info['delimiter'],
@@ -716,14 +801,18 @@ def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
         np.ndarray: Table contents as an array.
     
     """
-    if not _use_astropy:
-        use_astropy = False
+    if use_astropy:
+        apy_ascii, apy_Table = get_astropy()
+        use_astropy = (apy_ascii is not None)
     if fmt_str is None:
         dtype = None
         info = dict(delimiter=delimiter, comment=comment)
     else:
-        dtype = cformat2nptype(fmt_str, names=names)
-        info = format2table(fmt_str)
+        key = (fmt_str, None if names is None else tuple(names))
+        if key not in _table_format_cache:
+            _table_format_cache[key] = (cformat2nptype(fmt_str, names=names),
+                                        format2table(fmt_str))
+        dtype, info = _table_format_cache[key]
         names = dtype.names
     fd = sio.BytesIO(msg)
     if names is not None:
@@ -775,17 +864,53 @@ def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
         if dtype is not None:
             arr = arr.astype(dtype)
     else:
-        np_ver = tuple([float(x) for x in (np.__version__).split('.')])
-        np_kws.update(autostrip=True, dtype=None, names=names)
-        if (np_ver >= (1.0, 14.0, 0.0)):
-            np_kws['encoding'] = 'bytes'
-        arr = np.genfromtxt(fd, **np_kws)
-        if dtype is not None:
-            arr = arr.astype(dtype)
+        arr = None
+        if (dtype is not None) and (dtype.names is not None):
+            arr = table_to_array_fixed(fd, dtype, **np_kws)
+        if arr is None:
+            np_ver = tuple([float(x) for x in (np.__version__).split('.')])
+            np_kws.update(autostrip=True, dtype=None, names=names)
+            if (np_ver >= (1.0, 14.0, 0.0)):
+                np_kws['encoding'] = 'bytes'
+            arr = np.genfromtxt(fd, **np_kws)
+            if dtype is not None:
+                arr = arr.astype(dtype)
     fd.close()
     return arr
 
 
+def table_to_array_fixed(fd, dtype, delimiter=None, comments='#'):
+    r"""Parse all of the rows in an ASCII table at once into an array with
+    a known data type.
+
+    Args:
+        fd (file): File-like object containing the table.
+        dtype (np.dtype): Structured data type of the table rows.
+        delimiter (str, optional): String used to separate columns. Defaults
+            to None and any whitespace is used.
+        comments (str, optional): String used to denote comments. Defaults
+            to '#'.
+
+    Returns:
+        np.ndarray: Table contents as an array. None if the table could not
+            be parsed with the provided data type, in which case the file is
+            rewound.
+
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            arr = np.loadtxt(fd, dtype=dtype, delimiter=delimiter,
+                             comments=comments, encoding='bytes')
+    except ValueError:
+        fd.seek(0)
+        return None
+    for k in dtype.names:
+        if dtype[k].kind == 'S':
+            arr[k] = np.char.strip(arr[k])
+    return arr
+
+
 def array_to_bytes(arrs, dtype=None, order='C'):
     r"""Serialize an array to bytes.
 
@@ -1244,6 +1369,7 @@ def numpy2pandas(arr):
         pandas.DataFrame: Pandas data frame with contents from the input array.
 
     """
+    import pandas
     if not isinstance(arr, np.ndarray):
         raise TypeError("arr must be a numpy array, not %s." % type(arr))
     out = pandas.DataFrame(arr)
@@ -1262,6 +1388,7 @@ def pandas2numpy(frame, index=False):
         np.ndarray: Structured numpy array.
 
     """
+    import pandas
     if not isinstance(frame, pandas.DataFrame):
         raise TypeError("frame must be a pandas data frame, not %s." % type(frame))
     arr = frame.to_records(index=index)
@@ -1317,6 +1444,7 @@ def pandas2dict(frame):
         dict: Dictionary with contents from the input frame.
 
     """
+    import pandas
     if not isinstance(frame, pandas.DataFrame):
         raise TypeError("frame must be a pandas data frame, not %s." % type(frame))
     return numpy2dict(pandas2numpy(frame))
@@ -1334,6 +1462,7 @@ def list2pandas(arrays, names=None):
         pandas.DataFrame: Pandas data frame with contents from the input list.
 
     """
+    import pandas
     out = numpy2pandas(list2numpy(arrays, names=names))
     if names is None:
         out.columns = pandas.RangeIndex(len(arrays))
@@ -43,6 +43,23 @@ class TestAsciiTableSerialize(parent.TestDefaultSerialize):
         field_units = self.testing_options.get('field_units', None)
         self.assert_equal(self.instance.field_units, field_units)
 
+    def test_func_serialize_batch(self):
+        r"""Test serializing a batch of messages at once."""
+        objects = self.testing_options['objects']
+        if not self.instance.initialized:
+            self.instance.serialize(objects[0], no_metadata=True)
+        self.assert_equal(self.instance.func_serialize_batch(objects),
+                          [self.instance.func_serialize(x) for x in objects])
+
+    def test_get_chunk_end(self):
+        r"""Test get_chunk_end for a message with a partial row."""
+        self.assert_equal(self.instance.get_chunk_end(b'1\t2\n3\t4\n5'), 8)
+        self.assert_equal(self.instance.get_chunk_end(b'1\t2'), 0)
+        state = {}
+        self.assert_equal(self.instance.get_chunk_end(b'1\t2', state=state), 0)
+        self.assert_equal(self.instance.get_chunk_end(b'1\t2\n3', state=state),
+                          4)
+
 
 class TestAsciiTableSerializeSingle(parent.TestDefaultSerialize):
     r"""Test class for AsciiTableSerialize class."""
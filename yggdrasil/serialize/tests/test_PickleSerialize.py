@@ -1,3 +1,4 @@
+import pickle
 from yggdrasil.serialize.tests import test_SerializeBase as parent
 
 
@@ -9,3 +10,28 @@ class TestPickleSerialize(parent.TestSerializeBase):
     def test_get_first_frame(self):
         r"""Test get_first_frame for empty message."""
         self.assert_equal(self.import_cls.get_first_frame(b'not a pickle'), b'')
+
+    def test_get_chunk_end(self):
+        r"""Test get_chunk_end for a message with a partial frame."""
+        frame = self.instance.func_serialize({'a': 1})
+        msg = frame + frame + frame[:-1]
+        self.assert_equal(self.instance.get_chunk_end(msg), 2 * len(frame))
+        self.assert_equal(self.instance.get_chunk_end(frame[:-1]), 0)
+
+    def test_get_chunk_end_growth(self):
+        r"""Test get_chunk_end resuming the scan as a chunk grows for
+        frames with large data written outside of pickle frames."""
+        frames = [pickle.dumps(x, protocol=pickle.HIGHEST_PROTOCOL)
+                  for x in [list(range(50000)), b'x' * 100000, {'a': 1}]]
+        msg = b''.join(frames)
+        nprev = 0
+        for i in range(len(frames)):
+            nframe = nprev + len(frames[i])
+            state = {}
+            for n in range(nprev + 5, nframe, 10000):
+                self.assert_equal(self.instance.get_chunk_end(
+                    memoryview(msg)[:n], state=state), nprev)
+            assert(state['pos'] > state['end'])
+            self.assert_equal(self.instance.get_chunk_end(
+                msg[:nframe], state=state), nframe)
+            nprev = nframe
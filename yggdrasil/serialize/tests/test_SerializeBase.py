@@ -139,6 +139,25 @@ class TestSerializeBase(YggTestClassInfo):
             self.assert_result_equal(iout, iobj)
             # self.assert_equal(ihead, self._header_info)
         
+    def test_serialize_header_datatype(self):
+        r"""Test that changes to the datatype in a received header either
+        raise an error or do not affect later messages."""
+        if (self._cls == 'SerializeBase'):
+            return
+        iobj = self.testing_options['objects'][0]
+        msg = self.instance.serialize(iobj)
+        iout, ihead = self.instance.deserialize(msg)
+        if 'datatype' not in ihead:
+            return
+        try:
+            ihead['datatype']['test_property'] = 'changed'
+        except TypeError:
+            # Shared datatypes cannot be modified, but copies can
+            datatype = copy.deepcopy(ihead['datatype'])
+            datatype['test_property'] = 'changed'
+        iout, ihead = self.instance.deserialize(msg)
+        assert('test_property' not in ihead['datatype'])
+
     def test_serialize_eof(self):
         r"""Test serialize/deserialize EOF."""
         if (self._cls == 'SerializeBase'):
@@ -1,4 +1,5 @@
 import numpy as np
+import io as sio
 from yggdrasil import serialize, platform
 from yggdrasil.tests import assert_raises, assert_equal
 
@@ -189,6 +190,18 @@ def test_format_message():
     assert_raises(ValueError, serialize.process_message, b'hello', "%d")
 
 
+def test_compile_row_format():
+    r"""Test caching of the information used to parse table rows."""
+    fmt = b'%5s\t%ld\t%lf\n'
+    out = serialize.compile_row_format(fmt)
+    assert(serialize.compile_row_format(fmt) is out)
+    assert_equal(out[0], 3)
+    assert_equal(out[1], '%s\t%ld\t%lf\n')
+    assert_equal(out[2], [np.dtype('S5'), np.dtype('int_'),
+                          np.dtype('float64')])
+    assert_equal(serialize.compile_row_format('%d')[2], None)
+
+
 def test_combine_flds():
     r"""Test combine_flds."""
     names0 = ['f0', 'f1', 'f2', 'f3']
@@ -385,6 +398,36 @@ def test_array_to_table():
             np.testing.assert_array_equal(arr1, arr0)
 
 
+def test_table_to_array_fixed():
+    r"""Test parsing all of the rows in a table at once."""
+    fmt = b'%5s\t%ld\t%lf\n'
+    dtype = serialize.cformat2nptype(fmt)
+    tab = b'# %5s\t%ld\t%lf\n  abc\t1\t2.5\n    d\t2\t3.5\n'
+    arr = serialize.table_to_array_fixed(sio.BytesIO(tab), dtype,
+                                         delimiter='\t')
+    np.testing.assert_array_equal(
+        arr, np.array([(b'abc', 1, 2.5), (b'd', 2, 3.5)], dtype=dtype))
+    # Tables that cannot be parsed with the data type are rewound
+    fd = sio.BytesIO(b'1  2  3.0\n')
+    assert_equal(serialize.table_to_array_fixed(fd, dtype, delimiter=' '),
+                 None)
+    assert_equal(fd.tell(), 0)
+    fd.close()
+
+
+def test_format_table_rows():
+    r"""Test formatting the rows in an array one column at a time."""
+    for f in [b'%5s\t%ld\t%lf\t%g%+gj\n', '%5s\t%ld\t%lf\t%g%+gj\n']:
+        dtype = serialize.cformat2nptype(f)
+        arr = np.ones(3, dtype)
+        arr['f0'][0] = b'hello'
+        arr['f3'][1] = 1.5 - 2j
+        assert_equal(serialize.format_table_rows(arr, f),
+                     [serialize.format_message(x.tolist(), f) for x in arr])
+    assert_equal(serialize.format_table_rows(np.ones(3), b'%d\n'), None)
+    assert_equal(serialize.format_table_rows(arr, b'%d\n'), None)
+
+
 def test_array_to_bytes():
     r"""Test conversion of arrays to bytes and back."""
     names0 = ['f0', 'f1', 'f2', 'f3']
@@ -1,6 +1,9 @@
 """Testing things."""
 import os
+import sys
 import shutil
+import atexit
+import tempfile
 import uuid
 import difflib
 import importlib
@@ -22,6 +25,13 @@ from yggdrasil.communication import cleanup_comms
 from yggdrasil.components import import_component
 
 
+# Cache the schema and normalized YAMLs in a temporary directory so that
+# the tests don't add files to the user's cache
+_cache_dir = tempfile.mkdtemp(prefix='ygg_test_cache_')
+os.environ['YGG_CACHE_DIR'] = _cache_dir
+atexit.register(shutil.rmtree, _cache_dir, ignore_errors=True)
+
+
 # Test data
 data_dir = os.path.join(os.path.dirname(__file__), 'data')
 data_list = [
@@ -179,8 +189,9 @@ def pprint_diff(x, y):  # pragma: no cover
 class WrappedTestCase(unittest.TestCase):  # pragma: no cover
     def __init__(self, *args, **kwargs):
         super(WrappedTestCase, self).__init__(*args, **kwargs)
-        self.addTypeEqualityFunc(units._unit_quantity, 'assertUnitsEqual')
-        self.addTypeEqualityFunc(units._unit_array, 'assertUnitsEqual')
+        unyt = units.get_unyt()
+        self.addTypeEqualityFunc(unyt.unyt_quantity, 'assertUnitsEqual')
+        self.addTypeEqualityFunc(unyt.unyt_array, 'assertUnitsEqual')
         self.addTypeEqualityFunc(np.ndarray, 'assertArrayEqual')
         self.addTypeEqualityFunc(pd.DataFrame, 'assertArrayEqual')
         self.addTypeEqualityFunc(types.FunctionType, 'assertFunctionEqual')
@@ -562,8 +573,15 @@ class YggTestBase(unittest.TestCase):
 
     @property
     def thread_count(self):
-        r"""int: The number of active threads."""
-        return threading.active_count()
+        r"""int: The number of active threads. The garbage collector thread
+        that pyzmq starts to release buffers sent without copying is not
+        counted as it belongs to the zmq module (not a comm) and persists
+        until the process exits."""
+        out = threading.active_count()
+        zmq_gc = getattr(sys.modules.get('zmq.utils.garbage', None), 'gc', None)
+        if (getattr(zmq_gc, 'thread', None) is not None) and zmq_gc.thread.is_alive():
+            out -= 1
+        return out
 
     def set_utf8_encoding(self):
         r"""Set the encoding to utf-8 if it is not already."""
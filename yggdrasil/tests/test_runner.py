@@ -34,6 +34,40 @@ def test_run_process_connections():
                namespace=namespace)
 
 
+@unittest.skipIf(not tools.is_lang_installed('c'), "C not installed")
+def test_run_compile_nproc():
+    r"""Test run with compiled models built in parallel."""
+    namespace = "test_run_%s" % str(uuid.uuid4())
+    cr = runner.get_runner(ex_yamls['rpcFib']['c'],
+                           compile_nproc=2, namespace=namespace)
+    cr.run()
+    assert(not cr.error_flag)
+
+
+def test_compileModels_deferred():
+    r"""Test that only models with deferred compilation are compiled."""
+
+    class DummyModel(object):
+
+        def __init__(self):
+            self.compiled = False
+
+        def get_build_tasks(self, tasks=None):
+            self.compiled = True
+
+    namespace = "test_run_%s" % str(uuid.uuid4())
+    cr = runner.get_runner([ex_yamls['hello']['python']],
+                           namespace=namespace)
+    cr.modeldrivers = {
+        'deferred': {'skip_compile': True, '_deferred_compile': True,
+                     'instance': DummyModel()},
+        'user_skip': {'skip_compile': True, '_deferred_compile': False,
+                      'instance': DummyModel()}}
+    cr.compileModels()
+    assert(cr.modeldrivers['deferred']['instance'].compiled)
+    assert(not cr.modeldrivers['user_skip']['instance'].compiled)
+
+
 # def test_runner_error():
 #     r"""Start a runner for a model with an error."""
 #     cr = runner.get_runner([sc_yamls['error']])
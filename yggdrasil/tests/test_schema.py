@@ -1,5 +1,7 @@
 import os
 import pprint
+import time
+import shutil
 import tempfile
 from jsonschema import ValidationError
 from yggdrasil import schema, components
@@ -122,6 +124,62 @@ def test_create_schema():
     os.remove(fname)
 
 
+def test_cache():
+    r"""Test caching of the loaded schema."""
+    cache_dir = os.path.join(tempfile.gettempdir(), 'test_schema_cache')
+    old_env = os.environ.get('YGG_CACHE_DIR', None)
+    try:
+        os.environ['YGG_CACHE_DIR'] = 'False'
+        assert_equal(schema.get_cache_dir(), None)
+        assert_equal(schema.get_cache_file('test', 'a'), None)
+        schema.write_cache(None, {'a': 1})
+        assert_equal(schema.read_cache(None), None)
+        os.environ['YGG_CACHE_DIR'] = cache_dir
+        fname = schema.get_cache_file('test', 'a', b'b')
+        assert(fname.startswith(cache_dir))
+        assert(fname != schema.get_cache_file('test', 'a', b'c'))
+        assert_equal(schema.read_cache(fname), None)
+        schema.write_cache(fname, {'a': 1})
+        assert_equal(schema.read_cache(fname), {'a': 1})
+        # Load schema twice to use cache
+        s0 = schema.load_schema()
+        assert(s0.source_hash is not None)
+        assert(os.path.isfile(schema.get_cache_file('schema', s0.source_hash)))
+        s1 = schema.load_schema()
+        assert_equal(s1, s0)
+    finally:
+        if old_env is None:
+            del os.environ['YGG_CACHE_DIR']
+        else:  # pragma: debug
+            os.environ['YGG_CACHE_DIR'] = old_env
+        if os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir)
+
+
+def test_prune_cache():
+    r"""Test pruning of old cache files."""
+    cache_dir = tempfile.mkdtemp()
+    try:
+        t0 = time.time() - 100
+        fnames = []
+        for i in range(4):
+            fname = os.path.join(cache_dir, 'test_%d.pkl' % i)
+            schema.write_cache(fname, i)
+            os.utime(fname, (t0 + 10 * i, t0 + 10 * i))
+            fnames.append(fname)
+        # Reading a file marks it as used
+        assert_equal(schema.read_cache(fnames[0]), 0)
+        assert(os.path.getmtime(fnames[0]) > os.path.getmtime(fnames[3]))
+        schema.prune_cache(cache_dir, max_files=3)
+        assert_equal([os.path.isfile(x) for x in fnames],
+                     [True, False, True, True])
+        schema.prune_cache(cache_dir, max_age=75)
+        assert_equal([os.path.isfile(x) for x in fnames],
+                     [True, False, False, True])
+    finally:
+        shutil.rmtree(cache_dir)
+
+
 def test_cdriver2filetype_error():
     r"""Test errors in cdriver2filetype."""
     assert_raises(ValueError, schema.cdriver2filetype, 'invalid')
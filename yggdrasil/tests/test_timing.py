@@ -51,6 +51,34 @@ def test_platform_error():
     assert_raises(RuntimeError, x.can_run, raise_error=True)
 
 
+def test_time_multipart_messages():
+    r"""Test timing of messages sent in multiple parts."""
+    x = timing.time_multipart_messages(sizes=[1000, 10000], nrep=1)
+    assert(len(x) == 2)
+    assert((x['execution_time'] > 0).all())
+
+
+def test_time_recv_latency():
+    r"""Test timing of the latency of messages forwarded by a relay."""
+    x = timing.time_recv_latency(nmsg=5, nrep=1)
+    assert(len(x) == 2)
+    assert((x['latency'] > 0).all())
+
+
+def test_time_header_cache():
+    r"""Test timing of deserializing messages with cached headers."""
+    x = timing.time_header_cache(nmsg=5, nfield=2, nrep=1)
+    assert(len(x) == 2)
+    assert((x['time_per_message'] > 0).all())
+
+
+def test_time_confirm_window():
+    r"""Test timing of ZeroMQ messages with different confirmation windows."""
+    x = timing.time_confirm_window(windows=[1, 10], nmsg=20, nrep=1)
+    assert(len(x) == 2)
+    assert((x['messages_per_second'] > 0).all())
+
+
 class TimedRunTestBase(YggTestClass):
     r"""Base test class for the TimedRun class."""
 
@@ -32,6 +32,26 @@ def make_temp_multiple():
     return make_temp('multiple_test_file', count=2)
 
 
+def test_DeferredClassMeta():
+    r"""Test DeferredClassMeta."""
+    from collections import OrderedDict
+
+    class DeferredOrderedDict(metaclass=tools.DeferredClassMeta):
+        deferred_module = 'collections'
+        deferred_class = 'OrderedDict'
+
+    class DeferredMissing(metaclass=tools.DeferredClassMeta):
+        deferred_module = 'yggdrasil_missing_module'
+        deferred_class = 'Missing'
+
+    assert(isinstance(OrderedDict(), DeferredOrderedDict))
+    assert(not isinstance({}, DeferredOrderedDict))
+    assert(issubclass(OrderedDict, DeferredOrderedDict))
+    assert(not isinstance(OrderedDict(), DeferredMissing))
+    assert(not issubclass(OrderedDict, DeferredMissing))
+    assert(not isinstance(1, tools.DeferredDataFrame))
+
+
 def test_bytes2str():
     r"""Test bytes2str."""
     vals = [(b'hello', 'hello'),
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from yggdrasil.tests import YggTestBase
 from yggdrasil import units, tools
 
@@ -105,3 +106,32 @@ class TestUnits(YggTestBase):
             self.assert_equal(units.convert_R_unit_string(x), y)
             self.assert_equal(units.convert_R_unit_string(y), y)
             units.add_units(1.0, x)
+
+    def test_get_conversion_factors(self):
+        r"""Test get_conversion_factors."""
+        self.assert_equal(units.get_conversion_factors('cm', 'm'), (0.01, 0.0))
+        self.assert_equal(units.get_conversion_factors('', 'm'), (1.0, 0.0))
+        self.assert_equal(units.get_conversion_factors('degC', 'K'),
+                          (1.0, -273.15))
+        assert(('cm', 'm') in units._conversion_factors)
+        self.assert_raises(ValueError, units.get_conversion_factors,
+                           'cm', 's')
+
+    def test_get_conversion_function(self):
+        r"""Test get_conversion_function."""
+        pairs = [('cm', 'm'), ('degC', 'K'), ('K', 'degF'), ('day', 'hr'),
+                 ('', 'm'), ('m', '')]
+        x = np.arange(5, dtype='float64')
+        for old, new in pairs:
+            f = units.get_conversion_function(old, new)
+            expected = np.array([units.get_data(units.convert_to(
+                units.add_units(v, old), new)) for v in x])
+            np.testing.assert_allclose(f(x), expected)
+            np.testing.assert_allclose(f(pd.Series(x)).values, expected)
+            np.testing.assert_allclose(f(x[1]), expected[1])
+            if old:
+                np.testing.assert_allclose(f(units.add_units(x, old)),
+                                           expected)
+        self.assert_equal(units.get_conversion_function('', 'm')(x), x)
+        f = units.get_conversion_function('cm', 's')
+        self.assert_raises(ValueError, f, x)
@@ -1,5 +1,6 @@
 import tempfile
 import os
+import shutil
 import yaml
 import flaky
 import io as sio
@@ -58,6 +59,36 @@ def test_parse_component_error():
                   {}, 'invalid', 'invalid')
 
 
+def test_normalize_yaml_cache():
+    r"""Test caching of normalized yamls."""
+    cache_dir = os.path.join(tempfile.gettempdir(), 'test_yaml_cache')
+    old_env = os.environ.get('YGG_CACHE_DIR', None)
+    yml = {'models': [{'name': 'modelA', 'language': 'python',
+                       'args': './src/modelA.py',
+                       'working_dir': os.getcwd()}],
+           'connections': []}
+    try:
+        os.environ['YGG_CACHE_DIR'] = cache_dir
+        out1 = yamlfile.normalize_yaml(yml)
+        cached = [x for x in os.listdir(cache_dir) if x.startswith('yaml_')]
+        assert_equal(len(cached), 1)
+        out2 = yamlfile.normalize_yaml(yml)
+        assert_equal(out2, out1)
+        assert(out2 is not out1)
+        # Python objects are not cached
+        yml['models'][0]['function'] = direct_translate
+        yamlfile.normalize_yaml(yml)
+        cached = [x for x in os.listdir(cache_dir) if x.startswith('yaml_')]
+        assert_equal(len(cached), 1)
+    finally:
+        if old_env is None:
+            del os.environ['YGG_CACHE_DIR']
+        else:  # pragma: debug
+            os.environ['YGG_CACHE_DIR'] = old_env
+        if os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir)
+
+
 @flaky.flaky(max_runs=3)
 def test_load_yaml_git():
     r"""Test loading a yaml from a remote git repository."""
@@ -7,6 +7,7 @@ import yaml
 import uuid
 import pyperf
 import subprocess
+import threading
 import warnings
 import tempfile
 import itertools
@@ -1373,3 +1374,274 @@ def pyperfjson_to_pandas(json_file):
                     data[mk].append(mv)
     x_pd = pd.DataFrame(data)
     return x_pd
+
+
+def time_multipart_messages(sizes=None, comm_type=None, nrep=3,
+                            timeout=60.0):
+    r"""Time sending and receiving single messages that are larger than
+    the maximum message size of a communication mechanism and must be
+    split into multiple parts. If reassembly of the parts is linear in the
+    number of parts, the time per byte should be roughly constant as the
+    message size increases.
+
+    Args:
+        sizes (list, optional): Sizes of the messages (in bytes) that
+            should be timed. Defaults to 5 sizes logarithmically spaced
+            between 10 and 1000 times the maximum message size for the
+            communication mechanism (or between 1 and 50 MB if there is
+            not a maximum message size).
+        comm_type (str, optional): Communication mechanism that should be
+            timed. Defaults to tools.get_default_comm().
+        nrep (int, optional): Number of times each message should be
+            sent/received. The minimum time is reported. Defaults to 3.
+        timeout (float, optional): Time (in seconds) that should be waited
+            for each message to be received. Defaults to 60.
+
+    Returns:
+        pandas.DataFrame: Message sizes, number of parts each message was
+            split into, the execution time for sending and receiving each
+            message, and the time per byte.
+
+    """
+    from yggdrasil.communication import new_comm
+    if comm_type is None:
+        comm_type = tools.get_default_comm()
+    name = 'timing_multipart_%s' % str(uuid.uuid4())
+    send_comm = new_comm(name, comm=comm_type, direction='send',
+                         reverse_names=True)
+    recv_comm = new_comm(name, **send_comm.opp_comm_kwargs())
+    if sizes is None:
+        if send_comm.maxMsgSize > 0:
+            sizes = send_comm.maxMsgSize * np.logspace(1, 3, 5)
+        else:
+            sizes = np.logspace(6, np.log10(5e7), 5)
+    data = {'message_size': [], 'chunk_count': [], 'execution_time': [],
+            'time_per_byte': []}
+    try:
+        for size in sizes:
+            msg = b'0' * int(size)
+            times = []
+            for _ in range(nrep):
+                t0 = time.perf_counter()
+                assert(send_comm.send(msg))
+                flag, msg_recv = recv_comm.recv(timeout=timeout)
+                t1 = time.perf_counter()
+                assert(flag and (len(msg_recv) == len(msg)))
+                times.append(t1 - t0)
+            if send_comm.maxMsgSize > 0:
+                nchunk = int(np.ceil(len(msg) / send_comm.maxMsgSize))
+            else:
+                nchunk = 1
+            data['message_size'].append(len(msg))
+            data['chunk_count'].append(nchunk)
+            data['execution_time'].append(min(times))
+            data['time_per_byte'].append(min(times) / len(msg))
+    finally:
+        send_comm.close()
+        recv_comm.close()
+    return pd.DataFrame(data)
+
+
+def time_recv_latency(nmsg=100, msg_size=10, comm_type=None, nrep=3,
+                      timeout=60.0):
+    r"""Time the round trip of small messages forwarded by a relay thread
+    that either sleeps between checks for messages (the behavior of loops
+    before comms could be waited on) or waits to be notified that a message
+    is available via CommBase.wait_for_recv (the behavior of
+    ConnectionDriver.run_loop). The latency per message should be lower
+    when the relay is notified.
+
+    Args:
+        nmsg (int, optional): Number of messages that should be sent for
+            each run. Defaults to 100.
+        msg_size (int, optional): Size of each message (in bytes).
+            Defaults to 10.
+        comm_type (str, optional): Communication mechanism that should be
+            timed. Defaults to tools.get_default_comm().
+        nrep (int, optional): Number of times the messages should be
+            sent/received for each method. The minimum time is reported.
+            Defaults to 3.
+        timeout (float, optional): Time (in seconds) that should be waited
+            for each message to be received. Defaults to 60.
+
+    Returns:
+        pandas.DataFrame: Method used by the relay to wait for messages
+            ('sleep' or 'notify'), the execution time for all of the round
+            trips, and the latency per message.
+
+    """
+    from yggdrasil.communication import new_comm
+    if comm_type is None:
+        comm_type = tools.get_default_comm()
+    msg = b'0' * int(msg_size)
+
+    def relay(icomm, ocomm, method):
+        for _ in range(nmsg):
+            T = icomm.start_timeout(timeout)
+            if method == 'sleep':
+                while (not T.is_out) and (not icomm.n_msg_recv):
+                    icomm.sleep()
+            else:
+                while (not T.is_out) and (not icomm.wait_for_recv()):
+                    pass
+            icomm.stop_timeout()
+            flag, x = icomm.recv(timeout=timeout)
+            if not (flag and ocomm.send(x)):  # pragma: debug
+                break
+
+    data = {'method': [], 'message_count': [], 'message_size': [],
+            'execution_time': [], 'latency': []}
+    for method in ['sleep', 'notify']:
+        times = []
+        for _ in range(nrep):
+            comms = []
+            try:
+                for _ in range(2):
+                    name = 'timing_latency_%s' % str(uuid.uuid4())
+                    send_comm = new_comm(name, comm=comm_type,
+                                         direction='send',
+                                         reverse_names=True)
+                    comms.append(send_comm)
+                    comms.append(new_comm(name,
+                                          **send_comm.opp_comm_kwargs()))
+                thread = threading.Thread(target=relay,
+                                          args=(comms[1], comms[2], method))
+                thread.start()
+                t0 = time.perf_counter()
+                for _ in range(nmsg):
+                    assert(comms[0].send(msg))
+                    flag, msg_recv = comms[3].recv(timeout=timeout)
+                    assert(flag and (msg_recv == msg))
+                t1 = time.perf_counter()
+                thread.join(timeout)
+                times.append(t1 - t0)
+            finally:
+                for x in comms:
+                    x.close()
+        data['method'].append(method)
+        data['message_count'].append(nmsg)
+        data['message_size'].append(len(msg))
+        data['execution_time'].append(min(times))
+        data['latency'].append(min(times) / nmsg)
+    return pd.DataFrame(data)
+
+
+def time_header_cache(nmsg=1000, nfield=10, nrep=3):
+    r"""Time deserializing messages with the same datatype, either decoding
+    the complete header and checking the datatype for every message (the
+    behavior before headers were cached) or reusing the static header
+    entries and the already checked datatype from the previous message.
+    The time per message should be lower when the header is cached.
+
+    Args:
+        nmsg (int, optional): Number of messages that should be
+            deserialized for each run. Defaults to 1000.
+        nfield (int, optional): Number of table columns in the datatype.
+            Defaults to 10.
+        nrep (int, optional): Number of times the messages should be
+            deserialized for each method. The minimum time is reported.
+            Defaults to 3.
+
+    Returns:
+        pandas.DataFrame: Method used to decode headers ('uncached' or
+            'cached'), the execution time for deserializing all of the
+            messages, and the time per message.
+
+    """
+    from yggdrasil.metaschema.datatypes import get_type_from_def
+    typedef = {'type': 'array',
+               'items': [{'type': '1darray', 'subtype': 'float',
+                          'precision': 64, 'units': 'cm',
+                          'title': 'field%d' % i}
+                         for i in range(nfield)]}
+    obj = [np.ones(3, 'float64') for _ in range(nfield)]
+    msgs = [get_type_from_def(typedef).serialize(obj, request_id=str(i))
+            for i in range(nmsg)]
+    data = {'method': [], 'message_count': [], 'field_count': [],
+            'execution_time': [], 'time_per_message': []}
+    for method in ['uncached', 'cached']:
+        times = []
+        for _ in range(nrep):
+            x = get_type_from_def(typedef)
+            t0 = time.perf_counter()
+            for msg in msgs:
+                if method == 'uncached':
+                    x._header_decode_cache = None
+                    x._header_checked_datatype = None
+                x.deserialize(msg)
+            t1 = time.perf_counter()
+            times.append(t1 - t0)
+        data['method'].append(method)
+        data['message_count'].append(nmsg)
+        data['field_count'].append(nfield)
+        data['execution_time'].append(min(times))
+        data['time_per_message'].append(min(times) / nmsg)
+    return pd.DataFrame(data)
+
+
+def time_confirm_window(windows=None, nmsg=1000, msg_size=10, nrep=3,
+                        timeout=60.0):
+    r"""Time sending many small messages from a thread while receiving
+    them via ZeroMQ sockets with different confirmation windows. When the
+    window is larger than 1, messages are confirmed in batches rather than
+    with a handshake for every message so the message rate should increase
+    with the window.
+
+    Args:
+        windows (list, optional): Confirmation windows that should be
+            timed. Defaults to [1, 10, 100].
+        nmsg (int, optional): Number of messages that should be sent for
+            each run. Defaults to 1000.
+        msg_size (int, optional): Size of each message (in bytes).
+            Defaults to 10.
+        nrep (int, optional): Number of times the messages should be
+            sent/received for each window. The minimum time is reported.
+            Defaults to 3.
+        timeout (float, optional): Time (in seconds) that should be waited
+            for each message to be received. Defaults to 60.
+
+    Returns:
+        pandas.DataFrame: Confirmation windows, the execution time for
+            sending, receiving, and confirming all of the messages, and the
+            number of messages per second.
+
+    """
+    from yggdrasil.communication import new_comm
+    if windows is None:
+        windows = [1, 10, 100]
+    msg = b'0' * int(msg_size)
+
+    def send_messages(send_comm):
+        for _ in range(nmsg):
+            assert(send_comm.send(msg))
+        send_comm.linger_close()
+
+    data = {'confirm_window': [], 'message_count': [], 'message_size': [],
+            'execution_time': [], 'messages_per_second': []}
+    for window in windows:
+        times = []
+        for _ in range(nrep):
+            name = 'timing_confirm_%s' % str(uuid.uuid4())
+            send_comm = new_comm(name, comm='zmq', direction='send',
+                                 reverse_names=True, confirm_window=window)
+            recv_comm = new_comm(name, **send_comm.opp_comm_kwargs())
+            sender = threading.Thread(target=send_messages,
+                                      args=(send_comm,))
+            try:
+                t0 = time.perf_counter()
+                sender.start()
+                for _ in range(nmsg):
+                    flag, msg_recv = recv_comm.recv(timeout=timeout)
+                    assert(flag and (msg_recv == msg))
+                sender.join(timeout)
+                t1 = time.perf_counter()
+                times.append(t1 - t0)
+            finally:
+                send_comm.close()
+                recv_comm.close()
+        data['confirm_window'].append(window)
+        data['message_count'].append(nmsg)
+        data['message_size'].append(len(msg))
+        data['execution_time'].append(min(times))
+        data['messages_per_second'].append(nmsg / min(times))
+    return pd.DataFrame(data)
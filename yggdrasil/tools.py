@@ -7,10 +7,6 @@ import os
 import re
 import sys
 import sysconfig
-try:
-    from distutils import sysconfig as distutils_sysconfig
-except ImportError:  # pragma: debug
-    distutils_sysconfig = None
 import warnings
 import copy
 import shutil
@@ -38,6 +34,46 @@ if ((logging.getLogger("yggdrasil").getEffectiveLevel()
     _stack_in_timeout = True
 
 
+class DeferredClassMeta(type):
+    r"""Meta class for placeholders that check instances against classes
+    from modules that are slow to import without importing the module.
+    Objects cannot be instances of a class before the module defining it has
+    been imported. Placeholder classes should set the attributes
+    deferred_module and deferred_class to the name of the module and the
+    name of the class within the module."""
+
+    def get_deferred_class(cls):
+        r"""Get the deferred class if the module has been imported.
+
+        Returns:
+            type: Deferred class or None if the module has not been
+                imported.
+
+        """
+        mod = sys.modules.get(cls.deferred_module, None)
+        if mod is None:
+            return None
+        return getattr(mod, cls.deferred_class)
+
+    def __instancecheck__(cls, instance):
+        out = cls.get_deferred_class()
+        if out is None:
+            return False
+        return isinstance(instance, out)
+
+    def __subclasscheck__(cls, subclass):
+        out = cls.get_deferred_class()
+        if out is None:
+            return False
+        return issubclass(subclass, out)
+
+
+class DeferredDataFrame(metaclass=DeferredClassMeta):
+    r"""Placeholder for checking for pandas.DataFrame instances."""
+    deferred_module = 'pandas'
+    deferred_class = 'DataFrame'
+
+
 def apply_recurse(x, func, **kwargs):
     r"""Apply a function recursively to all elements of x if it is
     a list, tuple, or dictionary.
@@ -344,6 +380,11 @@ def get_python_c_library(allow_failure=False, libtype=None):
         if paths.get(k, None) and (paths[k] not in dir_try):
             dir_try.append(paths[k])
     dir_try.append(os.path.join(paths['data'], 'lib'))
+    # distutils is imported here as it is slow to import
+    try:
+        from distutils import sysconfig as distutils_sysconfig
+    except ImportError:  # pragma: debug
+        distutils_sysconfig = None
     if distutils_sysconfig is not None:
         dir_try.append(os.path.dirname(
             distutils_sysconfig.get_python_lib(True, True)))
@@ -1443,6 +1484,10 @@ class YggClass(ComponentBase):
                 scheduled task is stored in self.sched_out. Otherwise, it is not
                 stored. Defaults to False.
 
+        Returns:
+            threading.Timer: Timer that will execute the task. It can be
+                used to cancel the task before it is executed.
+
         """
         if args is None:
             args = []
@@ -1454,6 +1499,7 @@ class YggClass(ComponentBase):
             func = self._task_with_output
         tobj = threading.Timer(t, func, args=args, kwargs=kwargs)
         tobj.start()
+        return tobj
 
     def sleep(self, t=None):
         r"""Have the class sleep for some period of time.
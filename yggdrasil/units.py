@@ -1,17 +1,40 @@
 import re
 import numpy as np
-import pandas as pd
-import unyt
 from yggdrasil import tools
-_unit_quantity = unyt.array.unyt_quantity
-_unit_array = unyt.array.unyt_array
 _ureg_unyt = None
+_unit_cache = {}
+_conversion_factors = {}
+
+
+class _unit_quantity(metaclass=tools.DeferredClassMeta):
+    r"""Placeholder for checking for unyt.unyt_quantity instances."""
+    deferred_module = 'unyt'
+    deferred_class = 'unyt_quantity'
+
+
+class _unit_array(metaclass=tools.DeferredClassMeta):
+    r"""Placeholder for checking for unyt.unyt_array instances."""
+    deferred_module = 'unyt'
+    deferred_class = 'unyt_array'
+
+
+def get_unyt():
+    r"""Import unyt. The import is deferred until units are needed as
+    unyt is slow to import.
+
+    Returns:
+        module: unyt module.
+
+    """
+    import unyt
+    return unyt
 
 
 def get_ureg():
     r"""Get the unit registry."""
     global _ureg_unyt
     if _ureg_unyt is None:
+        unyt = get_unyt()
         _ureg_unyt = unyt.UnitRegistry('mks')
         _ureg_unyt.add("ac", 4046.86, dimensions=unyt.dimensions.area,
                        tex_repr=r"\rm{ac}", offset=0.0, prefixable=False)
@@ -54,6 +77,7 @@ def convert_to_pandas_timedelta(x):
                 'min': 'm',
                 'hr': 'h',
                 'day': 'D'}
+    import pandas as pd
     return pd.Timedelta(t_data, unit=unit_map[t_unit])
 
 
@@ -235,10 +259,10 @@ def add_units(arr, unit_str, dtype=None):
         unyt.unyt_array: Array with units.
 
     """
-    ureg = get_ureg()
     unit_str = tools.bytes2str(unit_str)
     if is_null_unit(unit_str):
         return arr
+    ureg = get_ureg()
     unit_str = convert_unit_string(unit_str)
     if has_units(arr):
         return convert_to(arr, unit_str)
@@ -247,6 +271,7 @@ def add_units(arr, unit_str, dtype=None):
             dtype = arr.dtype
         else:
             dtype = np.array([arr]).dtype
+    unyt = get_unyt()
     try:
         if isinstance(arr, np.ndarray) and (arr.ndim > 0):
             out = unyt.unyt_array(arr, unit_str, dtype=dtype,
@@ -312,10 +337,15 @@ def as_unit(ustr):
         ValueError: If the string is not a recognized unit.
 
     """
+    if isinstance(ustr, str) and (ustr in _unit_cache):
+        return _unit_cache[ustr]
+    unyt = get_unyt()
     try:
         out = unyt.Unit(ustr, registry=get_ureg())
     except unyt.exceptions.UnitParseError as e:
         raise ValueError(str(e))
+    if isinstance(ustr, str):
+        _unit_cache[ustr] = out
     return out
 
 
@@ -356,6 +386,7 @@ def convert_to(arr, new_units):
         return arr
     if not has_units(arr):
         return add_units(arr, new_units)
+    unyt = get_unyt()
     try:
         out = arr.to(new_units)
     except unyt.exceptions.UnitConversionError as e:
@@ -363,9 +394,44 @@ def convert_to(arr, new_units):
     return out
 
 
+def get_conversion_factors(old_units, new_units):
+    r"""Get the scale and offset required to convert values from one unit
+    to another such that new = scale * old - offset. Factors are cached
+    for each pair of unit strings so that units are only parsed once.
+
+    Args:
+        old_units (str): Units to convert from.
+        new_units (str): Units to convert to.
+
+    Returns:
+        tuple (float, float): Scale and offset.
+
+    Raises:
+        ValueError: If the units are not compatible.
+
+    """
+    key = (old_units, new_units)
+    if key not in _conversion_factors:
+        if is_null_unit(old_units) or is_null_unit(new_units):
+            out = (1.0, 0.0)
+        else:
+            uold = as_unit(convert_unit_string(tools.bytes2str(old_units)))
+            unew = as_unit(new_units)
+            unyt = get_unyt()
+            try:
+                scale, offset = uold.get_conversion_factor(unew)
+            except unyt.exceptions.UnitConversionError as e:
+                raise ValueError(str(e))
+            out = (scale, offset or 0.0)
+        _conversion_factors[key] = out
+    return _conversion_factors[key]
+
+
 def get_conversion_function(old_units, new_units):
     r"""Get a function that will convert a scalar/array from one unit
-    to another.
+    to another. The returned function operates on entire arrays and
+    pandas Series at once using the cached conversion factors so it
+    should be called on whole columns rather than applied element-wise.
 
     Args:
         old_units (str): Units to convert from.
@@ -377,6 +443,15 @@ def get_conversion_function(old_units, new_units):
 
     """
     def fconvert(x):
-        ux = add_units(x, old_units)
-        return get_data(convert_to(ux, new_units))
+        if has_units(x):
+            return get_data(convert_to(x, new_units))
+        scale, offset = get_conversion_factors(old_units, new_units)
+        if (scale == 1.0) and (offset == 0.0):
+            return x
+        if isinstance(x, (list, tuple)):
+            x = np.asarray(x)
+        out = x * scale
+        if offset:
+            out = out - offset
+        return out
     return fconvert
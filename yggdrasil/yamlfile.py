@@ -6,7 +6,8 @@ import yaml
 import json
 import git
 import io as sio
-from yggdrasil.schema import standardize, get_schema
+from yggdrasil.schema import (
+    standardize, get_schema, get_cache_file, read_cache, write_cache)
 from urllib.parse import urlparse
 from yaml.constructor import (
     ConstructorError, BaseConstructor, Constructor, SafeConstructor)
@@ -159,6 +160,34 @@ def prep_yaml(files):
     return yml_all
 
 
+def normalize_yaml(yml):
+    r"""Validate and normalize a prepared YAML using the schema. The result
+    is cached using the contents of the YAML and the schema so that the
+    same YAML only needs to be normalized once.
+
+    Args:
+        yml (dict): YAML prepared by prep_yaml.
+
+    Returns:
+        dict: Normalized YAML.
+
+    """
+    s = get_schema()
+    cache_file = None
+    if s.source_hash is not None:
+        try:
+            contents = json.dumps(yml, sort_keys=True)
+            cache_file = get_cache_file('yaml', s.source_hash, contents)
+        except (TypeError, ValueError):
+            # YAMLs containing Python objects are not cached
+            pass
+    out = read_cache(cache_file)
+    if out is None:
+        out = s.validate(yml, normalize=True)
+        write_cache(cache_file, out)
+    return out
+
+
 def parse_yaml(files):
     r"""Parse list of yaml files.
 
@@ -176,12 +205,11 @@ def parse_yaml(files):
         dict: Dictionary of information parsed from the yamls.
 
     """
-    s = get_schema()
     # Parse files using schema
     yml_prep = prep_yaml(files)
     # print('prepped')
     # pprint.pprint(yml_prep)
-    yml_norm = s.validate(yml_prep, normalize=True)
+    yml_norm = normalize_yaml(yml_prep)
     # print('normalized')
     # pprint.pprint(yml_norm)
     # Determine if any of the models require synchronization